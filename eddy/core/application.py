@@ -45,7 +45,6 @@ from PyQt5 import (
     QtWidgets,
 )
 
-import eddy
 from eddy import (
     APPID,
     APPNAME,
@@ -60,7 +59,6 @@ from eddy import (
 from eddy.core.commandline import CommandLineParser
 from eddy.core.datatypes.collections import DistinctList
 from eddy.core.datatypes.qt import Font
-from eddy.core.datatypes.system import File
 from eddy.core.functions.fsystem import (
     fexists,
     isdir,
@@ -69,9 +67,8 @@ from eddy.core.functions.misc import format_exception
 from eddy.core.functions.path import expandPath
 from eddy.core.functions.signals import connect
 from eddy.core.jvm import (
-    addJVMClasspath,
-    addJVMOptions,
     findJavaHome,
+    setupJavaEnvironment,
 )
 from eddy.core.output import getLogger
 from eddy.core.plugin import PluginManager
@@ -507,6 +504,16 @@ def main():
     #################################
     sys.excepthook = base_except_hook
 
+    #############################################
+    # RUN WITHOUT GUI IF REQUESTED
+    #################################
+
+    options = CommandLineParser()
+    options.parse(sys.argv)
+    if options.command():
+        from eddy.core.headless import main as headless
+        return headless(sys.argv)
+
     #############################################
     # PARSE ARGUMENTS AND CREATE THE APPLICATION
     #################################
@@ -567,33 +574,7 @@ def main():
     # BEGIN ENVIRONMENT SPECIFIC SETUP
     #################################
 
-    os.environ['JAVA_HOME'] = JAVA_HOME or ''
-
-    # ADD THE DIRECTORY CONTAINING JVM.DLL TO THE PATH VARIABLE ON WINDOWS
-    if _WIN32:
-        path = os.getenv('PATH', '')
-        path = path.split(os.pathsep)
-        path.insert(0, os.path.join(os.environ['JAVA_HOME'], 'jre', 'bin'))
-        if platform.architecture()[0] == '32bit':
-            path.insert(0, os.path.join(os.environ['JAVA_HOME'], 'jre', 'bin', 'client'))
-        else:
-            path.insert(0, os.path.join(os.environ['JAVA_HOME'], 'jre', 'bin', 'server'))
-        os.environ['PATH'] = os.pathsep.join(path)
-
-    # SET CLASSPATH AND OPTIONS
-    if hasattr(sys, 'frozen'):
-        resources = expandPath('@resources/lib/')
-        if isdir(resources):
-            for name in os.listdir(resources):
-                path = os.path.join(resources, name)
-                if os.path.isfile(path):
-                    addJVMClasspath(path)
-    else:
-        from pkg_resources import resource_filename, resource_listdir
-        for path in resource_listdir(eddy.core.jvm.__name__, 'lib'):
-            if File.forPath(path) is File.Jar:
-                addJVMClasspath(resource_filename(eddy.core.jvm.__name__, os.path.join('lib', path)))
-    addJVMOptions('-Xmx512m', '-XX:+DisableExplicitGC')
+    setupJavaEnvironment(JAVA_HOME)
 
     #############################################
     # START THE APPLICATION
@@ -47,6 +47,16 @@ class CommandLineParser(QtCore.QCommandLineParser):
     NO_SPLASH = 'no-splash'
     OPEN = 'open'
 
+    # HEADLESS MODE
+    BATCH = 'batch'
+    EXPORT = 'export'
+    VALIDATE = 'validate'
+    DIAGRAMS = 'diagrams'
+    FORMAT = 'format'
+    JOBS = 'jobs'
+    NORMALIZE = 'normalize'
+    OUTPUT = 'output'
+
     def __init__(self):
         """
         Initialize the CommandLineParser.
@@ -64,8 +74,72 @@ class CommandLineParser(QtCore.QCommandLineParser):
                 'Look for a project in the workspace with the given name and open it.',
                 valueName=CommandLineParser.OPEN
             ),
+            QtCore.QCommandLineOption(
+                [CommandLineParser.FORMAT],
+                'Format of the export (owl-functional, owl-manchester, owl-rdf, owl-turtle, csv, graphml, pdf).',
+                valueName=CommandLineParser.FORMAT
+            ),
+            QtCore.QCommandLineOption(
+                [CommandLineParser.DIAGRAMS],
+                'Comma separated list of diagrams to export (default: all the diagrams of the project).',
+                valueName=CommandLineParser.DIAGRAMS
+            ),
+            QtCore.QCommandLineOption(
+                [CommandLineParser.OUTPUT],
+                'Path of the exported file (or directory, when exporting one file per diagram).',
+                valueName=CommandLineParser.OUTPUT
+            ),
+            QtCore.QCommandLineOption(
+                [CommandLineParser.NORMALIZE],
+                'Normalize the exported OWL 2 ontology.'
+            ),
+            QtCore.QCommandLineOption(
+                [CommandLineParser.JOBS],
+                'Number of projects exported in parallel in batch mode (default: number of CPUs).',
+                valueName=CommandLineParser.JOBS
+            ),
         ])
         self.addPositionalArgument('project', 'Path to a project file to open.', '[project]')
         self.setApplicationDescription(textwrap.dedent("""
         {0}, a graphical editor for the specification and visualization of Graphol ontologies.
-        """).format(APPNAME))
+
+        Projects can also be processed without starting the graphical interface:
+          {1} export --format <format> [--diagrams <names>] [--output <path>] <project>
+          {1} validate <project>
+          {1} batch --format <format> [--jobs <count>] [--output <directory>] <directory>
+        """).format(APPNAME, APPNAME.lower()))
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def command(self):
+        """
+        Returns the headless command given on the command line, or None if the application should start normally.
+        :rtype: str
+        """
+        arguments = self.positionalArguments()
+        if arguments and arguments[0] in {CommandLineParser.BATCH, CommandLineParser.EXPORT, CommandLineParser.VALIDATE}:
+            return arguments[0]
+        return None
+
+    def diagrams(self):
+        """
+        Returns the list of diagram names given on the command line (empty if no diagram has been given).
+        :rtype: list
+        """
+        names = []
+        for value in self.values(CommandLineParser.DIAGRAMS):
+            names.extend(filter(None, map(str.strip, value.split(','))))
+        return names
+
+    def jobs(self):
+        """
+        Returns the number of parallel jobs given on the command line, or None if it has not been given or it is not valid.
+        :rtype: int
+        """
+        try:
+            jobs = int(self.value(CommandLineParser.JOBS))
+        except ValueError:
+            return None
+        return jobs if jobs > 0 else None
@@ -62,11 +62,12 @@ class CommandItemsAdd(QtWidgets.QUndoCommand):
         """redo the command"""
         self.diagram.clearSelection()
         # Add all the items to the diagram.
-        for item in self.items:
-            self.diagram.addItem(item)
-            self.diagram.sgnItemAdded.emit(self.diagram, item)
-            item.setSelected(True)
-            item.updateEdgeOrNode(selected=True)
+        with self.diagram.batchUpdate():
+            for item in self.items:
+                self.diagram.addItem(item)
+                self.diagram.sgnItemAdded.emit(self.diagram, item)
+                item.setSelected(True)
+                item.updateEdgeOrNode(selected=True)
         # Emit updated signal.
         self.diagram.sgnUpdated.emit()
 
@@ -74,9 +75,10 @@ class CommandItemsAdd(QtWidgets.QUndoCommand):
         """undo the command"""
         self.diagram.clearSelection()
         # Remove all the items from the diagram.
-        for item in self.items:
-            self.diagram.removeItem(item)
-            self.diagram.sgnItemRemoved.emit(self.diagram, item)
+        with self.diagram.batchUpdate():
+            for item in self.items:
+                self.diagram.removeItem(item)
+                self.diagram.sgnItemRemoved.emit(self.diagram, item)
         # Restore the old selection.
         for item in self.selected:
             item.setSelected(True)
@@ -123,16 +125,17 @@ class CommandItemsRemove(QtWidgets.QUndoCommand):
 
     def redo(self):
         """redo the command"""
-        # Remove the edges.
-        for edge in self.edges:
-            edge.source.removeEdge(edge)
-            edge.target.removeEdge(edge)
-            self.diagram.removeItem(edge)
-            self.diagram.sgnItemRemoved.emit(self.diagram, edge)
-        # Remove the nodes.
-        for node in self.nodes:
-            self.diagram.removeItem(node)
-            self.diagram.sgnItemRemoved.emit(self.diagram, node)
+        with self.diagram.batchUpdate():
+            # Remove the edges.
+            for edge in self.edges:
+                edge.source.removeEdge(edge)
+                edge.target.removeEdge(edge)
+                self.diagram.removeItem(edge)
+                self.diagram.sgnItemRemoved.emit(self.diagram, edge)
+            # Remove the nodes.
+            for node in self.nodes:
+                self.diagram.removeItem(node)
+                self.diagram.sgnItemRemoved.emit(self.diagram, node)
         # Update node inputs.
         for node in self.inputs:
             node.inputs = self.inputs[node]['redo'][:]
@@ -143,16 +146,17 @@ class CommandItemsRemove(QtWidgets.QUndoCommand):
 
     def undo(self):
         """undo the command"""
-        # Add back the nodes.
-        for node in self.nodes:
-            self.diagram.addItem(node)
-            self.diagram.sgnItemAdded.emit(self.diagram, node)
-        # Add back the edges.
-        for edge in self.edges:
-            edge.source.addEdge(edge)
-            edge.target.addEdge(edge)
-            self.diagram.addItem(edge)
-            self.diagram.sgnItemAdded.emit(self.diagram, edge)
+        with self.diagram.batchUpdate():
+            # Add back the nodes.
+            for node in self.nodes:
+                self.diagram.addItem(node)
+                self.diagram.sgnItemAdded.emit(self.diagram, node)
+            # Add back the edges.
+            for edge in self.edges:
+                edge.source.addEdge(edge)
+                edge.target.addEdge(edge)
+                self.diagram.addItem(edge)
+                self.diagram.sgnItemAdded.emit(self.diagram, edge)
         # Update node inputs.
         for node in self.inputs:
             node.inputs = self.inputs[node]['undo'][:]
@@ -188,9 +192,10 @@ class CommandComposeAxiom(QtWidgets.QUndoCommand):
             edge.source.addEdge(edge)
             edge.target.addEdge(edge)
         # Add items to the diagram.
-        for item in self.nodes | self.edges:
-            self.diagram.addItem(item)
-            self.diagram.sgnItemAdded.emit(self.diagram, item)
+        with self.diagram.batchUpdate():
+            for item in self.nodes | self.edges:
+                self.diagram.addItem(item)
+                self.diagram.sgnItemAdded.emit(self.diagram, item)
         # Update edges.
         for edge in self.edges:
             edge.updateEdge()
@@ -200,9 +205,10 @@ class CommandComposeAxiom(QtWidgets.QUndoCommand):
     def undo(self):
         """undo the command"""
         # Remove items from the diagram.
-        for item in self.nodes | self.edges:
-            self.diagram.removeItem(item)
-            self.diagram.sgnItemRemoved.emit(self.diagram, item)
+        with self.diagram.batchUpdate():
+            for item in self.nodes | self.edges:
+                self.diagram.removeItem(item)
+                self.diagram.sgnItemRemoved.emit(self.diagram, item)
         # Remove edge mappings from source and target nodes.
         for edge in self.edges:
             edge.source.removeEdge(edge)
@@ -269,9 +269,13 @@ class CommandEdgeSwap(QtWidgets.QUndoCommand):
                     node.inputs = self.inputs[node]['redo'][:]
             edge.updateEdge()
         # Identify all the endpoints.
+        with self.diagram.batchIdentification():
+            for edge in self.edges:
+                for node in {edge.source, edge.target}:
+                    self.diagram.sgnNodeIdentification.emit(node)
+        # Discard OWL 2 translations depending on the swapped edges.
         for edge in self.edges:
-            for node in {edge.source, edge.target}:
-                self.diagram.sgnNodeIdentification.emit(node)
+            self.diagram.project.doInvalidateConvertedNodes(self.diagram, edge)
         # Emit updated signal.
         self.diagram.sgnUpdated.emit()
 
@@ -286,9 +290,13 @@ class CommandEdgeSwap(QtWidgets.QUndoCommand):
                     node.inputs = self.inputs[node]['undo'][:]
             edge.updateEdge()
         # Identify all the endpoints.
+        with self.diagram.batchIdentification():
+            for edge in self.edges:
+                for node in {edge.source, edge.target}:
+                    self.diagram.sgnNodeIdentification.emit(node)
+        # Discard OWL 2 translations depending on the swapped edges.
         for edge in self.edges:
-            for node in {edge.source, edge.target}:
-                self.diagram.sgnNodeIdentification.emit(node)
+            self.diagram.project.doInvalidateConvertedNodes(self.diagram, edge)
         # Emit updated signal.
         self.diagram.sgnUpdated.emit()
 
@@ -330,56 +338,58 @@ class CommandSwitchSameDifferentEdge(QtWidgets.QUndoCommand):
 
     def redo(self):
         """redo the command"""
-        for edge in self.edges:
-            source = edge['undo'].source
-            target = edge['undo'].target
-
-            # Update source and target node
-            source.removeEdge(edge['undo'])
-            source.addEdge(edge['redo'])
-            source.setAnchor(edge['redo'], source.anchor(edge['undo']))
-            source.anchors.pop(edge['undo'])
-            target.removeEdge(edge['undo'])
-            target.addEdge(edge['redo'])
-            target.setAnchor(edge['redo'], target.anchor(edge['undo']))
-            target.anchors.pop(edge['undo'])
-
-            # Update diagram
-            self.diagram.removeItem(edge['undo'])
-            self.diagram.sgnItemRemoved.emit(self.diagram, edge['undo'])
-            self.diagram.addItem(edge['redo'])
-            self.diagram.sgnItemAdded.emit(self.diagram, edge['redo'])
-
-            # Update edge
-            edge['redo'].anchors.clear()
-            edge['redo'].updateEdge()
-            edge['redo'].setSelected(True)
+        with self.diagram.batchUpdate():
+            for edge in self.edges:
+                source = edge['undo'].source
+                target = edge['undo'].target
+
+                # Update source and target node
+                source.removeEdge(edge['undo'])
+                source.addEdge(edge['redo'])
+                source.setAnchor(edge['redo'], source.anchor(edge['undo']))
+                source.anchors.pop(edge['undo'])
+                target.removeEdge(edge['undo'])
+                target.addEdge(edge['redo'])
+                target.setAnchor(edge['redo'], target.anchor(edge['undo']))
+                target.anchors.pop(edge['undo'])
+
+                # Update diagram
+                self.diagram.removeItem(edge['undo'])
+                self.diagram.sgnItemRemoved.emit(self.diagram, edge['undo'])
+                self.diagram.addItem(edge['redo'])
+                self.diagram.sgnItemAdded.emit(self.diagram, edge['redo'])
+
+                # Update edge
+                edge['redo'].anchors.clear()
+                edge['redo'].updateEdge()
+                edge['redo'].setSelected(True)
         self.diagram.sgnUpdated.emit()
 
     def undo(self):
         """undo the command"""
-        for edge in self.edges:
-            source = edge['redo'].source
-            target = edge['redo'].target
-
-            # Update source and target node
-            source.removeEdge(edge['redo'])
-            source.addEdge(edge['undo'])
-            source.setAnchor(edge['undo'], source.anchor(edge['redo']))
-            source.anchors.pop(edge['redo'])
-            target.removeEdge(edge['redo'])
-            target.addEdge(edge['undo'])
-            target.setAnchor(edge['undo'], target.anchor(edge['redo']))
-            target.anchors.pop(edge['redo'])
-
-            # Update diagram
-            self.diagram.removeItem(edge['redo'])
-            self.diagram.sgnItemRemoved.emit(self.diagram, edge['redo'])
-            self.diagram.addItem(edge['undo'])
-            self.diagram.sgnItemAdded.emit(self.diagram, edge['undo'])
-
-            # Update edge
-            edge['undo'].anchors.clear()
-            edge['undo'].updateEdge()
-            edge['undo'].setSelected(True)
+        with self.diagram.batchUpdate():
+            for edge in self.edges:
+                source = edge['redo'].source
+                target = edge['redo'].target
+
+                # Update source and target node
+                source.removeEdge(edge['redo'])
+                source.addEdge(edge['undo'])
+                source.setAnchor(edge['undo'], source.anchor(edge['redo']))
+                source.anchors.pop(edge['redo'])
+                target.removeEdge(edge['redo'])
+                target.addEdge(edge['undo'])
+                target.setAnchor(edge['undo'], target.anchor(edge['redo']))
+                target.anchors.pop(edge['redo'])
+
+                # Update diagram
+                self.diagram.removeItem(edge['redo'])
+                self.diagram.sgnItemRemoved.emit(self.diagram, edge['redo'])
+                self.diagram.addItem(edge['undo'])
+                self.diagram.sgnItemAdded.emit(self.diagram, edge['undo'])
+
+                # Update edge
+                edge['undo'].anchors.clear()
+                edge['undo'].updateEdge()
+                edge['undo'].setSelected(True)
         self.diagram.sgnUpdated.emit()
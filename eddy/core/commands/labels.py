@@ -188,7 +188,7 @@ class CommandLabelChange(QtWidgets.QUndoCommand):
     def redo(self):
         """redo the command"""
         count = 0
-        for n in self.project.nodes():
+        for n in self.project.select(label=self.data['undo']):
             if n.text() == self.data['undo']:
                 count = count+1
 
@@ -232,7 +232,7 @@ class CommandLabelChange(QtWidgets.QUndoCommand):
     def undo(self):
         """undo the command"""
         count = 0
-        for n in self.project.nodes():
+        for n in self.project.select(label=self.data['redo']):
             if n.text() == self.data['redo']:
                 count = count+1
 
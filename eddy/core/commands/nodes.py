@@ -276,6 +276,8 @@ class CommandNodeSwitchTo(QtWidgets.QUndoCommand):
 
         # Identify the new node.
         self.diagram.sgnNodeIdentification.emit(self.node['redo'])
+        # Discard OWL 2 translations depending on the switched node.
+        self.diagram.project.doInvalidateConvertedNodes(self.diagram, self.node['redo'])
 
         # Clear edge and anchor references from node1.
         self.node['undo'].anchors.clear()
@@ -312,6 +314,8 @@ class CommandNodeSwitchTo(QtWidgets.QUndoCommand):
 
         # Identify the old node.
         self.diagram.sgnNodeIdentification.emit(self.node['undo'])
+        # Discard OWL 2 translations depending on the switched node.
+        self.diagram.project.doInvalidateConvertedNodes(self.diagram, self.node['undo'])
 
         # Clear edge and anchor references from node2.
         self.node['redo'].anchors.clear()
@@ -377,12 +381,14 @@ class CommandNodeChangeInputsOrder(QtWidgets.QUndoCommand):
         """redo the command"""
         self.node.inputs = self.inputs['redo']
         self.node.updateEdges()
+        self.diagram.project.doInvalidateConvertedNodes(self.diagram, self.node)
         self.diagram.sgnUpdated.emit()
 
     def undo(self):
         """redo the command"""
         self.node.inputs = self.inputs['undo']
         self.node.updateEdges()
+        self.diagram.project.doInvalidateConvertedNodes(self.diagram, self.node)
         self.diagram.sgnUpdated.emit()
 
 
@@ -33,6 +33,8 @@
 ##########################################################################
 
 
+from contextlib import contextmanager
+
 from PyQt5 import QtCore
 from PyQt5 import QtWidgets
 
@@ -47,7 +49,7 @@ from eddy.core.datatypes.graphol import Item, Identity
 from eddy.core.datatypes.misc import DiagramMode
 from eddy.core.datatypes.qt import Font
 from eddy.core.functions.graph import bfs
-from eddy.core.functions.misc import snap, partition, first
+from eddy.core.functions.misc import snap, first
 from eddy.core.functions.signals import connect
 from eddy.core.generators import GUID
 from eddy.core.items.common import AbstractItem
@@ -75,6 +77,8 @@ class Diagram(QtWidgets.QGraphicsScene):
     MinFontSize = 8
     MaxFontSize = 40
     SelectionRadius = 4
+    ShapeDetailZoom = 25
+    TextDetailZoom = 40
 
     sgnItemAdded = QtCore.pyqtSignal('QGraphicsScene', 'QGraphicsItem')
     sgnItemInsertionCompleted = QtCore.pyqtSignal('QGraphicsItem', int)
@@ -98,6 +102,13 @@ class Diagram(QtWidgets.QGraphicsScene):
         self.name = name
         self.pasteX = Clipboard.PasteOffsetX
         self.pasteY = Clipboard.PasteOffsetY
+        self.rendering = False
+        self.revision = 0
+        self.stale = False
+
+        self.identificationBatch = 0
+        self.identificationQueue = set()
+        self.neutralComponents = dict()
 
         self.mo_Node = None
         self.mp_Data = None
@@ -110,6 +121,9 @@ class Diagram(QtWidgets.QGraphicsScene):
 
         settings = QtCore.QSettings()
         self.setFont(Font(font=self.font(), pixelSize=settings.value('diagram/fontsize', self.font().pixelSize(), int)))
+        self.setDetailThresholds(
+            settings.value('diagram/lod/shapes', Diagram.ShapeDetailZoom, int),
+            settings.value('diagram/lod/text', Diagram.TextDetailZoom, int))
 
         connect(self.sgnItemAdded, self.onItemAdded)
         connect(self.sgnItemRemoved, self.onItemRemoved)
@@ -580,34 +594,14 @@ class Diagram(QtWidgets.QGraphicsScene):
     @QtCore.pyqtSlot('QGraphicsItem')
     def doNodeIdentification(self, node):
         """
-        Perform node identification.
+        Perform node identification (postponed till the end of the current identification batch, if any).
         :type node: AbstractNode
         """
         if Identity.Neutral in node.identities():
-
-            func = lambda x: Identity.Neutral in x.identities()
-            collection = bfs(source=node, filter_on_visit=func)
-            generators = partition(func, collection)
-            excluded = set()
-            strong = set(generators[1])
-            weak = set(generators[0])
-
-            for node in weak:
-                identification = node.identify()
-                if identification:
-                    strong = set.union(strong, identification[0])
-                    strong = set.difference(strong, identification[1])
-                    excluded = set.union(excluded, identification[2])
-
-            computed = Identity.Neutral
-            identities = set(x.identity() for x in strong)
-            if identities:
-                computed = first(identities)
-                if len(identities) > 1:
-                    computed = Identity.Unknown
-
-            for node in weak - strong - excluded:
-                node.setIdentity(computed)
+            if self.identificationBatch:
+                self.identificationQueue.add(node)
+            else:
+                self.identifyNodes((node,))
 
     @QtCore.pyqtSlot('QGraphicsScene', 'QGraphicsItem')
     def onItemAdded(self, _, item):
@@ -619,6 +613,8 @@ class Diagram(QtWidgets.QGraphicsScene):
         # Send a font change event to the item to update its font
         self.sendEvent(item, QtCore.QEvent(QtCore.QEvent.FontChange))
         if item.isEdge():
+            # Keep track of the NEUTRAL components joined by the new edge.
+            self.mergeNeutralComponents(item.source, item.target)
             # Execute the node identification procedure only if one of the
             # endpoints we are connecting is currently identified as NEUTRAL.
             if (item.source.identity() is Identity.Neutral) ^ (item.target.identity() is Identity.Neutral):
@@ -633,11 +629,17 @@ class Diagram(QtWidgets.QGraphicsScene):
         :type item: AbstractItem
         """
         if item.isEdge():
+            # The edge may split a NEUTRAL component into 2 subgraphs: discard
+            # it so that it gets recomputed the next time it's needed.
+            for node in (item.source, item.target):
+                self.discardNeutralComponent(node)
             # When an edge is removed we may be in the case where
             # the ontology is split into 2 subgraphs, hence we need
             # to run the identification procedure on the 2 subgraphs.
             for node in (item.source, item.target):
                 self.sgnNodeIdentification.emit(node)
+        elif item.isNode():
+            self.discardNeutralComponent(item)
 
     #############################################
     #   INTERFACE
@@ -652,6 +654,31 @@ class Diagram(QtWidgets.QGraphicsScene):
         if item.isNode():
             item.updateNode()
 
+    @contextmanager
+    def batchIdentification(self):
+        """
+        Collect the node identification requests issued within the context and
+        process them on exit, identifying each NEUTRAL component only once.
+        """
+        self.identificationBatch += 1
+        try:
+            yield
+        finally:
+            self.identificationBatch -= 1
+            if not self.identificationBatch:
+                queue = self.identificationQueue
+                self.identificationQueue = set()
+                self.identifyNodes(queue)
+
+    @contextmanager
+    def batchUpdate(self):
+        """
+        Coalesce the notifications of the items added to (or removed from) the diagram within the context
+        (see Project.batchUpdate), and process the node identification requests only once on exit.
+        """
+        with self.project.batchUpdate(), self.batchIdentification():
+            yield
+
     @staticmethod
     def completeMove(moveData, offset=QtCore.QPointF(0, 0)):
         """
@@ -669,6 +696,16 @@ class Diagram(QtWidgets.QGraphicsScene):
             'edges': {x: [p + offset for p in x.breakpoints[:]] for x in moveData['edges']}
         }
 
+    def discardNeutralComponent(self, node):
+        """
+        Discard the cached NEUTRAL component the given node belongs to, if any.
+        :type node: AbstractNode
+        """
+        component = self.neutralComponents.get(node)
+        if component is not None:
+            for member in component:
+                self.neutralComponents.pop(member, None)
+
     def edge(self, eid):
         """
         Returns the edge matching the given id or None if no edge is found.
@@ -680,10 +717,43 @@ class Diagram(QtWidgets.QGraphicsScene):
     def edges(self):
         """
         Returns a collection with all the edges in the diagram.
-        :rtype: set
+        :rtype: frozenset
         """
         return self.project.edges(self)
 
+    def identifyNodes(self, nodes):
+        """
+        Perform node identification on the NEUTRAL components of the given nodes.
+        :type nodes: T <= list|set|tuple
+        """
+        visited = set()
+        for node in nodes:
+
+            if node in visited or Identity.Neutral not in node.identities():
+                continue
+
+            weak = self.neutralComponent(node)
+            visited.update(weak)
+            strong = {n for w in weak for n in (e.other(w) for e in w.edges) if Identity.Neutral not in n.identities()}
+            excluded = set()
+
+            for w in weak:
+                identification = w.identify()
+                if identification:
+                    strong = set.union(strong, identification[0])
+                    strong = set.difference(strong, identification[1])
+                    excluded = set.union(excluded, identification[2])
+
+            computed = Identity.Neutral
+            identities = set(x.identity() for x in strong)
+            if identities:
+                computed = first(identities)
+                if len(identities) > 1:
+                    computed = Identity.Unknown
+
+            for w in weak - strong - excluded:
+                w.setIdentity(computed)
+
     def isEdgeAdd(self):
         """
         Returns True if an edge insertion is currently in progress, False otherwise.
@@ -717,7 +787,7 @@ class Diagram(QtWidgets.QGraphicsScene):
         Returns True if this diagram containts no element, False otherwise.
         :rtype: bool
         """
-        return len(self.project.items(self)) == 0
+        return self.project.isEmpty(self)
 
     def items(self, mixed=None, mode=QtCore.Qt.IntersectsItemShape, **kwargs):
         """
@@ -745,10 +815,46 @@ class Diagram(QtWidgets.QGraphicsScene):
                     x not in kwargs.get('skip', set())
         ], key=lambda i: i.zValue(), reverse=True)
 
+    def mergeNeutralComponents(self, source, target):
+        """
+        Merge the cached NEUTRAL components of the given nodes, which have just been connected.
+        Components which are not cached yet are left to be computed the next time they are needed.
+        :type source: AbstractNode
+        :type target: AbstractNode
+        """
+        if Identity.Neutral in source.identities() and Identity.Neutral in target.identities():
+            c1 = self.neutralComponents.get(source)
+            c2 = self.neutralComponents.get(target)
+            if c1 is None or c2 is None:
+                self.discardNeutralComponent(source)
+                self.discardNeutralComponent(target)
+            elif c1 is not c2:
+                if len(c1) < len(c2):
+                    c1, c2 = c2, c1
+                c1.update(c2)
+                for member in c2:
+                    self.neutralComponents[member] = c1
+
+    def neutralComponent(self, node):
+        """
+        Returns the set of nodes supporting the NEUTRAL identity which are connected to the given one.
+        :type node: AbstractNode
+        :rtype: set
+        """
+        component = self.neutralComponents.get(node)
+        if component is None:
+            func = lambda x: Identity.Neutral in x.identities()
+            component = set(bfs(source=node, filter_on_nodes=func))
+            for member in component:
+                self.discardNeutralComponent(member)
+            for member in component:
+                self.neutralComponents[member] = component
+        return component
+
     def nodes(self):
         """
         Returns a collection with all the nodes in the diagram.
-        :rtype: set
+        :rtype: frozenset
         """
         return self.project.nodes(self)
 
@@ -760,6 +866,21 @@ class Diagram(QtWidgets.QGraphicsScene):
         """
         return self.project.node(self, nid)
 
+    def render(self, painter, target=QtCore.QRectF(), source=QtCore.QRectF(), mode=QtCore.Qt.KeepAspectRatio):
+        """
+        Render the source rect of the diagram into the target rect of the given painter, at full level of detail.
+        :type painter: QPainter
+        :type target: QRectF
+        :type source: QRectF
+        :type mode: AspectRatioMode
+        """
+        self.updateItems()
+        self.rendering = True
+        try:
+            super().render(painter, target, source, mode)
+        finally:
+            self.rendering = False
+
     def selectedEdges(self, filter_on_edges=lambda x: True):
         """
         Returns the edges selected in the diagram.
@@ -784,6 +905,18 @@ class Diagram(QtWidgets.QGraphicsScene):
         """
         return [x for x in super().selectedItems() if x.isNode() and filter_on_nodes(x)]
 
+    def setDetailThresholds(self, shapes, text):
+        """
+        Set the zoom levels (in percent) below which the diagram is rendered with reduced detail:
+        below the shape threshold nodes are drawn as flat rectangles and edges without heads and anchors,
+        while below the text threshold labels are not drawn at all.
+        :type shapes: int
+        :type text: int
+        """
+        self.shapeDetailThreshold = shapes / 100
+        self.textDetailThreshold = text / 100
+        self.update()
+
     def setMode(self, mode, param=None):
         """
         Set the operational mode.
@@ -823,6 +956,19 @@ class Diagram(QtWidgets.QGraphicsScene):
                         moveData['edges'][edge] = edge.breakpoints[:]
         return moveData
 
+    def updateItems(self):
+        """
+        Update the geometry and the state of all the items of the diagram, if it has been marked as stale.
+        Project loaders mark the loaded diagrams as stale rather than updating their items straight away,
+        so that the update is paid only when the diagram is first displayed or exported.
+        """
+        if self.stale:
+            self.stale = False
+            for node in self.nodes():
+                node.updateNode()
+            for edge in self.edges():
+                edge.updateEdge()
+
     # noinspection PyTypeChecker
     def visibleRect(self, margin=0):
         """
@@ -830,6 +976,7 @@ class Diagram(QtWidgets.QGraphicsScene):
         :type margin: float
         :rtype: QtCore.QRectF
         """
+        self.updateItems()
         items = self.items()
         if items:
             x = set()
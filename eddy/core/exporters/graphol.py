@@ -33,15 +33,16 @@
 ##########################################################################
 
 
+import io
 import os
 
-from PyQt5 import QtXml
+from PyQt5 import QtCore
 
 from eddy.core.datatypes.graphol import Item
 from eddy.core.datatypes.system import File
 from eddy.core.exporters.common import AbstractProjectExporter
 from eddy.core.functions.misc import postfix
-from eddy.core.functions.fsystem import fwrite, mkdir
+from eddy.core.functions.fsystem import fexists, fremove, mkdir
 from eddy.core.output import getLogger
 from eddy.core.project import Project
 from eddy.core.project import K_DESCRIPTION, K_DESCRIPTION_STATUS
@@ -53,6 +54,110 @@ from eddy.core.project import K_SYMMETRIC, K_TRANSITIVE
 LOGGER = getLogger()
 
 
+class GrapholStreamWriter(object):
+    """
+    Streaming XML writer which serializes a Graphol document element by element.
+    The produced output matches the one of QDomDocument.toString(2) (indentation,
+    escaping and number formatting) without keeping the whole document in memory.
+    """
+    def __init__(self, stream, indent=2):
+        """
+        Initialize the stream writer.
+        :type stream: TextIOBase
+        :type indent: int
+        """
+        self.stream = stream
+        self.indent = indent
+        self.locale = QtCore.QLocale.c()
+        self.open = []
+        self.pending = False
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def escape(self, text, attribute=False):
+        """
+        Escape the given text the same way QDomDocument does.
+        :type text: str
+        :type attribute: bool
+        :rtype: str
+        """
+        text = text.replace('&', '&amp;').replace('<', '&lt;').replace(']]>', ']]&gt;').replace('\r', '&#xd;')
+        if attribute:
+            text = text.replace('"', '&quot;').replace('\n', '&#xa;').replace('\t', '&#x9;')
+        return text
+
+    def format(self, value):
+        """
+        Format the given attribute value the same way QDomElement.setAttribute does.
+        :type value: T <= int|float|str
+        :rtype: str
+        """
+        if isinstance(value, float):
+            return self.locale.toString(value, 'g', 17)
+        return str(value)
+
+    def writeEmptyElement(self, name, attributes=None):
+        """
+        Write an element with no content.
+        :type name: str
+        :type attributes: list
+        """
+        self.writeStartElement(name, attributes)
+        self.writeEndElement()
+
+    def writeEndDocument(self):
+        """
+        Close all the elements which are still open.
+        """
+        while self.open:
+            self.writeEndElement()
+
+    def writeEndElement(self):
+        """
+        Close the most recently opened element.
+        """
+        name = self.open.pop()
+        if self.pending:
+            self.stream.write('/>\n')
+        else:
+            self.stream.write('{0}</{1}>\n'.format(' ' * self.indent * len(self.open), name))
+        self.pending = False
+
+    def writeStartDocument(self):
+        """
+        Write the XML declaration.
+        """
+        self.stream.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+
+    def writeStartElement(self, name, attributes=None):
+        """
+        Open a new element: the start tag is completed when the element content is known.
+        :type name: str
+        :type attributes: list
+        """
+        if self.pending:
+            self.stream.write('>\n')
+        self.stream.write('{0}<{1}'.format(' ' * self.indent * len(self.open), name))
+        for key, value in attributes or ():
+            self.stream.write(' {0}="{1}"'.format(key, self.escape(self.format(value), attribute=True)))
+        self.open.append(name)
+        self.pending = True
+
+    def writeTextElement(self, name, text, attributes=None):
+        """
+        Write an element whose only content is the given text.
+        :type name: str
+        :type text: str
+        :type attributes: list
+        """
+        self.writeStartElement(name, attributes)
+        self.stream.write('>{0}</{1}>\n'.format(self.escape(text), name))
+        self.open.pop()
+        self.pending = False
+
+
 class GrapholProjectExporter(AbstractProjectExporter):
     """
     Extends AbstractProjectExporter with facilities to export the structure of a Graphol project.
@@ -70,7 +175,7 @@ class GrapholProjectExporter(AbstractProjectExporter):
         """
         super().__init__(project, session)
 
-        self.document = None
+        self.writer = None
 
         self.itemToXml = {
             Item.AttributeNode: 'attribute',
@@ -135,69 +240,38 @@ class GrapholProjectExporter(AbstractProjectExporter):
     #   ONTOLOGY PREDICATES EXPORT
     #################################
 
-    def exportPredicateMeta(self, item, name):
+    def exportPredicateMeta(self, item, name, *properties):
         """
         Export predicate metadata.
         :type item: Item
         :type name: str
-        :rtype: QDomElement
+        :type properties: list
         """
         meta = self.project.meta(item, name)
-        element = self.document.createElement('predicate')
-        element.setAttribute('type', self.itemToXml[item])
-        element.setAttribute('name', name)
-        description = self.document.createElement(K_DESCRIPTION)
-        description.setAttribute('status',meta.get(K_DESCRIPTION_STATUS, ''))
-        description.appendChild(self.document.createTextNode(meta.get(K_DESCRIPTION, '')))
-
-        element.appendChild(description)
-        return element
+        self.writer.writeStartElement('predicate', [('type', self.itemToXml[item]), ('name', name)])
+        self.writer.writeTextElement(K_DESCRIPTION, meta.get(K_DESCRIPTION, ''),
+                                     [('status', meta.get(K_DESCRIPTION_STATUS, ''))])
+        for key in properties:
+            self.writer.writeTextElement(key, str(int(meta.get(key, False))))
+        self.writer.writeEndElement()
 
     def exportAttributeMeta(self, item, name):
         """
         Export attribute metadata.
         :type item: Item
         :type name: str
-        :rtype: QDomElement
         """
-        element = self.exportPredicateMeta(item, name)
-        meta = self.project.meta(item, name)
-        functional = self.document.createElement(K_FUNCTIONAL)
-        functional.appendChild(self.document.createTextNode(str(int(meta.get(K_FUNCTIONAL, False)))))
-        element.appendChild(functional)
-        return element
-    
+        self.exportPredicateMeta(item, name, K_FUNCTIONAL)
+
     def exportRoleMeta(self, item, name):
         """
         Export role metadata.
         :type item: Item
         :type name: str
-        :rtype: QDomElement
         """
-        element = self.exportPredicateMeta(item, name)
-        meta = self.project.meta(item, name)
-        functional = self.document.createElement(K_FUNCTIONAL)
-        functional.appendChild(self.document.createTextNode(str(int(meta.get(K_FUNCTIONAL, False)))))
-        inverseFunctional = self.document.createElement(K_INVERSE_FUNCTIONAL)
-        inverseFunctional.appendChild(self.document.createTextNode(str(int(meta.get(K_INVERSE_FUNCTIONAL, False)))))
-        asymmetric = self.document.createElement(K_ASYMMETRIC)
-        asymmetric.appendChild(self.document.createTextNode(str(int(meta.get(K_ASYMMETRIC, False)))))
-        irreflexive = self.document.createElement(K_IRREFLEXIVE)
-        irreflexive.appendChild(self.document.createTextNode(str(int(meta.get(K_IRREFLEXIVE, False)))))
-        reflexive = self.document.createElement(K_REFLEXIVE)
-        reflexive.appendChild(self.document.createTextNode(str(int(meta.get(K_REFLEXIVE, False)))))
-        symmetric = self.document.createElement(K_SYMMETRIC)
-        symmetric.appendChild(self.document.createTextNode(str(int(meta.get(K_SYMMETRIC, False)))))
-        transitive = self.document.createElement(K_TRANSITIVE)
-        transitive.appendChild(self.document.createTextNode(str(int(meta.get(K_TRANSITIVE, False)))))
-        element.appendChild(functional)
-        element.appendChild(inverseFunctional)
-        element.appendChild(asymmetric)
-        element.appendChild(irreflexive)
-        element.appendChild(reflexive)
-        element.appendChild(symmetric)
-        element.appendChild(transitive)
-        return element
+        self.exportPredicateMeta(item, name,
+            K_FUNCTIONAL, K_INVERSE_FUNCTIONAL, K_ASYMMETRIC, K_IRREFLEXIVE,
+            K_REFLEXIVE, K_SYMMETRIC, K_TRANSITIVE)
 
     #############################################
     #   ONTOLOGY DIAGRAMS EXPORT : NODES
@@ -205,164 +279,129 @@ class GrapholProjectExporter(AbstractProjectExporter):
 
     def exportAttributeNode(self, node):
         """
-        Export the given node into a QDomElement.
+        Export the given node into the Graphol document.
         :type node: AttributeNode
-        :rtype: QDomElement
         """
-        element = self.exportLabelNode(node)
-        element.setAttribute('remaining_characters', node.remaining_characters)
-
-        return element
+        self.exportLabelNode(node, [('remaining_characters', node.remaining_characters)])
 
     def exportComplementNode(self, node):
         """
-        Export the given node into a QDomElement.
+        Export the given node into the Graphol document.
         :type node: ComplementNode
-        :rtype: QDomElement
         """
-        return self.exportLabelNode(node)
+        self.exportLabelNode(node)
 
     def exportConceptNode(self, node):
         """
-        Export the given node into a QDomElement.
+        Export the given node into the Graphol document.
         :type node: ConceptNode
-        :rtype: QDomElement
         """
-        element = self.exportLabelNode(node)
-        element.setAttribute('remaining_characters', node.remaining_characters)
-
-        return element
+        self.exportLabelNode(node, [('remaining_characters', node.remaining_characters)])
 
     def exportDatatypeRestrictionNode(self, node):
         """
-        Export the given node into a QDomElement.
+        Export the given node into the Graphol document.
         :type node: DatatypeRestrictionNode
-        :rtype: QDomElement
         """
-        return self.exportLabelNode(node)
+        self.exportLabelNode(node)
 
     def exportDisjointUnionNode(self, node):
         """
-        Export the given node into a QDomElement.
+        Export the given node into the Graphol document.
         :type node: DisjointUnionNode
-        :rtype: QDomElement
         """
-        return self.exportGenericNode(node)
+        self.exportGenericNode(node)
 
     def exportDomainRestrictionNode(self, node):
         """
-        Export the given node into a QDomElement.
+        Export the given node into the Graphol document.
         :type node: DomainRestrictionNode
-        :rtype: QDomElement
         """
-        return self.exportLabelNode(node)
+        self.exportLabelNode(node)
 
     def exportEnumerationNode(self, node):
         """
-        Export the given node into a QDomElement.
+        Export the given node into the Graphol document.
         :type node: EnumerationNode
-        :rtype: QDomElement
         """
-        return self.exportLabelNode(node)
+        self.exportLabelNode(node)
 
     def exportFacetNode(self, node):
         """
-        Export the given node into a QDomElement.
+        Export the given node into the Graphol document.
         :type node: FacetNode
-        :rtype: QDomElement
         """
         position = node.mapToScene(node.textPos())
-        label = self.document.createElement('label')
-        label.setAttribute('height', node.labelA.height())
-        label.setAttribute('width', node.labelA.width() + node.labelB.width())
-        label.setAttribute('x', position.x())
-        label.setAttribute('y', position.y())
-        label.appendChild(self.document.createTextNode(node.text()))
-        element = self.exportGenericNode(node)
-        element.appendChild(label)
-        return element
+        label = [
+            ('height', node.labelA.height()),
+            ('width', node.labelA.width() + node.labelB.width()),
+            ('x', position.x()),
+            ('y', position.y()),
+        ]
+        self.exportGenericNode(node, label=(label, node.text()))
 
     def exportIndividualNode(self, node):
         """
-        Export the given node into a QDomElement.
+        Export the given node into the Graphol document.
         :type node: IndividualNode
-        :rtype: QDomElement
         """
-        element = self.exportLabelNode(node)
-        element.setAttribute('remaining_characters', node.remaining_characters)
-
-        return element
+        self.exportLabelNode(node, [('remaining_characters', node.remaining_characters)])
 
     def exportIntersectionNode(self, node):
         """
-        Export the given node into a QDomElement.
+        Export the given node into the Graphol document.
         :type node: IntersectionNode
-        :rtype: QDomElement
         """
-        return self.exportLabelNode(node)
+        self.exportLabelNode(node)
 
     def exportPropertyAssertionNode(self, node):
         """
-        Export the given node into a QDomElement.
+        Export the given node into the Graphol document.
         :type node: PropertyAssertionNode
-        :rtype: QDomElement
         """
-        element = self.exportGenericNode(node)
-        element.setAttribute('inputs', ','.join(node.inputs))
-        return element
+        self.exportGenericNode(node, [('inputs', ','.join(node.inputs))])
 
     def exportRangeRestrictionNode(self, node):
         """
-        Export the given node into a QDomElement.
+        Export the given node into the Graphol document.
         :type node: RangeRestrictionNode
-        :rtype: QDomElement
         """
-        return self.exportLabelNode(node)
+        self.exportLabelNode(node)
 
     def exportRoleNode(self, node):
         """
-        Export the given node into a QDomElement.
+        Export the given node into the Graphol document.
         :type node: RoleNode
-        :rtype: QDomElement
         """
-        element = self.exportLabelNode(node)
-        element.setAttribute('remaining_characters', node.remaining_characters)
-
-        return element
+        self.exportLabelNode(node, [('remaining_characters', node.remaining_characters)])
 
     def exportRoleChainNode(self, node):
         """
-        Export the given node into a QDomElement.
+        Export the given node into the Graphol document.
         :type node: RoleChainNode
-        :rtype: QDomElement
         """
-        element = self.exportLabelNode(node)
-        element.setAttribute('inputs', ','.join(node.inputs))
-        return element
+        self.exportLabelNode(node, [('inputs', ','.join(node.inputs))])
 
     def exportRoleInverseNode(self, node):
         """
-        Export the given node into a QDomElement.
+        Export the given node into the Graphol document.
         :type node: RoleInverseNode
-        :rtype: QDomElement
         """
-        return self.exportLabelNode(node)
+        self.exportLabelNode(node)
 
     def exportValueDomainNode(self, node):
         """
-        Export the given node into a QDomElement.
+        Export the given node into the Graphol document.
         :type node: ValueDomainNode
-        :rtype: QDomElement
         """
-        return self.exportLabelNode(node)
+        self.exportLabelNode(node)
 
     def exportUnionNode(self, node):
         """
-        Export the given node into a QDomElement.
+        Export the given node into the Graphol document.
         :type node: UnionNode
-        :rtype: QDomElement
         """
-        return self.exportLabelNode(node)
+        self.exportLabelNode(node)
 
     #############################################
     #   ONTOLOGY DIAGRAMS EXPORT : EDGES
@@ -370,111 +409,101 @@ class GrapholProjectExporter(AbstractProjectExporter):
 
     def exportInclusionEdge(self, edge):
         """
-        Export the given edge into a QDomElement.
+        Export the given edge into the Graphol document.
         :type edge: InclusionEdge
-        :rtype: QDomElement
         """
-        return self.exportGenericEdge(edge)
+        self.exportGenericEdge(edge)
 
     def exportEquivalenceEdge(self, edge):
         """
-        Export the given edge into a QDomElement.
+        Export the given edge into the Graphol document.
         :type edge: EquivalenceEdge
-        :rtype: QDomElement
         """
-        return self.exportGenericEdge(edge)
+        self.exportGenericEdge(edge)
 
     def exportInputEdge(self, edge):
         """
-        Export the given edge into a QDomElement.
+        Export the given edge into the Graphol document.
         :type edge: InputEdge
-        :rtype: QDomElement
         """
-        return self.exportGenericEdge(edge)
+        self.exportGenericEdge(edge)
 
     def exportMembershipEdge(self, edge):
         """
-        Export the given edge into a QDomElement.
+        Export the given edge into the Graphol document.
         :type edge: MembershipEdge
-        :rtype: QDomElement
         """
-        return self.exportGenericEdge(edge)
+        self.exportGenericEdge(edge)
 
     def exportSameEdge(self, edge):
         """
-        Export the given edge into a QDomElement.
+        Export the given edge into the Graphol document.
         :type edge: SameEdge
-        :rtype: QDomElement
         """
-        return self.exportGenericEdge(edge)
+        self.exportGenericEdge(edge)
 
     def exportDifferentEdge(self, edge):
         """
-        Export the given edge into a QDomElement.
+        Export the given edge into the Graphol document.
         :type edge: DifferentEdge
-        :rtype: QDomElement
         """
-        return self.exportGenericEdge(edge)
+        self.exportGenericEdge(edge)
 
     #############################################
     #   ONTOLOGY DIAGRAMS EXPORT : GENERICS
     #################################
 
-    def exportLabelNode(self, node):
+    def exportLabelNode(self, node, attributes=None):
         """
-        Export the given node into a QDomElement.
+        Export the given node into the Graphol document.
         :type node: AbstractNode
-        :rtype: QDomElement
+        :type attributes: list
         """
         position = node.mapToScene(node.textPos())
-        label = self.document.createElement('label')
-        label.setAttribute('height', node.label.height())
-        label.setAttribute('width', node.label.width())
-        label.setAttribute('x', position.x())
-        label.setAttribute('y', position.y())
-
-        label.appendChild(self.document.createTextNode(node.text()))
-        element = self.exportGenericNode(node)
-        element.appendChild(label)
-        return element
+        label = [
+            ('height', node.label.height()),
+            ('width', node.label.width()),
+            ('x', position.x()),
+            ('y', position.y()),
+        ]
+        self.exportGenericNode(node, attributes, label=(label, node.text()))
 
     def exportGenericEdge(self, edge):
         """
-        Export the given node into a QDomElement.
+        Export the given edge into the Graphol document.
         :type edge: AbstractEdge
-        :rtype: QDomElement
         """
-        element = self.document.createElement('edge')
-        element.setAttribute('source', edge.source.id)
-        element.setAttribute('target', edge.target.id)
-        element.setAttribute('id', edge.id)
-        element.setAttribute('type', self.itemToXml[edge.type()])
-
+        self.writer.writeStartElement('edge', [
+            ('source', edge.source.id),
+            ('target', edge.target.id),
+            ('id', edge.id),
+            ('type', self.itemToXml[edge.type()]),
+        ])
         for p in [edge.source.anchor(edge)] + edge.breakpoints + [edge.target.anchor(edge)]:
-            point = self.document.createElement('point')
-            point.setAttribute('x', p.x())
-            point.setAttribute('y', p.y())
-            element.appendChild(point)
+            self.writer.writeEmptyElement('point', [('x', p.x()), ('y', p.y())])
+        self.writer.writeEndElement()
 
-        return element
-
-    def exportGenericNode(self, node):
+    def exportGenericNode(self, node, attributes=None, label=None):
         """
-        Export the given node into a QDomElement.
+        Export the given node into the Graphol document.
         :type node: AbstractNode
-        :rtype: QDomElement
-        """
-        element = self.document.createElement('node')
-        element.setAttribute('id', node.id)
-        element.setAttribute('type', self.itemToXml[node.type()])
-        element.setAttribute('color', node.brush().color().name())
-        geometry = self.document.createElement('geometry')
-        geometry.setAttribute('height', node.height())
-        geometry.setAttribute('width', node.width())
-        geometry.setAttribute('x', node.pos().x())
-        geometry.setAttribute('y', node.pos().y())
-        element.appendChild(geometry)
-        return element
+        :type attributes: list
+        :type label: tuple
+        """
+        self.writer.writeStartElement('node', [
+            ('id', node.id),
+            ('type', self.itemToXml[node.type()]),
+            ('color', node.brush().color().name()),
+        ] + (attributes or []))
+        self.writer.writeEmptyElement('geometry', [
+            ('height', node.height()),
+            ('width', node.width()),
+            ('x', node.pos().x()),
+            ('y', node.pos().y()),
+        ])
+        if label:
+            self.writer.writeTextElement('label', label[1], label[0])
+        self.writer.writeEndElement()
 
     #############################################
     #   MAIN EXPORT
@@ -482,149 +511,87 @@ class GrapholProjectExporter(AbstractProjectExporter):
 
     def createDiagrams(self):
         """
-        Create the 'diagrams' element in the QDomDocument.
+        Write the 'diagrams' element in the Graphol document.
         """
-        section = self.document.createElement('diagrams')
+        self.writer.writeStartElement('diagrams')
         for diagram in self.project.diagrams():
-            subsection = self.document.createElement('diagram')
-            subsection.setAttribute('name', diagram.name)
-            subsection.setAttribute('width', diagram.width())
-            subsection.setAttribute('height', diagram.height())
+            self.writer.writeStartElement('diagram', [
+                ('name', diagram.name),
+                ('width', diagram.width()),
+                ('height', diagram.height()),
+            ])
             for node in diagram.nodes():
                 func = self.exportFuncForItem[node.type()]
-                subsection.appendChild(func(node))
+                func(node)
             for edge in diagram.edges():
                 func = self.exportFuncForItem[edge.type()]
-                subsection.appendChild(func(edge))
-            section.appendChild(subsection)
-        self.document.documentElement().appendChild(section)
-
-    def createDomDocument(self):
-        """
-        Create the QDomDocument where to store project information.
-        """
-        self.document = QtXml.QDomDocument()
-        instruction = self.document.createProcessingInstruction('xml', 'version="1.0" encoding="UTF-8"')
-        self.document.appendChild(instruction)
-        graphol = self.document.createElement('graphol')
-        graphol.setAttribute('version', '2')
-        self.document.appendChild(graphol)
+                func(edge)
+            self.writer.writeEndElement()
+        self.writer.writeEndElement()
 
     def createOntology(self):
         """
-        Create the 'ontology' element in the QDomDocument.
-        """
-        #iri = self.document.createElement('iri')
-        #iri.appendChild(self.document.createTextNode(self.project.iri))
-        name = self.document.createElement('name')
-        name.appendChild(self.document.createTextNode(self.project.name))
-        #prefix = self.document.createElement('prefix')
-        #prefix.appendChild(self.document.createTextNode(self.project.prefix))
-        profile = self.document.createElement('profile')
-        profile.appendChild(self.document.createTextNode(self.project.profile.name()))
-        version = self.document.createElement('version')
-        version.appendChild(self.document.createTextNode(self.project.version))
-
-        IRI_prefixes_nodes_dict = self.document.createElement('IRI_prefixes_nodes_dict')
-        dict = self.project.IRI_prefixes_nodes_dict
-
-        for iri_key in dict.keys():
-
-            iri_to_save = self.document.createElement('iri')
-            iri_to_save.setAttribute('iri_value', iri_key)
-
-            prefixes_ = dict[iri_key][0]
-            nodes_ = list(dict[iri_key][1])
-            properties_ = list(dict[iri_key][2])
-
-            prefixes_to_save = self.document.createElement('prefixes')
-            nodes_to_save = self.document.createElement('nodes')
-            properties_to_save = self.document.createElement('properties')
-
-            for p in prefixes_:
-                prefix_to_save = self.document.createElement('prefix')
-                prefix_to_save.setAttribute('prefix_value', p)
-                prefixes_to_save.appendChild(prefix_to_save)
-
-            for n in nodes_:
-                node_to_save = self.document.createElement('node')
-                node_to_save.setAttribute('node_value', str(n))
-                nodes_to_save.appendChild(node_to_save)
-
-            for ppt in properties_:
-                property_to_save = self.document.createElement('property')
-                property_to_save.setAttribute('property_value', ppt)
-                properties_to_save.appendChild(property_to_save)
-
-            iri_to_save.appendChild(prefixes_to_save)
-            iri_to_save.appendChild(nodes_to_save)
-            iri_to_save.appendChild(properties_to_save)
-
-            IRI_prefixes_nodes_dict.appendChild(iri_to_save)
-
-        #IRI_prefixes_nodes_dict.appendChild(self.document.createTextNode(string_format_dictionary))
-        #IRI_prefixes_nodes_dict.appendChild(self.document.createTextNode(new_lines))
-
-        """
-        prefered_prefix_list = self.document.createElement('prefered_prefix_list')
-        dict_2 = self.project.prefered_prefix_list
-
-        keys_dict_2 = dict_2[0]
-        values_dict_2 = dict_2[1]
-
-        for c,key in enumerate(keys_dict_2):
-
-            prefered_prefix = values_dict_2[c]
-
-            key_to_save = self.document.createElement('key')
-            if str(type(key)) == '<class \'str\'>':
-                key_to_save.setAttribute('key_value', key)
-            else:
-                key_to_save.setAttribute('key_value', str(key))
-
-            value_to_save = self.document.createElement('value')
-            value_to_save.setAttribute('prefix_value', prefered_prefix)
-
-            key_to_save.appendChild(value_to_save)
-            prefered_prefix_list.appendChild(key_to_save)
-        """
-
-        section = self.document.createElement('ontology')
-
-        section.appendChild(name)
-        section.appendChild(version)
-        #section.appendChild(prefix)
-        #section.appendChild(iri)
-        section.appendChild(profile)
-        section.appendChild(IRI_prefixes_nodes_dict)
-        #section.appendChild(prefered_prefix_list)
-
-        self.document.documentElement().appendChild(section)
+        Write the 'ontology' element in the Graphol document.
+        """
+        self.writer.writeStartElement('ontology')
+        self.writer.writeTextElement('name', self.project.name)
+        self.writer.writeTextElement('version', self.project.version)
+        self.writer.writeTextElement('profile', self.project.profile.name())
+        self.writer.writeStartElement('IRI_prefixes_nodes_dict')
+        for iri, entry in self.project.IRI_prefixes_nodes_dict.items():
+            self.writer.writeStartElement('iri', [('iri_value', iri)])
+            self.writer.writeStartElement('prefixes')
+            for p in entry[0]:
+                self.writer.writeEmptyElement('prefix', [('prefix_value', p)])
+            self.writer.writeEndElement()
+            self.writer.writeStartElement('nodes')
+            for n in list(entry[1]):
+                self.writer.writeEmptyElement('node', [('node_value', str(n))])
+            self.writer.writeEndElement()
+            self.writer.writeStartElement('properties')
+            for ppt in list(entry[2]):
+                self.writer.writeEmptyElement('property', [('property_value', ppt)])
+            self.writer.writeEndElement()
+            self.writer.writeEndElement()
+        self.writer.writeEndElement()
+        self.writer.writeEndElement()
 
     def createPredicatesMeta(self):
         """
-        Create the 'predicates' element in the QDomDocument.
+        Write the 'predicates' element in the Graphol document.
         """
-        section = self.document.createElement('predicates')
+        self.writer.writeStartElement('predicates')
         for item, predicate in self.project.metas():
             func = self.exportMetaFuncForItem[item]
-            meta = func(item, predicate)
-            section.appendChild(meta)
-        self.document.documentElement().appendChild(section)
+            func(item, predicate)
+        self.writer.writeEndElement()
 
     def createProjectFile(self):
         """
-        Serialize a previously created QDomDocument to disk.
+        Stream the project to a staging file and atomically move it over the project file.
         """
+        mkdir(self.project.path)
+        filename = postfix(self.project.name, File.Graphol.extension)
+        filepath = os.path.join(self.project.path, filename)
+        stage = os.path.join(self.project.path, '.{0}'.format(filename))
         try:
-            mkdir(self.project.path)
-            filename = postfix(self.project.name, File.Graphol.extension)
-            filepath = os.path.join(self.project.path, filename)
-            fwrite(self.document.toString(2), filepath)
+            with io.open(stage, 'w', encoding='utf8') as ptr:
+                self.writer = GrapholStreamWriter(ptr)
+                self.writer.writeStartDocument()
+                self.writer.writeStartElement('graphol', [('version', '2')])
+                self.createOntology()
+                self.createPredicatesMeta()
+                self.createDiagrams()
+                self.writer.writeEndDocument()
+            os.replace(stage, filepath)
         except Exception as e:
+            if fexists(stage):
+                fremove(stage)
             raise e
         else:
             LOGGER.info('Saved project %s to %s', self.project.name, self.project.path)
+        finally:
+            self.writer = None
 
     #############################################
     #   INTERFACE
@@ -642,8 +609,4 @@ class GrapholProjectExporter(AbstractProjectExporter):
         """
         Perform Project export to disk.
         """
-        self.createDomDocument()
-        self.createOntology()
-        self.createPredicatesMeta()
-        self.createDiagrams()
-        self.createProjectFile()
\ No newline at end of file
+        self.createProjectFile()
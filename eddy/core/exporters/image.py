@@ -33,7 +33,13 @@
 ##########################################################################
 
 
+import os
+import struct
+import zlib
+
 from abc import ABCMeta, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 from PyQt5 import QtGui, QtCore
 
@@ -44,6 +50,194 @@ from eddy.core.output import getLogger
 LOGGER = getLogger()
 
 
+class ImageStreamWriter(object):
+    """
+    Extends built-in object providing the base class for image writers which encode an image band by band,
+    so that the whole image never needs to be kept in memory. Bands are QImage instances spanning the whole
+    width of the image, and must be written top to bottom.
+    """
+    __metaclass__ = ABCMeta
+
+    def __init__(self, path, width, height):
+        """
+        Initialize the image writer.
+        :type path: str
+        :type width: int
+        :type height: int
+        """
+        self.file = open(path, 'wb')
+        self.height = height
+        self.rows = 0
+        self.width = width
+
+    def __enter__(self):
+        """
+        Enter the writer context.
+        :rtype: ImageStreamWriter
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Exit the writer context, completing the image only if no error occurred.
+        """
+        try:
+            if exc_type is None:
+                self.close()
+        finally:
+            self.file.close()
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def close(self):
+        """
+        Complete the image.
+        """
+        pass
+
+    @staticmethod
+    def scanlines(band, fmt):
+        """
+        Returns the list of the scanlines of the given band, converted to the given 24 bit format.
+        :type band: QImage
+        :type fmt: int
+        :rtype: list
+        """
+        image = band.convertToFormat(fmt)
+        size = image.bytesPerLine()
+        bits = image.constBits()
+        bits.setsize(size * image.height())
+        data = bits.asstring()
+        return [data[i * size:i * size + image.width() * 3] for i in range(image.height())]
+
+    @abstractmethod
+    def write(self, band):
+        """
+        Write the given band.
+        :type band: QImage
+        """
+        pass
+
+
+class BmpStreamWriter(ImageStreamWriter):
+    """
+    Extends ImageStreamWriter to write 24 bit top-down BMP images.
+    """
+    def __init__(self, path, width, height):
+        """
+        Initialize the BMP writer.
+        :type path: str
+        :type width: int
+        :type height: int
+        """
+        padding = b'\x00' * (-width * 3 % 4)
+        size = (width * 3 + len(padding)) * height
+        # CHECK THE SIZE BEFORE OPENING THE FILE: THE BMP HEADER STORES IT IN 32 BITS
+        if 54 + size > 0xFFFFFFFF:
+            raise ValueError('Cannot export a {0}x{1} image in BMP format: it exceeds the 4 GiB size limit of the format'.format(width, height))
+        super().__init__(path, width, height)
+        self.padding = padding
+        # NEGATIVE HEIGHT => SCANLINES ARE STORED TOP TO BOTTOM
+        self.file.write(struct.pack('<2sIHHI', b'BM', 54 + size, 0, 0, 54))
+        self.file.write(struct.pack('<IiiHHIIiiII', 40, width, -height, 1, 24, 0, size, 2835, 2835, 0, 0))
+
+    def write(self, band):
+        """
+        Write the given band.
+        :type band: QImage
+        """
+        for scanline in self.scanlines(band.rgbSwapped(), QtGui.QImage.Format_RGB888):
+            self.file.write(scanline + self.padding)
+        self.rows += band.height()
+
+
+class PngStreamWriter(ImageStreamWriter):
+    """
+    Extends ImageStreamWriter to write 24 bit PNG images.
+    Bands are compressed concurrently by a bounded pool of threads (zlib releases the GIL while compressing): every
+    band is compressed as an independent raw deflate block sequence terminated by a sync flush, so that compressed
+    bands can be concatenated into a single zlib stream, whose checksum is computed separately on the raw data.
+    """
+    CompressionLevel = 6
+    DefaultWorkers = max(1, min(4, os.cpu_count() or 1))
+
+    def __init__(self, path, width, height, workers=DefaultWorkers):
+        """
+        Initialize the PNG writer.
+        :type path: str
+        :type width: int
+        :type height: int
+        :type workers: int
+        """
+        super().__init__(path, width, height)
+        self.adler = 1
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.pending = deque()
+        self.workers = workers
+        self.file.write(b'\x89PNG\r\n\x1a\n')
+        self.chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0))
+        self.chunk(b'IDAT', b'\x78\x9c')
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Exit the writer context, completing the image only if no error occurred.
+        """
+        try:
+            super().__exit__(exc_type, exc_value, traceback)
+        finally:
+            self.executor.shutdown()
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def chunk(self, kind, data):
+        """
+        Write a PNG chunk of the given kind.
+        :type kind: bytes
+        :type data: bytes
+        """
+        self.file.write(struct.pack('>I', len(data)))
+        self.file.write(kind + data)
+        self.file.write(struct.pack('>I', zlib.crc32(kind + data) & 0xFFFFFFFF))
+
+    def close(self):
+        """
+        Complete the image.
+        """
+        while self.pending:
+            self.chunk(b'IDAT', self.pending.popleft().result())
+        self.chunk(b'IDAT', struct.pack('>I', self.adler & 0xFFFFFFFF))
+        self.chunk(b'IEND', b'')
+
+    @classmethod
+    def deflate(cls, data, last):
+        """
+        Compress the given data as a raw deflate block sequence: executed by the threads of the pool.
+        :type data: bytes
+        :type last: bool
+        :rtype: bytes
+        """
+        compressor = zlib.compressobj(cls.CompressionLevel, zlib.DEFLATED, -15)
+        return compressor.compress(data) + compressor.flush(zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH)
+
+    def write(self, band):
+        """
+        Write the given band.
+        :type band: QImage
+        """
+        # EVERY SCANLINE IS PRECEDED BY THE FILTER TYPE (0 = NONE)
+        data = b''.join(b'\x00' + x for x in self.scanlines(band, QtGui.QImage.Format_RGB888))
+        self.adler = zlib.adler32(data, self.adler)
+        self.rows += band.height()
+        self.pending.append(self.executor.submit(self.deflate, data, self.rows >= self.height))
+        # KEEP MEMORY BOUNDED BY WRITING BANDS AS SOON AS THE POOL IS FULL
+        while len(self.pending) > self.workers:
+            self.chunk(b'IDAT', self.pending.popleft().result())
+
+
 class ImageDiagramExporter(AbstractDiagramExporter):
     """
     Extends AbstractDiagramExporter with facilities to export the structure of Graphol diagrams to an image file.
@@ -55,6 +249,11 @@ class ImageDiagramExporter(AbstractDiagramExporter):
     PngFormat = 'PNG'
     PpmFormat = 'PPM'
 
+    StreamWriters = {BmpFormat: BmpStreamWriter, PngFormat: PngStreamWriter}
+    BandHeight = 512
+    BandOverlap = 16
+    TiledArea = 4096 * 4096
+
     def __init__(self, diagram, format, session=None):
         """
         Initialize the ImageDiagramExporter.
@@ -81,6 +280,34 @@ class ImageDiagramExporter(AbstractDiagramExporter):
     #   INTERFACE
     #################################
 
+    def bands(self, shape):
+        """
+        Render the given area of the diagram in horizontal bands, each one with a single render call.
+        Every band is rendered together with a margin overlapping the adjacent bands, which is then cropped
+        away: items painting slightly outside of their bounding rect are also painted in the bands they are
+        not collected for, and text crossing a band border is rasterized as if no border was there.
+        :type shape: QRectF
+        :rtype: generator
+        """
+        width = int(shape.width())
+        height = int(shape.height())
+        overlap = self.BandOverlap
+        # MAP THE SHAPE ONTO THE WHOLE IMAGE AS ImageDiagramExporter.run DOES, ROUNDING ITS SIZE DOWN TO WHOLE PIXELS
+        ratio = shape.height() / height
+        for y in range(0, height, self.BandHeight):
+            h = min(self.BandHeight, height - y)
+            band = QtGui.QImage(width, h + 2 * overlap, QtGui.QImage.Format_RGB32)
+            band.fill(QtCore.Qt.white)
+            painter = QtGui.QPainter()
+            if painter.begin(band):
+                painter.setBackgroundMode(QtCore.Qt.OpaqueMode)
+                # RENDER THE BAND IN THE PAINTER
+                target = QtCore.QRectF(0, 0, width, h + 2 * overlap)
+                source = QtCore.QRectF(shape.left(), shape.top() + (y - overlap) * ratio, shape.width(), (h + 2 * overlap) * ratio)
+                self.diagram.render(painter, target, source, QtCore.Qt.IgnoreAspectRatio)
+                painter.end()
+            yield band.copy(0, overlap, width, h)
+
     @classmethod
     @abstractmethod
     def filetype(cls):
@@ -96,7 +323,11 @@ class ImageDiagramExporter(AbstractDiagramExporter):
         :type path: str
         """
         shape = self.diagram.visibleRect(margin=20)
-        pixmap = QtGui.QPixmap(shape.width(), shape.height())
+        if shape.width() * shape.height() > self.TiledArea:
+            self.runTiled(path, shape)
+            return
+
+        pixmap = QtGui.QPixmap(int(shape.width()), int(shape.height()))
         painter = QtGui.QPainter()
 
         if painter.begin(pixmap):
@@ -108,6 +339,31 @@ class ImageDiagramExporter(AbstractDiagramExporter):
             image = pixmap.toImage()
             image.save(path, self.format)
 
+    def runTiled(self, path, shape):
+        """
+        Perform image generation of diagrams too big to be rendered at once: the diagram is rendered in bands,
+        which are streamed into the image file whenever a writer for the image format is available.
+        :type path: str
+        :type shape: QRectF
+        """
+        width = int(shape.width())
+        height = int(shape.height())
+        LOGGER.debug('Rendering %sx%s image of diagram %s in %spx bands', width, height, self.diagram.name, self.BandHeight)
+        writer = self.StreamWriters.get(self.format)
+        if writer:
+            with writer(path, width, height) as stream:
+                for band in self.bands(shape):
+                    stream.write(band)
+        else:
+            # NO STREAMING ENCODER: ASSEMBLE THE BANDS IN A SINGLE IMAGE (NOT BOUNDED BY PIXMAP SIZE LIMITS)
+            image = QtGui.QImage(width, height, QtGui.QImage.Format_RGB32)
+            painter = QtGui.QPainter()
+            if painter.begin(image):
+                for y, band in zip(range(0, height, self.BandHeight), self.bands(shape)):
+                    painter.drawImage(0, y, band)
+                painter.end()
+                image.save(path, self.format)
+
 
 class BmpDiagramExporter(ImageDiagramExporter):
     """
@@ -537,7 +537,9 @@ class OWLOntologyExporterWorker(AbstractWorker):
         self.selected_diagrams = kwargs.get('diagrams', self.project.diagrams())
 
         self._axioms = set()
-        self._converted = dict()
+        self._converted = kwargs.get('cache', self.project.converted_nodes)
+        self._context = ('export', frozenset(self.axiomsList), self.normalize, self.export)
+        self._generated = None
 
         self.df = None
         self.man = None
@@ -557,6 +559,8 @@ class OWLOntologyExporterWorker(AbstractWorker):
         :type axiom: OWLAxiom
         """
         self._axioms.add(axiom)
+        if self._generated is not None:
+            self._generated.append(axiom)
 
     def axioms(self):
         """
@@ -571,44 +575,47 @@ class OWLOntologyExporterWorker(AbstractWorker):
         :type node: AbstractNode
         :rtype: OWLObject
         """
-        if node.diagram.name not in self._converted:
-            self._converted[node.diagram.name] = dict()
-        if node not in self._converted[node.diagram.name]:
-            if node.type() is Item.ConceptNode:
-                self._converted[node.diagram.name][node.id] = self.getConcept(node)
-            elif node.type() is Item.AttributeNode:
-                self._converted[node.diagram.name][node.id] = self.getAttribute(node)
-            elif node.type() is Item.RoleNode:
-                self._converted[node.diagram.name][node.id] = self.getRole(node)
-            elif node.type() is Item.ValueDomainNode:
-                self._converted[node.diagram.name][node.id] = self.getValueDomain(node)
-            elif node.type() is Item.IndividualNode:
-                self._converted[node.diagram.name][node.id] = self.getIndividual(node)
-            elif node.type() is Item.FacetNode:
-                self._converted[node.diagram.name][node.id] = self.getFacet(node)
-            elif node.type() is Item.RoleInverseNode:
-                self._converted[node.diagram.name][node.id] = self.getRoleInverse(node)
-            elif node.type() is Item.RoleChainNode:
-                self._converted[node.diagram.name][node.id] = self.getRoleChain(node)
-            elif node.type() is Item.ComplementNode:
-                self._converted[node.diagram.name][node.id] = self.getComplement(node)
-            elif node.type() is Item.EnumerationNode:
-                self._converted[node.diagram.name][node.id] = self.getEnumeration(node)
-            elif node.type() is Item.IntersectionNode:
-                self._converted[node.diagram.name][node.id] = self.getIntersection(node)
-            elif node.type() in {Item.UnionNode, Item.DisjointUnionNode}:
-                self._converted[node.diagram.name][node.id] = self.getUnion(node)
-            elif node.type() is Item.DatatypeRestrictionNode:
-                self._converted[node.diagram.name][node.id] = self.getDatatypeRestriction(node)
-            elif node.type() is Item.PropertyAssertionNode:
-                self._converted[node.diagram.name][node.id] = self.getPropertyAssertion(node)
-            elif node.type() is Item.DomainRestrictionNode:
-                self._converted[node.diagram.name][node.id] = self.getDomainRestriction(node)
-            elif node.type() is Item.RangeRestrictionNode:
-                self._converted[node.diagram.name][node.id] = self.getRangeRestriction(node)
-            else:
-                raise ValueError('no conversion available for node %s' % node)
-        return self._converted[node.diagram.name][node.id]
+        generation = self._converted.generation
+        try:
+            return self._converted.conversion(node)
+        except KeyError:
+            pass
+        if node.type() is Item.ConceptNode:
+            conversion = self.getConcept(node)
+        elif node.type() is Item.AttributeNode:
+            conversion = self.getAttribute(node)
+        elif node.type() is Item.RoleNode:
+            conversion = self.getRole(node)
+        elif node.type() is Item.ValueDomainNode:
+            conversion = self.getValueDomain(node)
+        elif node.type() is Item.IndividualNode:
+            conversion = self.getIndividual(node)
+        elif node.type() is Item.FacetNode:
+            conversion = self.getFacet(node)
+        elif node.type() is Item.RoleInverseNode:
+            conversion = self.getRoleInverse(node)
+        elif node.type() is Item.RoleChainNode:
+            conversion = self.getRoleChain(node)
+        elif node.type() is Item.ComplementNode:
+            conversion = self.getComplement(node)
+        elif node.type() is Item.EnumerationNode:
+            conversion = self.getEnumeration(node)
+        elif node.type() is Item.IntersectionNode:
+            conversion = self.getIntersection(node)
+        elif node.type() in {Item.UnionNode, Item.DisjointUnionNode}:
+            conversion = self.getUnion(node)
+        elif node.type() is Item.DatatypeRestrictionNode:
+            conversion = self.getDatatypeRestriction(node)
+        elif node.type() is Item.PropertyAssertionNode:
+            conversion = self.getPropertyAssertion(node)
+        elif node.type() is Item.DomainRestrictionNode:
+            conversion = self.getDomainRestriction(node)
+        elif node.type() is Item.RangeRestrictionNode:
+            conversion = self.getRangeRestriction(node)
+        else:
+            raise ValueError('no conversion available for node %s' % node)
+        self._converted.store(node, conversion, generation=generation)
+        return conversion
 
     def converted(self):
         """
@@ -617,6 +624,30 @@ class OWLOntologyExporterWorker(AbstractWorker):
         """
         return self._converted
 
+    def translate(self, item, func):
+        """
+        Generate the OWL 2 axioms of the given item using the given function.
+        Axioms generated by a previous translation are reused, unless the item has been invalidated in the meantime.
+        :type item: AbstractItem
+        :type func: callable
+        """
+        generation = self._converted.generation
+        try:
+            axioms = self._converted.axioms(item, self._context)
+        except KeyError:
+            axioms = None
+        if axioms is not None:
+            for axiom, _ in axioms:
+                self._axioms.add(axiom)
+            return
+        self._generated = []
+        try:
+            func(item)
+            axioms = [(axiom, None) for axiom in self._generated]
+        finally:
+            self._generated = None
+        self._converted.storeAxioms(item, self._context, axioms, generation)
+
     def step(self, num, increase=0):
         """
         Increments the progress by the given step and emits the progress signal.
@@ -1704,6 +1735,139 @@ class OWLOntologyExporterWorker(AbstractWorker):
             conversionB = self.convert(edge.target)
             self.addAxiom(self.df.getOWLSubPropertyChainOfAxiom(conversionA, conversionB))
 
+    def createNodeAxioms(self, node):
+        """
+        Generate the OWL 2 axioms of the given node.
+        :type node: AbstractNode
+        """
+        if node.type() in {Item.ConceptNode, Item.AttributeNode, Item.RoleNode, Item.ValueDomainNode}:
+            self.createDeclarationAxiom(node)
+            if node.type() is Item.AttributeNode:
+                self.createDataPropertyAxiom(node)
+            elif node.type() is Item.RoleNode:
+                self.createObjectPropertyAxiom(node)
+        elif node.type() is Item.DisjointUnionNode:
+            self.createDisjointClassesAxiom(node)
+        elif node.type() is Item.ComplementNode:
+            if node.identity() is Identity.Concept:
+                self.createDisjointClassesAxiom(node)
+        elif node.type() is Item.DomainRestrictionNode:
+            self.createPropertyDomainAxiom(node)
+        elif node.type() is Item.RangeRestrictionNode:
+            self.createPropertyRangeAxiom(node)
+
+        if node.isMeta():
+            if self.export:
+                self.createAnnotationAssertionAxiomRichVersion(node)
+            else:
+                self.createAnnotationAssertionAxiom(node)
+
+    def createEdgeAxioms(self, edge):
+        """
+        Generate the OWL 2 axioms of the given edge.
+        :type edge: AbstractEdge
+        """
+        #############################################
+        # INCLUSION
+        #################################
+
+        if edge.type() is Item.InclusionEdge:
+
+            # CONCEPTS
+            if edge.source.identity() is Identity.Concept and edge.target.identity() is Identity.Concept:
+                self.createSubclassOfAxiom(edge)
+            # ROLES
+            elif edge.source.identity() is Identity.Role and edge.target.identity() is Identity.Role:
+                if edge.source.type() is Item.RoleChainNode:
+                    self.createSubPropertyChainOfAxiom(edge)
+                elif edge.source.type() in {Item.RoleNode, Item.RoleInverseNode}:
+                    if edge.target.type() is Item.ComplementNode:
+                        self.createDisjointObjectPropertiesAxiom(edge)
+                    elif edge.target.type() in {Item.RoleNode, Item.RoleInverseNode}:
+                        self.createSubObjectPropertyOfAxiom(edge)
+            # ATTRIBUTES
+            elif edge.source.identity() is Identity.Attribute and edge.target.identity() is Identity.Attribute:
+                if edge.source.type() is Item.AttributeNode:
+                    if edge.target.type() is Item.ComplementNode:
+                        self.createDisjointDataPropertiesAxiom(edge)
+                    elif edge.target.type() is Item.AttributeNode:
+                        self.createSubDataPropertyOfAxiom(edge)
+            # VALUE DOMAIN (ONLY DATA PROPERTY RANGE)
+            elif edge.source.type() is Item.RangeRestrictionNode and edge.target.identity() is Identity.ValueDomain:
+                # This is being handled already in createPropertyRangeAxiom.
+                pass
+            else:
+                raise DiagramMalformedError(edge, 'invalid inclusion assertion')
+
+        #############################################
+        # EQUIVALENCE
+        #################################
+
+        elif edge.type() is Item.EquivalenceEdge:
+
+            # CONCEPTS
+            if edge.source.identity() is Identity.Concept and edge.target.identity() is Identity.Concept:
+                self.createEquivalentClassesAxiom(edge)
+            # ROLES
+            elif edge.source.identity() is Identity.Role and edge.target.identity() is Identity.Role:
+                if Item.RoleInverseNode in {edge.source.type(), edge.target.type()}:
+                    self.createInverseObjectPropertiesAxiom(edge)
+                else:
+                    self.createEquivalentObjectPropertiesAxiom(edge)
+            # ATTRIBUTES
+            elif edge.source.identity() is Identity.Attribute and edge.target.identity() is Identity.Attribute:
+                self.createEquivalentDataPropertiesAxiom(edge)
+            else:
+                raise DiagramMalformedError(edge, 'invalid equivalence assertion')
+
+        #############################################
+        # MEMBERSHIP
+        #################################
+
+        elif edge.type() is Item.MembershipEdge:
+
+            # CONCEPTS
+            if edge.source.identity() is Identity.Individual and edge.target.identity() is Identity.Concept:
+                self.createClassAssertionAxiom(edge)
+            # ROLES
+            elif edge.source.identity() is Identity.RoleInstance:
+                if edge.target.type() is Item.ComplementNode:
+                    self.createNegativeObjectPropertyAssertionAxiom(edge)
+                else:
+                    self.createObjectPropertyAssertionAxiom(edge)
+            # ATTRIBUTES
+            elif edge.source.identity() is Identity.AttributeInstance:
+                if edge.target.type() is Item.ComplementNode:
+                    self.createNegativeDataPropertyAssertionAxiom(edge)
+                else:
+                    self.createDataPropertyAssertionAxiom(edge)
+            else:
+                raise DiagramMalformedError(edge, 'invalid membership assertion')
+
+        #############################################
+        # SAME
+        #################################
+
+        elif edge.type() is Item.SameEdge:
+            if edge.source.identity() in {Identity.Individual, Identity.Concept, Identity.Role, Identity.Attribute} and \
+               edge.target.identity() in {Identity.Individual, Identity.Concept, Identity.Role, Identity.Attribute} and \
+               edge.source.identity() == edge.target.identity():
+                self.createSameIndividualAxiom(edge)
+            else:
+                raise DiagramMalformedError(edge, 'invalid sameIndividual assertion')
+
+        #############################################
+        # DIFFERENT
+        #################################
+
+        elif edge.type() is Item.DifferentEdge:
+            if edge.source.identity() in {Identity.Individual, Identity.Concept, Identity.Role, Identity.Attribute} and \
+               edge.target.identity() in {Identity.Individual, Identity.Concept, Identity.Role, Identity.Attribute} and \
+               edge.source.identity() == edge.target.identity():
+                self.createDifferentIndividualsAxiom(edge)
+            else:
+                raise DiagramMalformedError(edge, 'invalid differentIndividuals assertion')
+
     #############################################
     #   MAIN WORKER
     #################################
@@ -1771,6 +1935,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
                     self.step(+1)
 
             LOGGER.debug('Pre-processed %s nodes into OWL 2 expressions', len(self.converted()))
+            LOGGER.debug('OWL 2 conversion cache: %s hits, %s misses', self._converted.hits, self._converted.misses)
 
             #############################################
             # AXIOMS FROM NODES
@@ -1779,29 +1944,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
             #for node in self.project.nodes():
             for diagram in self.selected_diagrams:
                 for node in diagram.nodes():
-
-                    if node.type() in {Item.ConceptNode, Item.AttributeNode, Item.RoleNode, Item.ValueDomainNode}:
-                        self.createDeclarationAxiom(node)
-                        if node.type() is Item.AttributeNode:
-                            self.createDataPropertyAxiom(node)
-                        elif node.type() is Item.RoleNode:
-                            self.createObjectPropertyAxiom(node)
-                    elif node.type() is Item.DisjointUnionNode:
-                        self.createDisjointClassesAxiom(node)
-                    elif node.type() is Item.ComplementNode:
-                        if node.identity() is Identity.Concept:
-                            self.createDisjointClassesAxiom(node)
-                    elif node.type() is Item.DomainRestrictionNode:
-                        self.createPropertyDomainAxiom(node)
-                    elif node.type() is Item.RangeRestrictionNode:
-                        self.createPropertyRangeAxiom(node)
-
-                    if node.isMeta():
-                        if self.export:
-                            self.createAnnotationAssertionAxiomRichVersion(node)
-                        else:
-                            self.createAnnotationAssertionAxiom(node)
-
+                    self.translate(node, self.createNodeAxioms)
                     self.step(+1)
 
             LOGGER.debug('Generated OWL 2 axioms from nodes (axioms = %s)', len(self.axioms()))
@@ -1813,108 +1956,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
             #for edge in self.project.edges():
             for diagram in self.selected_diagrams:
                 for edge in diagram.edges():
-
-                    #############################################
-                    # INCLUSION
-                    #################################
-
-                    if edge.type() is Item.InclusionEdge:
-
-                        # CONCEPTS
-                        if edge.source.identity() is Identity.Concept and edge.target.identity() is Identity.Concept:
-                            self.createSubclassOfAxiom(edge)
-                        # ROLES
-                        elif edge.source.identity() is Identity.Role and edge.target.identity() is Identity.Role:
-                            if edge.source.type() is Item.RoleChainNode:
-                                self.createSubPropertyChainOfAxiom(edge)
-                            elif edge.source.type() in {Item.RoleNode, Item.RoleInverseNode}:
-                                if edge.target.type() is Item.ComplementNode:
-                                    self.createDisjointObjectPropertiesAxiom(edge)
-                                elif edge.target.type() in {Item.RoleNode, Item.RoleInverseNode}:
-                                    self.createSubObjectPropertyOfAxiom(edge)
-                        # ATTRIBUTES
-                        elif edge.source.identity() is Identity.Attribute and edge.target.identity() is Identity.Attribute:
-                            if edge.source.type() is Item.AttributeNode:
-                                if edge.target.type() is Item.ComplementNode:
-                                    self.createDisjointDataPropertiesAxiom(edge)
-                                elif edge.target.type() is Item.AttributeNode:
-                                    self.createSubDataPropertyOfAxiom(edge)
-                        # VALUE DOMAIN (ONLY DATA PROPERTY RANGE)
-                        elif edge.source.type() is Item.RangeRestrictionNode and edge.target.identity() is Identity.ValueDomain:
-                            # This is being handled already in createPropertyRangeAxiom.
-                            pass
-                        else:
-                            raise DiagramMalformedError(edge, 'invalid inclusion assertion')
-
-                    #############################################
-                    # EQUIVALENCE
-                    #################################
-
-                    elif edge.type() is Item.EquivalenceEdge:
-
-                        # CONCEPTS
-                        if edge.source.identity() is Identity.Concept and edge.target.identity() is Identity.Concept:
-                            self.createEquivalentClassesAxiom(edge)
-                        # ROLES
-                        elif edge.source.identity() is Identity.Role and edge.target.identity() is Identity.Role:
-                            if Item.RoleInverseNode in {edge.source.type(), edge.target.type()}:
-                                self.createInverseObjectPropertiesAxiom(edge)
-                            else:
-                                self.createEquivalentObjectPropertiesAxiom(edge)
-                        # ATTRIBUTES
-                        elif edge.source.identity() is Identity.Attribute and edge.target.identity() is Identity.Attribute:
-                            self.createEquivalentDataPropertiesAxiom(edge)
-                        else:
-                            raise DiagramMalformedError(edge, 'invalid equivalence assertion')
-
-                    #############################################
-                    # MEMBERSHIP
-                    #################################
-
-                    elif edge.type() is Item.MembershipEdge:
-
-                        # CONCEPTS
-                        if edge.source.identity() is Identity.Individual and edge.target.identity() is Identity.Concept:
-                            self.createClassAssertionAxiom(edge)
-                        # ROLES
-                        elif edge.source.identity() is Identity.RoleInstance:
-                            if edge.target.type() is Item.ComplementNode:
-                                self.createNegativeObjectPropertyAssertionAxiom(edge)
-                            else:
-                                self.createObjectPropertyAssertionAxiom(edge)
-                        # ATTRIBUTES
-                        elif edge.source.identity() is Identity.AttributeInstance:
-                            if edge.target.type() is Item.ComplementNode:
-                                self.createNegativeDataPropertyAssertionAxiom(edge)
-                            else:
-                                self.createDataPropertyAssertionAxiom(edge)
-                        else:
-                            raise DiagramMalformedError(edge, 'invalid membership assertion')
-
-                    #############################################
-                    # SAME
-                    #################################
-
-                    elif edge.type() is Item.SameEdge:
-                        if edge.source.identity() in {Identity.Individual, Identity.Concept, Identity.Role, Identity.Attribute} and \
-                           edge.target.identity() in {Identity.Individual, Identity.Concept, Identity.Role, Identity.Attribute} and \
-                           edge.source.identity() == edge.target.identity():
-                            self.createSameIndividualAxiom(edge)
-                        else:
-                            raise DiagramMalformedError(edge, 'invalid sameIndividual assertion')
-
-                    #############################################
-                    # DIFFERENT
-                    #################################
-
-                    elif edge.type() is Item.DifferentEdge:
-                        if edge.source.identity() in {Identity.Individual, Identity.Concept, Identity.Role, Identity.Attribute} and \
-                           edge.target.identity() in {Identity.Individual, Identity.Concept, Identity.Role, Identity.Attribute} and \
-                           edge.source.identity() == edge.target.identity():
-                            self.createDifferentIndividualsAxiom(edge)
-                        else:
-                            raise DiagramMalformedError(edge, 'invalid differentIndividuals assertion')
-
+                    self.translate(edge, self.createEdgeAxioms)
                     self.step(+1)
 
             LOGGER.debug('Generated OWL 2 axioms from edges (axioms = %s)', len(self.axioms()))
@@ -2023,7 +2065,9 @@ class OWLOntologyFetcher(AbstractWorker):
         self.syntax = kwargs.get('syntax', OWLSyntax.Functional)
 
         self._axioms = set()
-        self._converted = dict()
+        self._converted = kwargs.get('cache', self.project.converted_nodes)
+        self._context = ('fetch', frozenset(self.axiomsList), self.normalize)
+        self._generated = None
 
         self._axiom_to_node_or_edge = dict()
         self.refined_axiom_to_node_or_edge = dict()
@@ -2051,6 +2095,8 @@ class OWLOntologyFetcher(AbstractWorker):
         :type axiom: OWLAxiom
         """
         self._axioms.add(axiom)
+        if self._generated is not None:
+            self._generated.append(axiom)
 
     def axioms(self):
         """
@@ -2061,50 +2107,58 @@ class OWLOntologyFetcher(AbstractWorker):
 
     def convert(self, node, converted_trace):
         """
-        Build and returns the OWL 2 conversion of the given node.
+        Build the OWL 2 conversion of the given node and append it to the given conversion trace,
+        preceded by the nodes and conversions its operands contributed to the trace.
         :type node: AbstractNode
-        :rtype: OWLObject
+        :type converted_trace: list
         """
-        if node.diagram.name not in self._converted:
-            self._converted[node.diagram.name] = dict()
-        if node not in self._converted[node.diagram.name]:
-            if node.type() is Item.ConceptNode:
-                self._converted[node.diagram.name][node.id] = self.getConcept(node, converted_trace)
-            elif node.type() is Item.AttributeNode:
-                self._converted[node.diagram.name][node.id] = self.getAttribute(node, converted_trace)
-            elif node.type() is Item.RoleNode:
-                self._converted[node.diagram.name][node.id] = self.getRole(node, converted_trace)
-            elif node.type() is Item.ValueDomainNode:
-                self._converted[node.diagram.name][node.id] = self.getValueDomain(node, converted_trace)
-            elif node.type() is Item.IndividualNode:
-                self._converted[node.diagram.name][node.id] = self.getIndividual(node, converted_trace)
-            elif node.type() is Item.FacetNode:
-                self._converted[node.diagram.name][node.id] = self.getFacet(node, converted_trace)
-            elif node.type() is Item.RoleInverseNode:
-                self._converted[node.diagram.name][node.id] = self.getRoleInverse(node, converted_trace)
-            elif node.type() is Item.RoleChainNode:
-                self._converted[node.diagram.name][node.id] = self.getRoleChain(node, converted_trace)
-            elif node.type() is Item.ComplementNode:
-                self._converted[node.diagram.name][node.id] = self.getComplement(node, converted_trace)
-            elif node.type() is Item.EnumerationNode:
-                self._converted[node.diagram.name][node.id] = self.getEnumeration(node, converted_trace)
-            elif node.type() is Item.IntersectionNode:
-                self._converted[node.diagram.name][node.id] = self.getIntersection(node, converted_trace)
-            elif node.type() in {Item.UnionNode, Item.DisjointUnionNode}:
-                self._converted[node.diagram.name][node.id] = self.getUnion(node, converted_trace)
-            elif node.type() is Item.DatatypeRestrictionNode:
-                self._converted[node.diagram.name][node.id] = self.getDatatypeRestriction(node, converted_trace)
-            elif node.type() is Item.PropertyAssertionNode:
-                self._converted[node.diagram.name][node.id] = self.getPropertyAssertion(node, converted_trace)
-            elif node.type() is Item.DomainRestrictionNode:
-                self._converted[node.diagram.name][node.id] = self.getDomainRestriction(node, converted_trace)
-            elif node.type() is Item.RangeRestrictionNode:
-                self._converted[node.diagram.name][node.id] = self.getRangeRestriction(node, converted_trace)
-            else:
-                raise ValueError('no conversion available for node %s' % node)
-
-        converted_trace.append(self._converted[node.diagram.name][node.id])
-        #return self._converted[node.diagram.name][node.id]
+        generation = self._converted.generation
+        try:
+            conversion = self._converted.conversion(node, trace=True)
+        except KeyError:
+            pass
+        else:
+            converted_trace.extend(self._converted.trace(node))
+            converted_trace.append(conversion)
+            return
+
+        start = len(converted_trace)
+        if node.type() is Item.ConceptNode:
+            conversion = self.getConcept(node, converted_trace)
+        elif node.type() is Item.AttributeNode:
+            conversion = self.getAttribute(node, converted_trace)
+        elif node.type() is Item.RoleNode:
+            conversion = self.getRole(node, converted_trace)
+        elif node.type() is Item.ValueDomainNode:
+            conversion = self.getValueDomain(node, converted_trace)
+        elif node.type() is Item.IndividualNode:
+            conversion = self.getIndividual(node, converted_trace)
+        elif node.type() is Item.FacetNode:
+            conversion = self.getFacet(node, converted_trace)
+        elif node.type() is Item.RoleInverseNode:
+            conversion = self.getRoleInverse(node, converted_trace)
+        elif node.type() is Item.RoleChainNode:
+            conversion = self.getRoleChain(node, converted_trace)
+        elif node.type() is Item.ComplementNode:
+            conversion = self.getComplement(node, converted_trace)
+        elif node.type() is Item.EnumerationNode:
+            conversion = self.getEnumeration(node, converted_trace)
+        elif node.type() is Item.IntersectionNode:
+            conversion = self.getIntersection(node, converted_trace)
+        elif node.type() in {Item.UnionNode, Item.DisjointUnionNode}:
+            conversion = self.getUnion(node, converted_trace)
+        elif node.type() is Item.DatatypeRestrictionNode:
+            conversion = self.getDatatypeRestriction(node, converted_trace)
+        elif node.type() is Item.PropertyAssertionNode:
+            conversion = self.getPropertyAssertion(node, converted_trace)
+        elif node.type() is Item.DomainRestrictionNode:
+            conversion = self.getDomainRestriction(node, converted_trace)
+        elif node.type() is Item.RangeRestrictionNode:
+            conversion = self.getRangeRestriction(node, converted_trace)
+        else:
+            raise ValueError('no conversion available for node %s' % node)
+        self._converted.store(node, conversion, converted_trace[start:], generation)
+        converted_trace.append(conversion)
 
     def converted(self):
         """
@@ -2113,6 +2167,33 @@ class OWLOntologyFetcher(AbstractWorker):
         """
         return self._converted
 
+    def translate(self, item, func):
+        """
+        Generate the OWL 2 axioms of the given item using the given function.
+        Axioms generated by a previous translation are reused (together with the
+        nodes and edges they map to), unless the item has been invalidated in the meantime.
+        :type item: AbstractItem
+        :type func: callable
+        """
+        generation = self._converted.generation
+        try:
+            axioms = self._converted.axioms(item, self._context)
+        except KeyError:
+            axioms = None
+        if axioms is not None:
+            for axiom, entry in axioms:
+                self._axioms.add(axiom)
+                if entry is not None:
+                    self._axiom_to_node_or_edge[axiom] = entry
+            return
+        self._generated = []
+        try:
+            func(item)
+            axioms = [(axiom, self._axiom_to_node_or_edge.get(axiom)) for axiom in self._generated]
+        finally:
+            self._generated = None
+        self._converted.storeAxioms(item, self._context, axioms, generation)
+
     def step(self, num, increase=0):
         """
         Increments the progress by the given step and emits the progress signal.
@@ -3752,6 +3833,136 @@ class OWLOntologyFetcher(AbstractWorker):
             dict_entry.append(edge)
             self._axiom_to_node_or_edge[axiom_to_add] = dict_entry
 
+    def createNodeAxioms(self, node):
+        """
+        Generate the OWL 2 axioms of the given node.
+        :type node: AbstractNode
+        """
+        if node.type() in {Item.ConceptNode, Item.AttributeNode, Item.RoleNode, Item.ValueDomainNode}:
+            self.createDeclarationAxiom(node)
+            if node.type() is Item.AttributeNode:
+                self.createDataPropertyAxiom(node)
+            elif node.type() is Item.RoleNode:
+                self.createObjectPropertyAxiom(node)
+        elif node.type() is Item.DisjointUnionNode:
+            self.createDisjointClassesAxiom(node)
+        elif node.type() is Item.ComplementNode:
+            if node.identity() is Identity.Concept:
+                self.createDisjointClassesAxiom(node)
+        elif node.type() is Item.DomainRestrictionNode:
+            self.createPropertyDomainAxiom(node)
+        elif node.type() is Item.RangeRestrictionNode:
+            self.createPropertyRangeAxiom(node)
+
+        if node.isMeta():
+            self.createAnnotationAssertionAxiom(node)
+
+    def createEdgeAxioms(self, edge):
+        """
+        Generate the OWL 2 axioms of the given edge.
+        :type edge: AbstractEdge
+        """
+        #############################################
+        # INCLUSION
+        #################################
+
+        if edge.type() is Item.InclusionEdge:
+
+            # CONCEPTS
+            if edge.source.identity() is Identity.Concept and edge.target.identity() is Identity.Concept:
+                self.createSubclassOfAxiom(edge)
+            # ROLES
+            elif edge.source.identity() is Identity.Role and edge.target.identity() is Identity.Role:
+                if edge.source.type() is Item.RoleChainNode:
+                    self.createSubPropertyChainOfAxiom(edge)
+                elif edge.source.type() in {Item.RoleNode, Item.RoleInverseNode}:
+                    if edge.target.type() is Item.ComplementNode:
+                        self.createDisjointObjectPropertiesAxiom(edge)
+                    elif edge.target.type() in {Item.RoleNode, Item.RoleInverseNode}:
+                        self.createSubObjectPropertyOfAxiom(edge)
+            # ATTRIBUTES
+            elif edge.source.identity() is Identity.Attribute and edge.target.identity() is Identity.Attribute:
+                if edge.source.type() is Item.AttributeNode:
+                    if edge.target.type() is Item.ComplementNode:
+                        self.createDisjointDataPropertiesAxiom(edge)
+                    elif edge.target.type() is Item.AttributeNode:
+                        self.createSubDataPropertyOfAxiom(edge)
+            # VALUE DOMAIN (ONLY DATA PROPERTY RANGE)
+            elif edge.source.type() is Item.RangeRestrictionNode and edge.target.identity() is Identity.ValueDomain:
+                # This is being handled already in createPropertyRangeAxiom.
+                pass
+            else:
+                raise DiagramMalformedError(edge, 'invalid inclusion assertion')
+
+        #############################################
+        # EQUIVALENCE
+        #################################
+
+        elif edge.type() is Item.EquivalenceEdge:
+
+            # CONCEPTS
+            if edge.source.identity() is Identity.Concept and edge.target.identity() is Identity.Concept:
+                self.createEquivalentClassesAxiom(edge)
+            # ROLES
+            elif edge.source.identity() is Identity.Role and edge.target.identity() is Identity.Role:
+                if Item.RoleInverseNode in {edge.source.type(), edge.target.type()}:
+                    self.createInverseObjectPropertiesAxiom(edge)
+                else:
+                    self.createEquivalentObjectPropertiesAxiom(edge)
+            # ATTRIBUTES
+            elif edge.source.identity() is Identity.Attribute and edge.target.identity() is Identity.Attribute:
+                self.createEquivalentDataPropertiesAxiom(edge)
+            else:
+                raise DiagramMalformedError(edge, 'invalid equivalence assertion')
+
+        #############################################
+        # MEMBERSHIP
+        #################################
+
+        elif edge.type() is Item.MembershipEdge:
+
+            # CONCEPTS
+            if edge.source.identity() is Identity.Individual and edge.target.identity() is Identity.Concept:
+                self.createClassAssertionAxiom(edge)
+            # ROLES
+            elif edge.source.identity() is Identity.RoleInstance:
+                if edge.target.type() is Item.ComplementNode:
+                    self.createNegativeObjectPropertyAssertionAxiom(edge)
+                else:
+                    self.createObjectPropertyAssertionAxiom(edge)
+            # ATTRIBUTES
+            elif edge.source.identity() is Identity.AttributeInstance:
+                if edge.target.type() is Item.ComplementNode:
+                    self.createNegativeDataPropertyAssertionAxiom(edge)
+                else:
+                    self.createDataPropertyAssertionAxiom(edge)
+            else:
+                raise DiagramMalformedError(edge, 'invalid membership assertion')
+
+        #############################################
+        # SAME
+        #################################
+
+        elif edge.type() is Item.SameEdge:
+            if edge.source.identity() in {Identity.Individual, Identity.Concept, Identity.Role, Identity.Attribute} and \
+                    edge.target.identity() in {Identity.Individual, Identity.Concept, Identity.Role, Identity.Attribute} and \
+                    edge.source.identity() == edge.target.identity():
+                self.createSameIndividualAxiom(edge)
+            else:
+                raise DiagramMalformedError(edge, 'invalid sameIndividual assertion')
+
+        #############################################
+        # DIFFERENT
+        #################################
+
+        elif edge.type() is Item.DifferentEdge:
+            if edge.source.identity() in {Identity.Individual, Identity.Concept, Identity.Role, Identity.Attribute} and \
+                    edge.target.identity() in {Identity.Individual, Identity.Concept, Identity.Role, Identity.Attribute} and \
+                    edge.source.identity() == edge.target.identity():
+                self.createDifferentIndividualsAxiom(edge)
+            else:
+                raise DiagramMalformedError(edge, 'invalid differentIndividuals assertion')
+
     #############################################
     #   MAIN WORKER
     #################################
@@ -3810,36 +4021,27 @@ class OWLOntologyFetcher(AbstractWorker):
                 self.step(+1)
 
             self.project.converted_nodes = self._converted
+            self.project.rebuild_OWL_terms_index()
 
             LOGGER.debug('Pre-processed %s nodes into OWL 2 expressions', len(self.converted()))
+            LOGGER.debug('OWL 2 conversion cache: %s hits, %s misses', self._converted.hits, self._converted.misses)
 
             #############################################
             # AXIOMS FROM NODES
             #################################
 
-            for node in self.project.nodes():
-
-                if node.type() in {Item.ConceptNode, Item.AttributeNode, Item.RoleNode, Item.ValueDomainNode}:
-                    self.createDeclarationAxiom(node)
-                    if node.type() is Item.AttributeNode:
-                        self.createDataPropertyAxiom(node)
-                    elif node.type() is Item.RoleNode:
-                        self.createObjectPropertyAxiom(node)
-                elif node.type() is Item.DisjointUnionNode:
-                    self.createDisjointClassesAxiom(node)
-                elif node.type() is Item.ComplementNode:
-                    if node.identity() is Identity.Concept:
-                        self.createDisjointClassesAxiom(node)
-                elif node.type() is Item.DomainRestrictionNode:
-                    self.createPropertyDomainAxiom(node)
-                elif node.type() is Item.RangeRestrictionNode:
-                    self.createPropertyRangeAxiom(node)
-
-                if node.isMeta():
-                    self.createAnnotationAssertionAxiom(node)
+            nodes = self.project.select(types={
+                Item.AttributeNode, Item.ComplementNode, Item.ConceptNode, Item.DisjointUnionNode,
+                Item.DomainRestrictionNode, Item.IndividualNode, Item.RangeRestrictionNode,
+                Item.RoleNode, Item.ValueDomainNode})
 
+            for node in nodes:
+                self.translate(node, self.createNodeAxioms)
                 self.step(+1)
 
+            ## NODES OF ANY OTHER TYPE DO NOT GENERATE AXIOMS
+            self.step(len(self.project.nodes()) - len(nodes))
+
             LOGGER.debug('Generated OWL 2 axioms from nodes (axioms = %s)', len(self.axioms()))
 
             #############################################
@@ -3847,108 +4049,7 @@ class OWLOntologyFetcher(AbstractWorker):
             #################################
 
             for edge in self.project.edges():
-
-                #############################################
-                # INCLUSION
-                #################################
-
-                if edge.type() is Item.InclusionEdge:
-
-                    # CONCEPTS
-                    if edge.source.identity() is Identity.Concept and edge.target.identity() is Identity.Concept:
-                        self.createSubclassOfAxiom(edge)
-                    # ROLES
-                    elif edge.source.identity() is Identity.Role and edge.target.identity() is Identity.Role:
-                        if edge.source.type() is Item.RoleChainNode:
-                            self.createSubPropertyChainOfAxiom(edge)
-                        elif edge.source.type() in {Item.RoleNode, Item.RoleInverseNode}:
-                            if edge.target.type() is Item.ComplementNode:
-                                self.createDisjointObjectPropertiesAxiom(edge)
-                            elif edge.target.type() in {Item.RoleNode, Item.RoleInverseNode}:
-                                self.createSubObjectPropertyOfAxiom(edge)
-                    # ATTRIBUTES
-                    elif edge.source.identity() is Identity.Attribute and edge.target.identity() is Identity.Attribute:
-                        if edge.source.type() is Item.AttributeNode:
-                            if edge.target.type() is Item.ComplementNode:
-                                self.createDisjointDataPropertiesAxiom(edge)
-                            elif edge.target.type() is Item.AttributeNode:
-                                self.createSubDataPropertyOfAxiom(edge)
-                    # VALUE DOMAIN (ONLY DATA PROPERTY RANGE)
-                    elif edge.source.type() is Item.RangeRestrictionNode and edge.target.identity() is Identity.ValueDomain:
-                        # This is being handled already in createPropertyRangeAxiom.
-                        pass
-                    else:
-                        raise DiagramMalformedError(edge, 'invalid inclusion assertion')
-
-                #############################################
-                # EQUIVALENCE
-                #################################
-
-                elif edge.type() is Item.EquivalenceEdge:
-
-                    # CONCEPTS
-                    if edge.source.identity() is Identity.Concept and edge.target.identity() is Identity.Concept:
-                        self.createEquivalentClassesAxiom(edge)
-                    # ROLES
-                    elif edge.source.identity() is Identity.Role and edge.target.identity() is Identity.Role:
-                        if Item.RoleInverseNode in {edge.source.type(), edge.target.type()}:
-                            self.createInverseObjectPropertiesAxiom(edge)
-                        else:
-                            self.createEquivalentObjectPropertiesAxiom(edge)
-                    # ATTRIBUTES
-                    elif edge.source.identity() is Identity.Attribute and edge.target.identity() is Identity.Attribute:
-                        self.createEquivalentDataPropertiesAxiom(edge)
-                    else:
-                        raise DiagramMalformedError(edge, 'invalid equivalence assertion')
-
-                #############################################
-                # MEMBERSHIP
-                #################################
-
-                elif edge.type() is Item.MembershipEdge:
-
-                    # CONCEPTS
-                    if edge.source.identity() is Identity.Individual and edge.target.identity() is Identity.Concept:
-                        self.createClassAssertionAxiom(edge)
-                    # ROLES
-                    elif edge.source.identity() is Identity.RoleInstance:
-                        if edge.target.type() is Item.ComplementNode:
-                            self.createNegativeObjectPropertyAssertionAxiom(edge)
-                        else:
-                            self.createObjectPropertyAssertionAxiom(edge)
-                    # ATTRIBUTES
-                    elif edge.source.identity() is Identity.AttributeInstance:
-                        if edge.target.type() is Item.ComplementNode:
-                            self.createNegativeDataPropertyAssertionAxiom(edge)
-                        else:
-                            self.createDataPropertyAssertionAxiom(edge)
-                    else:
-                        raise DiagramMalformedError(edge, 'invalid membership assertion')
-
-                #############################################
-                # SAME
-                #################################
-
-                elif edge.type() is Item.SameEdge:
-                    if edge.source.identity() in {Identity.Individual, Identity.Concept, Identity.Role, Identity.Attribute} and \
-                            edge.target.identity() in {Identity.Individual, Identity.Concept, Identity.Role, Identity.Attribute} and \
-                            edge.source.identity() == edge.target.identity():
-                        self.createSameIndividualAxiom(edge)
-                    else:
-                        raise DiagramMalformedError(edge, 'invalid sameIndividual assertion')
-
-                #############################################
-                # DIFFERENT
-                #################################
-
-                elif edge.type() is Item.DifferentEdge:
-                    if edge.source.identity() in {Identity.Individual, Identity.Concept, Identity.Role, Identity.Attribute} and \
-                            edge.target.identity() in {Identity.Individual, Identity.Concept, Identity.Role, Identity.Attribute} and \
-                            edge.source.identity() == edge.target.identity():
-                        self.createDifferentIndividualsAxiom(edge)
-                    else:
-                        raise DiagramMalformedError(edge, 'invalid differentIndividuals assertion')
-
+                self.translate(edge, self.createEdgeAxioms)
                 self.step(+1)
 
             LOGGER.debug('Generated OWL 2 axioms from edges (axioms = %s)', len(self.axioms()))
@@ -0,0 +1,519 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+
+import importlib
+import io
+import multiprocessing
+import os
+import sys
+import time
+
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    as_completed,
+)
+from contextlib import (
+    redirect_stderr,
+    redirect_stdout,
+)
+
+from PyQt5 import (
+    QtCore,
+    QtPrintSupport,
+    QtWidgets,
+)
+
+from eddy import (
+    APPNAME,
+    ORGANIZATION,
+    ORGANIZATION_DOMAIN,
+    VERSION,
+)
+from eddy.core.commandline import CommandLineParser
+from eddy.core.common import (
+    HasDiagramExportSystem,
+    HasProfileSystem,
+    HasProjectExportSystem,
+    HasProjectLoadSystem,
+)
+from eddy.core.datatypes.graphol import Item
+from eddy.core.datatypes.owl import (
+    OWLAxiom,
+    OWLSyntax,
+)
+from eddy.core.datatypes.system import File
+from eddy.core.exporters.graphml import GraphMLDiagramExporter
+from eddy.core.exporters.pdf import PdfProjectExporter
+from eddy.core.functions.fsystem import (
+    fexists,
+    isdir,
+    mkdir,
+)
+from eddy.core.functions.misc import format_exception
+from eddy.core.functions.path import expandPath
+from eddy.core.functions.signals import connect
+from eddy.core.jvm import (
+    findJavaHome,
+    setupJavaEnvironment,
+)
+from eddy.core.loaders.graphol import GrapholProjectLoader_v2
+from eddy.core.output import getLogger
+from eddy.core.plugin import PluginManager
+from eddy.core.profiles.owl2 import OWL2Profile
+from eddy.core.profiles.owl2ql import OWL2QLProfile
+from eddy.core.profiles.owl2rl import OWL2RLProfile
+from eddy.core.project import (
+    ProjectNotFoundError,
+    ProjectNotValidError,
+    ProjectVersionError,
+)
+
+
+LOGGER = getLogger()
+
+ExitSuccess = 0
+ExitFailure = 1
+ExitUsage = 2
+
+OWLFormats = {
+    'owl-functional': OWLSyntax.Functional,
+    'owl-manchester': OWLSyntax.Manchester,
+    'owl-rdf': OWLSyntax.RDF,
+    'owl-turtle': OWLSyntax.Turtle,
+}
+ProjectFormats = {
+    'csv': File.Csv,
+    'pdf': File.Pdf,
+}
+DiagramFormats = {
+    'graphml': File.GraphML,
+}
+
+
+class HeadlessSession(HasDiagramExportSystem, HasProjectExportSystem, HasProjectLoadSystem,
+                      HasProfileSystem, QtCore.QObject):
+    """
+    Extends QtCore.QObject providing a session which loads and exports a project without creating any widget.
+    """
+    def __init__(self, path, **kwargs):
+        """
+        Initialize the headless session loading the project at the given path.
+        :type path: str
+        :type kwargs: dict
+        """
+        super().__init__(**kwargs)
+
+        self.project = None
+
+        self.initProfiles()
+        self.initExporters()
+        self.initLoaders()
+
+        worker = self.createProjectLoader(File.Graphol, path, self)
+        worker.run()
+
+    #############################################
+    #   SESSION CONFIGURATION
+    #################################
+
+    def initExporters(self):
+        """
+        Initialize diagram and project exporters.
+        """
+        self.addProjectExporter(PdfProjectExporter)
+        self.addDiagramExporter(GraphMLDiagramExporter)
+        # THE CSV EXPORTER IS SHIPPED AS A PLUGIN
+        PluginManager.scan('@plugins/')
+        try:
+            module = importlib.import_module('eddy.plugins.csv_exporter')
+        except ImportError:
+            LOGGER.warning('CSV exporter plugin not found: CSV export will not be available')
+        else:
+            self.addProjectExporter(module.CsvExporter)
+
+    def initLoaders(self):
+        """
+        Initialize project loaders.
+        """
+        self.addProjectLoader(GrapholProjectLoader_v2)
+
+    def initProfiles(self):
+        """
+        Initialize the ontology profiles.
+        """
+        self.addProfile(OWL2Profile)
+        self.addProfile(OWL2QLProfile)
+        self.addProfile(OWL2RLProfile)
+
+    #############################################
+    #   SLOTS
+    #################################
+
+    @QtCore.pyqtSlot()
+    def doUpdateState(self):
+        """
+        Executed when the state of the session should be updated (no-op since there is nothing to display).
+        """
+        pass
+
+
+_app = None
+_javaHome = None
+
+
+def setupJava():
+    """
+    Configure the Java environment of the current process, unless it has already been configured.
+    Returns True if a valid Java installation is available, False otherwise.
+    :rtype: bool
+    """
+    global _javaHome
+    if not _javaHome:
+        javaHome = findJavaHome()
+        if not javaHome or not isdir(javaHome):
+            return False
+        setupJavaEnvironment(javaHome)
+        _javaHome = javaHome
+    return True
+
+
+def setupApplication(argv):
+    """
+    Returns the QApplication of the current process, creating it if needed.
+    No window is ever shown by the headless mode, hence no display is required.
+    :type argv: list
+    :rtype: QApplication
+    """
+    global _app
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    _app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(argv)
+    _app.setOrganizationName(ORGANIZATION)
+    _app.setOrganizationDomain(ORGANIZATION_DOMAIN)
+    _app.setApplicationName(APPNAME)
+    _app.setApplicationVersion(VERSION)
+    return _app
+
+
+#############################################
+#   VALIDATION
+#################################
+
+def validate(project):
+    """
+    Perform the syntax validation of the given project, returning the list of detected errors.
+    Similarly to the validation performed before the OWL 2 export, only edges and isolated nodes are validated.
+    :type project: Project
+    :rtype: list
+    """
+    errors = []
+    items = list(project.edges()) + [x for x in project.nodes() if not x.adjacentNodes()]
+    for item in items:
+        if item.isEdge():
+            source = item.source
+            target = item.target
+            pvr = project.profile.checkEdge(source, item, target)
+            if not pvr.isValid():
+                errors.append('{0}: syntax error detected on {1} from {2} to {3}: {4}'.format(
+                    item.diagram.name, describe(item), describe(source), describe(target), pvr.message()))
+        elif item.isNode():
+            pvr = project.profile.checkNode(item)
+            if not pvr.isValid():
+                errors.append('{0}: syntax error detected on {1}: {2}'.format(
+                    item.diagram.name, describe(item), pvr.message()))
+    return errors
+
+
+def describe(item):
+    """
+    Returns a plain text description of the given item.
+    :type item: AbstractItem
+    :rtype: str
+    """
+    if item.type() in {Item.AttributeNode, Item.ConceptNode, Item.RoleNode, Item.ValueDomainNode}:
+        return '{0} {1} ({2})'.format(item.name, item.text().replace('\n', ''), item.id)
+    return '{0} ({1})'.format(item.name, item.id)
+
+
+#############################################
+#   EXPORT
+#################################
+
+def export(session, fmt, output, diagrams, normalize=False):
+    """
+    Export the project loaded in the given session, returning the process exit code.
+    :type session: HeadlessSession
+    :type fmt: str
+    :type output: str
+    :type diagrams: list
+    :type normalize: bool
+    :rtype: int
+    """
+    project = session.project
+
+    if fmt in OWLFormats:
+        output = output or '{0}{1}'.format(project.name, File.Owl.extension)
+        errors = validate(project)
+        if errors:
+            for error in errors:
+                print(error, file=sys.stderr)
+            print('Syntax errors detected: the OWL 2 ontology has not been exported', file=sys.stderr)
+            return ExitFailure
+        if not setupJava():
+            print('Unable to locate a valid Java installation: the OWL 2 ontology cannot be exported', file=sys.stderr)
+            return ExitFailure
+        # IMPORT HERE SO THAT THE JVM IS LOADED ONLY WHEN NEEDED
+        from eddy.core.exporters.owl2 import OWLOntologyExporterWorker
+        failures = []
+        worker = OWLOntologyExporterWorker(project, output,
+                                           axioms=set(OWLAxiom.forProfile(project.profile.type())),
+                                           diagrams=diagrams,
+                                           normalize=normalize,
+                                           syntax=OWLFormats[fmt])
+        connect(worker.sgnErrored, failures.append)
+        worker.run()
+        if failures:
+            print('OWL 2 export failed: {0}'.format(failures[0]), file=sys.stderr)
+            return ExitFailure
+
+    elif fmt in ProjectFormats:
+        filetype = ProjectFormats[fmt]
+        output = output or '{0}{1}'.format(project.name, filetype.extension)
+        exporter = session.projectExporter(filetype)
+        if not exporter:
+            print('Missing {0} exporter'.format(fmt), file=sys.stderr)
+            return ExitFailure
+        if filetype is File.Pdf:
+            worker = exporter(project, session, diagrams=diagrams, pageSize=QtPrintSupport.QPrinter.A4)
+        else:
+            worker = exporter(project, session, diagrams=diagrams)
+        worker.run(output)
+
+    elif fmt in DiagramFormats:
+        filetype = DiagramFormats[fmt]
+        if len(diagrams) > 1 or (output and isdir(output)):
+            directory = output or os.getcwd()
+            mkdir(directory)
+            paths = [os.path.join(directory, '{0}{1}'.format(d.name, filetype.extension)) for d in diagrams]
+        else:
+            paths = [output or '{0}{1}'.format(diagrams[0].name, filetype.extension)]
+        for diagram, path in zip(diagrams, paths):
+            worker = session.createDiagramExporter(filetype, diagram, session)
+            worker.run(path)
+            print(path)
+        return ExitSuccess
+
+    print(output)
+    return ExitSuccess
+
+
+#############################################
+#   BATCH EXPORT
+#################################
+
+class BatchResult(object):
+    """
+    Outcome of the export of a single project performed by the batch driver.
+    """
+    def __init__(self, path, code, elapsed, output):
+        """
+        Initialize the batch result.
+        :type path: str
+        :type code: int
+        :type elapsed: float
+        :type output: str
+        """
+        self.path = path
+        self.code = code
+        self.elapsed = elapsed
+        self.output = output
+
+    def __repr__(self):
+        return 'BatchResult<{0}:{1}:{2:.2f}s>'.format(self.path, self.code, self.elapsed)
+
+
+def projects(directory):
+    """
+    Returns the sorted list of Graphol projects found (recursively) in the given directory.
+    A project is a directory containing a Graphol file with the same name of the directory.
+    :type directory: str
+    :rtype: list
+    """
+    found = []
+    for path, _, _ in os.walk(directory):
+        if fexists(os.path.join(path, '{0}{1}'.format(os.path.basename(path), File.Graphol.extension))):
+            found.append(path)
+    return sorted(found)
+
+
+def batchExportProject(path, fmt, output, normalize):
+    """
+    Export the project at the given path, returning the BatchResult of the export.
+    This function is executed in the worker processes of the batch driver: each of them
+    creates its own QApplication and (if an OWL 2 export is requested) its own JVM.
+    :type path: str
+    :type fmt: str
+    :type output: str
+    :type normalize: bool
+    :rtype: BatchResult
+    """
+    start = time.monotonic()
+    stream = io.StringIO()
+    try:
+        with redirect_stdout(stream), redirect_stderr(stream):
+            setupApplication([APPNAME])
+            session = HeadlessSession(path)
+            diagrams = sorted(session.project.diagrams(), key=lambda x: x.name)
+            if fmt in DiagramFormats:
+                mkdir(output)
+            code = export(session, fmt, output, diagrams, normalize)
+    except Exception as e:
+        stream.write(format_exception(e))
+        code = ExitFailure
+    return BatchResult(path, code, time.monotonic() - start, stream.getvalue())
+
+
+def batchExport(directory, fmt, output, jobs=None, normalize=False):
+    """
+    Export all the projects found in the given directory using a pool of worker processes.
+    Failures are isolated: a project which cannot be exported (even because its worker
+    process died) does not prevent the export of the others.
+    :type directory: str
+    :type fmt: str
+    :type output: str
+    :type jobs: int
+    :type normalize: bool
+    :rtype: list
+    """
+    if fmt in DiagramFormats:
+        extension = ''
+    elif fmt in OWLFormats:
+        extension = File.Owl.extension
+    else:
+        extension = ProjectFormats[fmt].extension
+
+    results = []
+    # SPAWN FRESH PROCESSES: FORKING A PROCESS RUNNING QT (OR A JVM) IS NOT SAFE
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context) as executor:
+        futures = {}
+        for path in projects(directory):
+            target = os.path.join(output, '{0}{1}'.format(os.path.basename(path), extension))
+            futures[executor.submit(batchExportProject, path, fmt, target, normalize)] = path
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                result = BatchResult(futures[future], ExitFailure, 0.0, format_exception(e))
+            results.append(result)
+    return sorted(results, key=lambda x: x.path)
+
+
+#############################################
+#   ENTRY POINT
+#################################
+
+def main(argv):
+    """
+    Headless entry point: process a project according to the given command line, returning the process exit code.
+    :type argv: list
+    :rtype: int
+    """
+    setupApplication(argv)
+
+    options = CommandLineParser()
+    options.process(argv)
+
+    command = options.command()
+    arguments = options.positionalArguments()
+    if len(arguments) != 2:
+        print('Usage: {0} {1} [options] <{2}>'.format(APPNAME.lower(), command,
+              'directory' if command == CommandLineParser.BATCH else 'project'), file=sys.stderr)
+        return ExitUsage
+
+    fmt = options.value(CommandLineParser.FORMAT)
+    if command != CommandLineParser.VALIDATE and fmt not in set(OWLFormats) | set(ProjectFormats) | set(DiagramFormats):
+        print('Unsupported export format: {0}'.format(fmt or '<none>'), file=sys.stderr)
+        return ExitUsage
+
+    if command == CommandLineParser.BATCH:
+        directory = expandPath(arguments[1])
+        if not isdir(directory):
+            print('Unable to find directory: {0}'.format(arguments[1]), file=sys.stderr)
+            return ExitUsage
+        output = expandPath(options.value(CommandLineParser.OUTPUT)) if options.isSet(CommandLineParser.OUTPUT) else os.getcwd()
+        mkdir(output)
+        results = batchExport(directory, fmt, output,
+                              jobs=options.jobs(),
+                              normalize=options.isSet(CommandLineParser.NORMALIZE))
+        for result in results:
+            print('{0} {1:8.2f}s {2}'.format('OK  ' if result.code == ExitSuccess else 'FAIL', result.elapsed, result.path))
+            if result.code != ExitSuccess:
+                print(result.output.rstrip(), file=sys.stderr)
+        failed = len([x for x in results if x.code != ExitSuccess])
+        print('{0} project(s) exported, {1} failed'.format(len(results) - failed, failed))
+        return ExitFailure if failed else ExitSuccess
+
+    path = expandPath(arguments[1])
+    if fexists(path):
+        path = os.path.dirname(path)
+    if not isdir(path):
+        print('Unable to find project: {0}'.format(arguments[1]), file=sys.stderr)
+        return ExitUsage
+
+    try:
+        session = HeadlessSession(path)
+    except (ProjectNotFoundError, ProjectNotValidError, ProjectVersionError) as e:
+        print('Failed to load project {0}: {1}'.format(arguments[1], e), file=sys.stderr)
+        return ExitFailure
+
+    if command == CommandLineParser.VALIDATE:
+        errors = validate(session.project)
+        for error in errors:
+            print(error)
+        return ExitFailure if errors else ExitSuccess
+
+    diagrams = []
+    for name in options.diagrams():
+        diagram = session.project.diagram(name)
+        if not diagram:
+            print('Unable to find diagram: {0}'.format(name), file=sys.stderr)
+            return ExitUsage
+        diagrams.append(diagram)
+
+    return export(session, fmt,
+                  output=expandPath(options.value(CommandLineParser.OUTPUT)) if options.isSet(CommandLineParser.OUTPUT) else None,
+                  diagrams=diagrams or sorted(session.project.diagrams(), key=lambda x: x.name),
+                  normalize=options.isSet(CommandLineParser.NORMALIZE))
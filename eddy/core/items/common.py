@@ -92,6 +92,17 @@ class DiagramItemMixin:
     #   INTERFACE
     #################################
 
+    def isDetailed(self, threshold, painter, option):
+        """
+        Returns True if the element is being painted at a level of detail not lower than the given threshold.
+        Rendering the diagram outside of a view (e.g. when exporting or printing) always happens at full detail.
+        :type threshold: float
+        :type painter: QPainter
+        :type option: QStyleOptionGraphicsItem
+        :rtype: bool
+        """
+        return self.diagram.rendering or option.levelOfDetailFromTransform(painter.worldTransform()) >= threshold
+
     def isEdge(self):
         """
         Returns True if this element is an edge, False otherwise.
@@ -186,8 +197,9 @@ class AbstractItem(QtWidgets.QGraphicsItem, DiagramItemMixin):
             # CASCADE THE EVENT TO EACH CHILD ITEM
             for item in self.childItems():
                 self.diagram.sendEvent(item, event)
-            # UPDATE ITEM OR EDGE
-            self.updateEdgeOrNode()
+            # UPDATE ITEM OR EDGE (UNLESS THE WHOLE DIAGRAM IS GOING TO BE UPDATED LATER)
+            if not self.diagram.stale:
+                self.updateEdgeOrNode()
         return super().sceneEvent(event)
 
     #############################################
@@ -579,6 +591,16 @@ class AbstractLabel(QtWidgets.QGraphicsTextItem, DiagramItemMixin):
         """
         return self._movable
 
+    def paint(self, painter, option, widget=None):
+        """
+        Paint the label in the graphic view (labels are skipped below the text detail threshold).
+        :type painter: QPainter
+        :type option: QStyleOptionGraphicsItem
+        :type widget: QWidget
+        """
+        if self.hasFocus() or self.isDetailed(self.diagram.textDetailThreshold, painter, option):
+            super().paint(painter, option, widget)
+
     def pos(self):
         """
         Returns the position of the label in parent's item coordinates.
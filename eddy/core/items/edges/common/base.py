@@ -57,6 +57,15 @@ class AbstractEdge(AbstractItem):
 
     Prefix = 'e'
 
+    HandleBrush = QtGui.QBrush(QtGui.QColor(66, 165, 245, 255))
+    HandlePen = QtGui.QPen(QtGui.QBrush(QtGui.QColor(0, 0, 0, 255)), 1.1, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)
+    NoBrush = QtGui.QBrush(QtCore.Qt.NoBrush)
+    NoPen = QtGui.QPen(QtCore.Qt.NoPen)
+    SelectionBrush = QtGui.QBrush(QtGui.QColor(248, 255, 72, 255))
+    SelectionInAxiomBrush = QtGui.QBrush(QtGui.QColor(72, 72, 248, 255))
+    SolidBrush = QtGui.QBrush(QtGui.QColor(0, 0, 0, 255))
+    SolidPen = QtGui.QPen(QtGui.QBrush(QtGui.QColor(0, 0, 0, 255)), 1.1, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)
+
     def __init__(self, source, target=None, breakpoints=None, **kwargs):
         """
         Initialize the edge.
@@ -82,6 +91,11 @@ class AbstractEdge(AbstractItem):
         self.mp_BreakPointPos = None
         self.mp_Pos = None
 
+        self.cachedBoundingRect = None
+        self.cachedShapes = {}
+        self.geometryKey = None
+        self.updateKey = (None, None)
+
         self.setAcceptHoverEvents(True)
         self.setCacheMode(AbstractItem.DeviceCoordinateCache)
         self.setFlag(AbstractItem.ItemIsSelectable, True)
@@ -291,6 +305,28 @@ class AbstractEdge(AbstractItem):
                     if (not A.contains(x.p1()) or not A.contains(x.p2())) and \
                         (not B or (not B.contains(x.p1()) or not B.contains(x.p2())))]
 
+    def isGeometryChanged(self, target=None):
+        """
+        Returns True if the geometry of the edge needs to be recomputed, i.e. if any of the endpoints
+        or breakpoints moved (or the endpoints changed shape or depth) since the last time it was computed.
+        :type target: QtCore.QPointF
+        :rtype: bool
+        """
+        # COPY GEOMETRIES WHICH ARE RETURNED BY REFERENCE SO THAT CHANGES MADE IN PLACE ARE DETECTED TOO
+        key = [target and QtCore.QPointF(target)]
+        for node in (self.source, self.target):
+            if node:
+                key.extend((node, node.pos(), QtCore.QRectF(node.boundingRect()),
+                            node.zValue(), QtCore.QPointF(node.anchor(self))))
+        key.extend(QtCore.QPointF(p) for p in self.breakpoints)
+        key = tuple(key)
+        if key != self.geometryKey:
+            self.cachedBoundingRect = None
+            self.cachedShapes = {}
+            self.geometryKey = key
+            return True
+        return False
+
     def isSwapAllowed(self):
         """
         Returns True if this edge can be swapped, False otherwise.
@@ -338,31 +374,42 @@ class AbstractEdge(AbstractItem):
         source = self.source
         target = self.target
 
-        ## ANCHORS (GEOMETRY) --> NB: THE POINTS ARE IN THE ENDPOINTS
-        if source and target:
-            p = source.anchor(self)
-            self.anchors[source] = Polygon(QtCore.QRectF(p.x() - 4, p.y() - 4, 8, 8))
-            p = target.anchor(self)
-            self.anchors[target] = Polygon(QtCore.QRectF(p.x() - 4, p.y() - 4, 8, 8))
+        ## NOTHING TO DO IF NEITHER THE GEOMETRY NOR THE STATE CHANGED SINCE THE LAST UPDATE
+        state = (selected, visible, edge_in_axiom)
+        geometryChanged = self.geometryKey is None or self.geometryKey is not self.updateKey[0]
+        if not geometryChanged and state == self.updateKey[1]:
+            return
+        self.updateKey = (self.geometryKey, state)
+
+        if geometryChanged:
+
+            ## ANCHORS (GEOMETRY) --> NB: THE POINTS ARE IN THE ENDPOINTS
+            if source and target:
+                for node in (source, target):
+                    p = node.anchor(self)
+                    rect = QtCore.QRectF(p.x() - 4, p.y() - 4, 8, 8)
+                    if node in self.anchors:
+                        self.anchors[node].setGeometry(rect)
+                    else:
+                        self.anchors[node] = Polygon(rect)
+
+            ## BREAKPOINTS (GEOMETRY)
+            if len(self.handles) != len(self.breakpoints):
+                self.handles = [Polygon(QtCore.QRectF()) for _ in self.breakpoints]
+            for polygon, p in zip(self.handles, self.breakpoints):
+                polygon.setGeometry(QtCore.QRectF(p.x() - 4, p.y() - 4, 8, 8))
 
-        ## BREAKPOINTS (GEOMETRY)
-        self.handles = [Polygon(QtCore.QRectF(p.x() - 4, p.y() - 4, 8, 8)) for p in self.breakpoints]
+            self.cachedBoundingRect = None
+            self.cachedShapes = {}
 
         ## ANCHORS + BREAKPOINTS + SELECTION (BRUSH + PEN)
         if visible and selected:
-            apBrush = QtGui.QBrush(QtGui.QColor(66, 165, 245, 255))
-            apPen = QtGui.QPen(QtGui.QBrush(QtGui.QColor(0, 0, 0, 255)), 1.1, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)
-            bpBrush = QtGui.QBrush(QtGui.QColor(66, 165, 245, 255))
-            bpPen = QtGui.QPen(QtGui.QBrush(QtGui.QColor(0, 0, 0, 255)), 1.1, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)
-            selectionBrush = QtGui.QBrush(QtGui.QColor(248, 255, 72, 255))
-            if edge_in_axiom is True:
-                selectionBrush = QtGui.QBrush(QtGui.QColor(72, 72, 248, 255))
+            apBrush = bpBrush = self.HandleBrush
+            apPen = bpPen = self.HandlePen
+            selectionBrush = self.SelectionInAxiomBrush if edge_in_axiom is True else self.SelectionBrush
         else:
-            apBrush = QtGui.QBrush(QtCore.Qt.NoBrush)
-            apPen = QtGui.QPen(QtCore.Qt.NoPen)
-            bpBrush = QtGui.QBrush(QtCore.Qt.NoBrush)
-            bpPen = QtGui.QPen(QtCore.Qt.NoPen)
-            selectionBrush = QtGui.QBrush(QtCore.Qt.NoBrush)
+            apBrush = bpBrush = selectionBrush = self.NoBrush
+            apPen = bpPen = self.NoPen
         for polygon in self.anchors.values():
             polygon.setBrush(apBrush)
             polygon.setPen(apPen)
@@ -372,17 +419,18 @@ class AbstractEdge(AbstractItem):
         self.selection.setBrush(selectionBrush)
 
         ## Z-VALUE (DEPTH)
-        try:
-            zValue = max(*(x.zValue() for x in self.collidingItems())) + 0.1
-        except TypeError:
-            zValue = source.zValue() + 0.1
-            if source.label:
-                zValue = max(zValue, source.label.zValue())
-            if target:
-                zValue = max(zValue, target.zValue())
-                if target.label:
-                    zValue = max(zValue, target.label.zValue())
-        self.setZValue(zValue)
+        if geometryChanged:
+            try:
+                zValue = max(*(x.zValue() for x in self.collidingItems())) + 0.1
+            except TypeError:
+                zValue = source.zValue() + 0.1
+                if source.label:
+                    zValue = max(zValue, source.label.zValue())
+                if target:
+                    zValue = max(zValue, target.zValue())
+                    if target.label:
+                        zValue = max(zValue, target.label.zValue())
+            self.setZValue(zValue)
 
         ## FORCE CACHE REGENERATION
         self.setCacheMode(AbstractItem.NoCache)
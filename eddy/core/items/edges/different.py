@@ -66,13 +66,15 @@ class DifferentEdge(AbstractEdge):
         Returns the shape bounding rect.
         :rtype: QRectF
         """
-        path = QtGui.QPainterPath()
-        path.addPath(self.selection.geometry())
-        for polygon in self.handles:
-            path.addEllipse(polygon.geometry())
-        for polygon in self.anchors.values():
-            path.addEllipse(polygon.geometry())
-        return path.controlPointRect()
+        if self.cachedBoundingRect is None:
+            path = QtGui.QPainterPath()
+            path.addPath(self.selection.geometry())
+            for polygon in self.handles:
+                path.addEllipse(polygon.geometry())
+            for polygon in self.anchors.values():
+                path.addEllipse(polygon.geometry())
+            self.cachedBoundingRect = path.controlPointRect()
+        return self.cachedBoundingRect
 
     def copy(self, diagram):
         """
@@ -95,12 +97,16 @@ class DifferentEdge(AbstractEdge):
         """
         # SET THE RECT THAT NEEDS TO BE REPAINTED
         painter.setClipRect(option.exposedRect)
+        # LEVEL OF DETAIL
+        detailed = self.isDetailed(self.diagram.shapeDetailThreshold, painter, option)
         # SELECTION AREA
-        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, detailed)
         painter.fillPath(self.selection.geometry(), self.selection.brush())
         # EDGE LINE
         painter.setPen(self.path.pen())
         painter.drawPath(self.path.geometry())
+        if not detailed:
+            return
         # BREAKPOINTS
         for polygon in self.handles:
             painter.setPen(polygon.pen())
@@ -140,16 +146,18 @@ class DifferentEdge(AbstractEdge):
         Returns the shape of this item as a QPainterPath in local coordinates.
         :rtype: QPainterPath
         """
-        path = QtGui.QPainterPath()
-        path.addPath(self.selection.geometry())
-
-        if self.isSelected():
-            for polygon in self.handles:
-                path.addEllipse(polygon.geometry())
-            for polygon in self.anchors.values():
-                path.addEllipse(polygon.geometry())
-
-        return path
+        selected = self.isSelected()
+        if selected not in self.cachedShapes:
+            path = QtGui.QPainterPath()
+            path.addPath(self.selection.geometry())
+
+            if selected:
+                for polygon in self.handles:
+                    path.addEllipse(polygon.geometry())
+                for polygon in self.anchors.values():
+                    path.addEllipse(polygon.geometry())
+            self.cachedShapes[selected] = path
+        return self.cachedShapes[selected]
 
     def text(self):
         """
@@ -177,6 +185,26 @@ class DifferentEdge(AbstractEdge):
         if visible is None:
             visible = self.canDraw()
 
+        ##########################################
+        # PATH, SELECTION, HEAD, LABEL (GEOMETRY)
+        #################################
+
+        if self.isGeometryChanged(target):
+            self.updatePath(target)
+
+        ##########################################
+        # PATH, HEAD, TAIL (BRUSH)
+        #################################
+
+        self.path.setPen(self.SolidPen if visible else self.NoPen)
+
+        super().updateEdge(selected, visible, breakpoint, anchor, **kwargs)
+
+    def updatePath(self, target=None):
+        """
+        Update the geometry of the edge, computing it from the position of its endpoints and breakpoints.
+        :type target: QtCore.QPointF
+        """
         sourceNode = self.source
         targetNode = self.target
         sourcePos = sourceNode.anchor(self)
@@ -240,16 +268,3 @@ class DifferentEdge(AbstractEdge):
         #################################
 
         self.label.updatePos(points)
-
-        ##########################################
-        # PATH, HEAD, TAIL (BRUSH)
-        #################################
-
-        pathPen = QtGui.QPen(QtCore.Qt.NoPen)
-
-        if visible:
-            pathPen = QtGui.QPen(QtGui.QBrush(QtGui.QColor(0, 0, 0, 255)), 1.1, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)
-
-        self.path.setPen(pathPen)
-
-        super().updateEdge(selected, visible, breakpoint, anchor, **kwargs)
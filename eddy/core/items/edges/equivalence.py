@@ -66,15 +66,17 @@ class EquivalenceEdge(AbstractEdge):
         Returns the shape bounding rect.
         :rtype: QRectF
         """
-        path = QtGui.QPainterPath()
-        path.addPath(self.selection.geometry())
-        path.addPolygon(self.head.geometry())
-        path.addPolygon(self.tail.geometry())
-        for polygon in self.handles:
-            path.addEllipse(polygon.geometry())
-        for polygon in self.anchors.values():
-            path.addEllipse(polygon.geometry())
-        return path.controlPointRect()
+        if self.cachedBoundingRect is None:
+            path = QtGui.QPainterPath()
+            path.addPath(self.selection.geometry())
+            path.addPolygon(self.head.geometry())
+            path.addPolygon(self.tail.geometry())
+            for polygon in self.handles:
+                path.addEllipse(polygon.geometry())
+            for polygon in self.anchors.values():
+                path.addEllipse(polygon.geometry())
+            self.cachedBoundingRect = path.controlPointRect()
+        return self.cachedBoundingRect
 
     def copy(self, diagram):
         """
@@ -125,12 +127,16 @@ class EquivalenceEdge(AbstractEdge):
         """
         # SET THE RECT THAT NEEDS TO BE REPAINTED
         painter.setClipRect(option.exposedRect)
+        # LEVEL OF DETAIL
+        detailed = self.isDetailed(self.diagram.shapeDetailThreshold, painter, option)
         # SELECTION AREA
-        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, detailed)
         painter.fillPath(self.selection.geometry(), self.selection.brush())
         # EDGE LINE
         painter.setPen(self.path.pen())
         painter.drawPath(self.path.geometry())
+        if not detailed:
+            return
         # HEAD POLYGON
         painter.setPen(self.head.pen())
         painter.setBrush(self.head.brush())
@@ -180,16 +186,19 @@ class EquivalenceEdge(AbstractEdge):
         Returns the shape of this item as a QPainterPath in local coordinates.
         :rtype: QPainterPath
         """
-        path = QtGui.QPainterPath()
-        path.addPath(self.selection.geometry())
-        path.addPolygon(self.head.geometry())
-        path.addPolygon(self.tail.geometry())
-        if self.isSelected():
-            for polygon in self.handles:
-                path.addEllipse(polygon.geometry())
-            for polygon in self.anchors.values():
-                path.addEllipse(polygon.geometry())
-        return path
+        selected = self.isSelected()
+        if selected not in self.cachedShapes:
+            path = QtGui.QPainterPath()
+            path.addPath(self.selection.geometry())
+            path.addPolygon(self.head.geometry())
+            path.addPolygon(self.tail.geometry())
+            if selected:
+                for polygon in self.handles:
+                    path.addEllipse(polygon.geometry())
+                for polygon in self.anchors.values():
+                    path.addEllipse(polygon.geometry())
+            self.cachedShapes[selected] = path
+        return self.cachedShapes[selected]
 
     def text(self):
         """
@@ -217,6 +226,30 @@ class EquivalenceEdge(AbstractEdge):
         if visible is None:
             visible = self.canDraw()
 
+        ##########################################
+        # PATH, SELECTION, HEAD, TAIL (GEOMETRY)
+        #################################
+
+        if self.isGeometryChanged(target):
+            self.updatePath(target)
+
+        ##########################################
+        # PATH, HEAD, TAIL (BRUSH)
+        #################################
+
+        self.head.setBrush(self.SolidBrush if visible else self.NoBrush)
+        self.head.setPen(self.SolidPen if visible else self.NoPen)
+        self.path.setPen(self.SolidPen if visible else self.NoPen)
+        self.tail.setBrush(self.SolidBrush if visible else self.NoBrush)
+        self.tail.setPen(self.SolidPen if visible else self.NoPen)
+
+        super().updateEdge(selected, visible, breakpoint, anchor, **kwargs)
+
+    def updatePath(self, target=None):
+        """
+        Update the geometry of the edge, computing it from the position of its endpoints and breakpoints.
+        :type target: QtCore.QPointF
+        """
         sourceNode = self.source
         targetNode = self.target
         sourcePos = sourceNode.anchor(self)
@@ -274,28 +307,3 @@ class EquivalenceEdge(AbstractEdge):
         self.path.setGeometry(path)
         self.head.setGeometry(head)
         self.tail.setGeometry(tail)
-
-        ##########################################
-        # PATH, HEAD, TAIL (BRUSH)
-        #################################
-
-        headBrush = QtGui.QBrush(QtCore.Qt.NoBrush)
-        headPen = QtGui.QPen(QtCore.Qt.NoPen)
-        pathPen = QtGui.QPen(QtCore.Qt.NoPen)
-        tailBrush = QtGui.QBrush(QtCore.Qt.NoBrush)
-        tailPen = QtGui.QPen(QtCore.Qt.NoPen)
-
-        if visible:
-            headBrush = QtGui.QBrush(QtGui.QColor(0, 0, 0, 255))
-            headPen = QtGui.QPen(QtGui.QBrush(QtGui.QColor(0, 0, 0, 255)), 1.1, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)
-            pathPen = QtGui.QPen(QtGui.QBrush(QtGui.QColor(0, 0, 0, 255)), 1.1, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)
-            tailBrush = QtGui.QBrush(QtGui.QColor(0, 0, 0, 255))
-            tailPen = QtGui.QPen(QtGui.QBrush(QtGui.QColor(0, 0, 0, 255)), 1.1, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)
-
-        self.head.setBrush(headBrush)
-        self.head.setPen(headPen)
-        self.path.setPen(pathPen)
-        self.tail.setBrush(tailBrush)
-        self.tail.setPen(tailPen)
-
-        super().updateEdge(selected, visible, breakpoint, anchor, **kwargs)
\ No newline at end of file
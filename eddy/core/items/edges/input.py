@@ -50,12 +50,17 @@ class InputEdge(AbstractEdge):
     """
     Type = Item.InputEdge
 
+    HeadBrush = QtGui.QBrush(QtGui.QColor(252, 252, 252, 255))
+    PathPen = QtGui.QPen(QtGui.QBrush(QtGui.QColor(0, 0, 0, 255)), 1.1, QtCore.Qt.CustomDashLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)
+    PathPen.setDashPattern([5, 5])
+
     def __init__(self, **kwargs):
         """
         Initialize the edge.
         """
         super().__init__(**kwargs)
         self.label = EdgeLabel('', centered=False, parent=self)
+        self.points = []
 
     #############################################
     #   INTERFACE
@@ -66,14 +71,16 @@ class InputEdge(AbstractEdge):
         Returns the shape bounding rect.
         :rtype: QRectF
         """
-        path = QtGui.QPainterPath()
-        path.addPath(self.selection.geometry())
-        path.addPolygon(self.head.geometry())
-        for polygon in self.handles:
-            path.addEllipse(polygon.geometry())
-        for polygon in self.anchors.values():
-            path.addEllipse(polygon.geometry())
-        return path.controlPointRect()
+        if self.cachedBoundingRect is None:
+            path = QtGui.QPainterPath()
+            path.addPath(self.selection.geometry())
+            path.addPolygon(self.head.geometry())
+            for polygon in self.handles:
+                path.addEllipse(polygon.geometry())
+            for polygon in self.anchors.values():
+                path.addEllipse(polygon.geometry())
+            self.cachedBoundingRect = path.controlPointRect()
+        return self.cachedBoundingRect
 
     def copy(self, diagram):
         """
@@ -111,12 +118,16 @@ class InputEdge(AbstractEdge):
         """
         # SET THE RECT THAT NEEDS TO BE REPAINTED
         painter.setClipRect(option.exposedRect)
+        # LEVEL OF DETAIL
+        detailed = self.isDetailed(self.diagram.shapeDetailThreshold, painter, option)
         # SELECTION AREA
-        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, detailed)
         painter.fillPath(self.selection.geometry(), self.selection.brush())
         # EDGE LINE
         painter.setPen(self.path.pen())
         painter.drawPath(self.path.geometry())
+        if not detailed:
+            return
         # HEAD POLYGON
         painter.setPen(self.head.pen())
         painter.setBrush(self.head.brush())
@@ -161,15 +172,18 @@ class InputEdge(AbstractEdge):
         Returns the shape of this item as a QPainterPath in local coordinates.
         :rtype: QPainterPath
         """
-        path = QtGui.QPainterPath()
-        path.addPath(self.selection.geometry())
-        path.addPolygon(self.head.geometry())
-        if self.isSelected():
-            for polygon in self.handles:
-                path.addEllipse(polygon.geometry())
-            for polygon in self.anchors.values():
-                path.addEllipse(polygon.geometry())
-        return path
+        selected = self.isSelected()
+        if selected not in self.cachedShapes:
+            path = QtGui.QPainterPath()
+            path.addPath(self.selection.geometry())
+            path.addPolygon(self.head.geometry())
+            if selected:
+                for polygon in self.handles:
+                    path.addEllipse(polygon.geometry())
+                for polygon in self.anchors.values():
+                    path.addEllipse(polygon.geometry())
+            self.cachedShapes[selected] = path
+        return self.cachedShapes[selected]
 
     def text(self):
         """
@@ -197,6 +211,39 @@ class InputEdge(AbstractEdge):
         if visible is None:
             visible = self.canDraw()
 
+        ##########################################
+        # PATH, SELECTION, HEAD (GEOMETRY)
+        #################################
+
+        if self.isGeometryChanged(target):
+            self.updatePath(target)
+
+        ##########################################
+        # PATH, HEAD (BRUSH)
+        #################################
+
+        self.head.setBrush(self.HeadBrush if visible else self.NoBrush)
+        self.head.setPen(self.SolidPen if visible else self.NoPen)
+        self.path.setPen(self.PathPen if visible else self.NoPen)
+
+        ##########################################
+        # LABEL (POSITION)
+        #################################
+
+        if self.target and self.target.type() in {Item.PropertyAssertionNode, Item.RoleChainNode}:
+            self.label.setVisible(True)
+            self.label.setText(str(self.target.inputs.index(self.id) + 1))
+            self.label.updatePos(self.points)
+        else:
+            self.label.setVisible(False)
+
+        super().updateEdge(selected, visible, breakpoint, anchor, **kwargs)
+
+    def updatePath(self, target=None):
+        """
+        Update the geometry of the edge, computing it from the position of its endpoints and breakpoints.
+        :type target: QtCore.QPointF
+        """
         sourceNode = self.source
         targetNode = self.target
         sourcePos = sourceNode.anchor(self)
@@ -258,34 +305,4 @@ class InputEdge(AbstractEdge):
         self.path.setGeometry(path)
         self.head.setGeometry(head)
         self.selection.setGeometry(selection)
-
-        ##########################################
-        # PATH, HEAD (BRUSH)
-        #################################
-
-        headBrush = QtGui.QBrush(QtCore.Qt.NoBrush)
-        headPen = QtGui.QPen(QtCore.Qt.NoPen)
-        pathPen = QtGui.QPen(QtCore.Qt.NoPen)
-
-        if visible:
-            headBrush = QtGui.QBrush(QtGui.QColor(252, 252, 252, 255))
-            headPen = QtGui.QPen(QtGui.QBrush(QtGui.QColor(0, 0, 0, 255)), 1.1, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)
-            pathPen = QtGui.QPen(QtGui.QBrush(QtGui.QColor(0, 0, 0, 255)), 1.1, QtCore.Qt.CustomDashLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)
-            pathPen.setDashPattern([5, 5])
-
-        self.head.setBrush(headBrush)
-        self.head.setPen(headPen)
-        self.path.setPen(pathPen)
-
-        ##########################################
-        # LABEL (POSITION)
-        #################################
-
-        if self.target and self.target.type() in {Item.PropertyAssertionNode, Item.RoleChainNode}:
-            self.label.setVisible(True)
-            self.label.setText(str(self.target.inputs.index(self.id) + 1))
-            self.label.updatePos(points)
-        else:
-            self.label.setVisible(False)
-
-        super().updateEdge(selected, visible, breakpoint, anchor, **kwargs)
\ No newline at end of file
+        self.points = points
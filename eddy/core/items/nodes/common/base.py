@@ -60,6 +60,7 @@ class AbstractNode(AbstractItem):
         super().__init__(**kwargs)
 
         self._identity = Identity.Neutral
+        self._revision = 0
 
         self.anchors = dict()
         self.edges = set()
@@ -96,6 +97,7 @@ class AbstractNode(AbstractItem):
         :type edge: AbstractEdge
         """
         self.edges.add(edge)
+        self.incrementRevision(structural=True)
 
     def adjacentNodes(self, filter_on_edges=lambda x: True, filter_on_nodes=lambda x: True):
         """
@@ -208,6 +210,19 @@ class AbstractNode(AbstractItem):
                     if (e.target is self or e.type() is Item.EquivalenceEdge) \
                         and filter_on_edges(e)] if filter_on_nodes(x)}
 
+    def incrementRevision(self, structural=False):
+        """
+        Increment the revision of the current node: to be called whenever its identity, inputs or label change.
+        Structural changes (identity, edges and labels) also increment the revision of the diagram, since profile
+        rules may walk the graph beyond the nodes they are given and thus depend on the whole diagram.
+        :type structural: bool
+        """
+        self._revision += 1
+        if structural:
+            diagram = self.diagram
+            if diagram is not None:
+                diagram.revision += 1
+
     def intersection(self, line):
         """
         Returns the intersection of the shape with the given line (in scene coordinates).
@@ -286,6 +301,22 @@ class AbstractNode(AbstractItem):
                     if (e.source is self or e.type() is Item.EquivalenceEdge) \
                         and filter_on_edges(e)] if filter_on_nodes(x)}
 
+    def paintFlat(self, painter):
+        """
+        Paint the node as a flat rectangle (used when the diagram is zoomed out below the shape detail threshold).
+        :type painter: QPainter
+        """
+        geometry = self.polygon.geometry()
+        if not isinstance(geometry, QtCore.QRectF):
+            geometry = geometry.boundingRect()
+        brush = self.polygon.brush()
+        if self.isSelected():
+            brush = self.selection.brush()
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, False)
+        painter.setPen(self.polygon.pen())
+        painter.setBrush(brush)
+        painter.drawRect(geometry)
+
     @abstractmethod
     def painterPath(self):
         """
@@ -314,6 +345,14 @@ class AbstractNode(AbstractItem):
         :type edge: AbstractEdge
         """
         self.edges.discard(edge)
+        self.incrementRevision(structural=True)
+
+    def revision(self):
+        """
+        Returns the revision of the current node.
+        :rtype: int
+        """
+        return self._revision
 
     def setAnchor(self, edge, pos):
         """
@@ -344,7 +383,12 @@ class AbstractNode(AbstractItem):
         """
         if identity not in self.identities():
             identity = Identity.Unknown
-        self._identity = identity
+        if identity is not self._identity:
+            self._identity = identity
+            self.incrementRevision(structural=True)
+            diagram = self.diagram
+            if diagram is not None and diagram.project is not None:
+                diagram.project.index.updateIdentity(diagram, self)
 
     def setPen(self, pen):
         """
@@ -99,6 +99,9 @@ class NodeLabel(AbstractLabel):
         moved = self.isMoved()
         super().setText(text)
         self.updatePos(moved)
+        parent = self.parentItem()
+        if parent is not None:
+            parent.incrementRevision(structural=True)
 
     def updatePos(self, moved=False):
         """
@@ -155,6 +155,10 @@ class RestrictionNode(AbstractNode):
         """
         # SET THE RECT THAT NEEDS TO BE REPAINTED
         painter.setClipRect(option.exposedRect)
+        # LEVEL OF DETAIL
+        if not self.isDetailed(self.diagram.shapeDetailThreshold, painter, option):
+            self.paintFlat(painter)
+            return
         # SELECTION AREA
         painter.setPen(self.selection.pen())
         painter.setBrush(self.selection.brush())
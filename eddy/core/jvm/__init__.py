@@ -35,12 +35,14 @@
 """This module is a thin wrapper around JNI libraries and is intended to abstract the API related to the JVM support"""
 
 import os
+import platform
 import sys
 
 from abc import ABCMeta
 from enum import unique
 
 from eddy.core.datatypes.common import Enum_
+from eddy.core.datatypes.system import File
 from eddy.core.functions.path import expandPath
 from eddy.core.output import getLogger
 
@@ -192,6 +194,42 @@ def findJavaHome():
     return os.getenv('JRE_HOME', os.getenv('JDK_HOME'))
 
 
+def setupJavaEnvironment(javaHome):
+    """
+    Configure the environment and the JVM classpath so that a JVM
+    using the Java installation at the given path can be started.
+
+    :type javaHome: str
+    """
+    os.environ['JAVA_HOME'] = javaHome or ''
+
+    # ADD THE DIRECTORY CONTAINING JVM.DLL TO THE PATH VARIABLE ON WINDOWS
+    if _WIN32:
+        path = os.getenv('PATH', '')
+        path = path.split(os.pathsep)
+        path.insert(0, os.path.join(os.environ['JAVA_HOME'], 'jre', 'bin'))
+        if platform.architecture()[0] == '32bit':
+            path.insert(0, os.path.join(os.environ['JAVA_HOME'], 'jre', 'bin', 'client'))
+        else:
+            path.insert(0, os.path.join(os.environ['JAVA_HOME'], 'jre', 'bin', 'server'))
+        os.environ['PATH'] = os.pathsep.join(path)
+
+    # SET CLASSPATH AND OPTIONS
+    if hasattr(sys, 'frozen'):
+        resources = expandPath('@resources/lib/')
+        if os.path.isdir(resources):
+            for name in os.listdir(resources):
+                path = os.path.join(resources, name)
+                if os.path.isfile(path):
+                    addJVMClasspath(path)
+    else:
+        from pkg_resources import resource_filename, resource_listdir
+        for path in resource_listdir(__name__, 'lib'):
+            if File.forPath(path) is File.Jar:
+                addJVMClasspath(resource_filename(__name__, os.path.join('lib', path)))
+    addJVMOptions('-Xmx512m', '-XX:+DisableExplicitGC')
+
+
 class JavaVM(object):
     """
     Abstract class representing the interface with the Java Virtual Machine.
@@ -241,6 +279,17 @@ class JavaVM(object):
         """
         pass
 
+    def createProxy(self, iname: str, obj: object) -> object:
+        """
+        Returns a Java object implementing the Java interface identified by the canonical name `iname`
+        by delegating its methods to the methods of the given Python object `obj`.
+
+        :type iname: str
+        :type obj: object
+        :rtype: object
+        """
+        pass
+
     def isRunning(self):
         """
         Returns `True` if a JVM instance is already running.
@@ -438,6 +487,17 @@ try:
             """
             return self.jnius.cast(destclass, obj)
 
+        def createProxy(self, iname: str, obj: object) -> object:
+            """
+            Returns a Java object implementing the Java interface identified by the canonical name `iname`
+            by delegating its methods to the methods of the given Python object `obj`.
+
+            :type iname: str
+            :type obj: object
+            :rtype: object
+            """
+            raise JVMError('jnius: Cannot implement {0}: proxies of Python objects are not supported'.format(iname))
+
         def addOptions(self, *opts):
             """
             Append options to the list of JVM start-up options
@@ -611,6 +671,17 @@ try:
             """
             return obj
 
+        def createProxy(self, iname, obj):
+            """
+            Returns a Java object implementing the Java interface identified by the canonical name `iname`
+            by delegating its methods to the methods of the given Python object `obj`.
+
+            :type iname: str
+            :type obj: object
+            :rtype: object
+            """
+            return self.jpype.JProxy(iname, inst=obj)
+
         def isThreadAttachedToJVM(self):
             """
             Returns True if the current python thread is attached to the JVM thread, and False otherwise.
@@ -44,6 +44,8 @@ class AbstractLoader(QtCore.QObject):
     """
     __metaclass__ = ABCMeta
 
+    sgnProgress = QtCore.pyqtSignal(int, int)
+
     def __init__(self, path, session):
         """
         Initialize the AbstractLoader.
@@ -682,6 +682,7 @@ class GraphMLOntologyLoader(AbstractOntologyLoader):
         name = os.path.basename(self.path)
         name = rstrip(name, File.GraphML.extension)
         self.diagram = Diagram.create(name, Diagram.MaxSize, self.nproject)
+        self.diagram.stale = True
 
         root = self.document.documentElement()
         graph = root.firstChildElement('graph')
@@ -736,9 +737,7 @@ class GraphMLOntologyLoader(AbstractOntologyLoader):
         nodes = [n for n in self.nodes.values() if Identity.Neutral in n.identities()]
         if nodes:
             LOGGER.debug('Running identification algorithm for %s nodes', len(nodes))
-            for node in nodes:
-                QtWidgets.QApplication.processEvents()
-                self.diagram.sgnNodeIdentification.emit(node)
+            self.diagram.identifyNodes(nodes)
 
         LOGGER.debug('Diagram created: %s', self.diagram.name)
 
@@ -838,11 +837,11 @@ class GraphMLOntologyLoader(AbstractOntologyLoader):
     def projectRender(self):
         """
         Render all the elements in the new project ontology.
+        Items are updated lazily, when their diagram is first displayed or exported (see Diagram.updateItems).
         """
-        LOGGER.debug('Refreshing project "%s" elements state', self.nproject.name)
-        for item in self.nproject.items():
-            QtWidgets.QApplication.processEvents()
-            item.updateEdgeOrNode()
+        LOGGER.debug('Marking project "%s" elements state as stale', self.nproject.name)
+        for diagram in self.nproject.diagrams():
+            diagram.stale = True
 
     #############################################
     #   INTERFACE
@@ -623,8 +623,7 @@ class GrapholDiagramLoader_v1(AbstractDiagramLoader):
         nodes = [n for n in self.nodes.values() if Identity.Neutral in n.identities()]
         if nodes:
             LOGGER.debug('Loaders >> Graphol >> Running identification algorithm for %s nodes', len(nodes))
-            for node in nodes:
-                self.diagram.sgnNodeIdentification.emit(node)
+            self.diagram.identifyNodes(nodes)
 
         #############################################
         # CONFIGURE DIAGRAM SIGNALS
@@ -964,8 +963,15 @@ class GrapholLoaderMixin_v2(object):
         super().__init__(**kwargs)
 
         self.buffer = dict()
+        self.chunk = 1 << 16
+        self.IRI_nodes_string_index = None
         self.document = None
+        self.file = None
         self.nproject = None
+        self.offset = 0
+        self.reader = None
+        self.section = None
+        self.sections = dict()
 
         self.itemFromXml = {
             'attribute': Item.AttributeNode,
@@ -1529,74 +1535,41 @@ class GrapholLoaderMixin_v2(object):
     #   ONTOLOGY DIAGRAMS : MAIN IMPORT
     #################################
 
-    def importDiagram(self, e, i):
+    def importDiagram(self, i):
         """
-        Create a diagram from the given QDomElement.
-        :type e: QDomElement
+        Create a diagram from the 'diagram' element the stream reader is positioned on.
+        Nodes are created as soon as they are parsed, while edges are buffered until
+        the end of the diagram element, so that all of their endpoints are available.
         :type i: int
         :rtype: Diagram
         """
-        QtWidgets.QApplication.processEvents()
         ## PARSE DIAGRAM INFORMATION
-        name = e.attribute('name', 'diagram_{0}'.format(i))
-        size = max(int(e.attribute('width', '10000')), int(e.attribute('height', '10000')))
+        attributes = self.reader.attributes()
+        name = attributes.value('name') if attributes.hasAttribute('name') else 'diagram_{0}'.format(i)
+        size = max(int(attributes.value('width') or '10000'), int(attributes.value('height') or '10000'))
         ## CREATE NEW DIAGRAM
         LOGGER.info('Loading diagram: %s', name)
         diagram = Diagram.create(name, size, self.nproject)
+        diagram.stale = True
         self.buffer[diagram.name] = dict()
         ## LOAD DIAGRAM NODES
-        sube = e.firstChildElement('node')
-        while not sube.isNull():
-            try:
-                QtWidgets.QApplication.processEvents()
-                item = self.itemFromXmlNode(sube)
-                func = self.importFuncForItem[item]
-                node = func(diagram, sube)
-            except Exception:
-                LOGGER.exception('Failed to create node %s', sube.attribute('id'))
+        edges = []
+        while self.reader.readNextStartElement():
+            if self.reader.name() == 'node':
+                self.importDiagramNode(diagram, self.readElement())
+            elif self.reader.name() == 'edge':
+                edges.append(self.readElement())
             else:
-                if (('AttributeNode' in str(type(node))) or ('ConceptNode' in str(type(node))) or (
-                        'IndividualNode' in str(type(node))) or ('RoleNode' in str(type(node)))):
-
-                    iri_to_set = self.get_iri_of_node_from_string_format_in_dict(node)
-
-                    if iri_to_set is None:
-                        LOGGER.critical('IRI of node not found in Dictionary - ' + str(node))
-                        if self.nproject.iri is not None:
-                            self.nproject.IRI_prefixes_nodes_dict[self.nproject.iri][1].add(node)
-                            new_text = GenerateNewLabel(self.nproject, node).return_label()
-                            node.setText(new_text)
-                    else:
-                        self.nproject.IRI_prefixes_nodes_dict[iri_to_set][1].add(node)
-                        self.nproject.IRI_prefixes_nodes_dict[iri_to_set][1].remove(str(node))
-
-                diagram.addItem(node)
-                diagram.guid.update(node.id)
-                self.buffer[diagram.name][node.id] = node
-            finally:
-                sube = sube.nextSiblingElement('node')
+                self.reader.skipCurrentElement()
+            self.progress()
         ## LOAD DIAGRAM EDGES
-        sube = e.firstChildElement('edge')
-        while not sube.isNull():
-            try:
-                QtWidgets.QApplication.processEvents()
-                item = self.itemFromXmlNode(sube)
-                func = self.importFuncForItem[item]
-                edge = func(diagram, sube)
-            except Exception:
-                LOGGER.exception('Failed to create edge %s', sube.attribute('id'))
-            else:
-                diagram.addItem(edge)
-                diagram.guid.update(edge.id)
-                self.buffer[diagram.name][edge.id] = edge
-            finally:
-                sube = sube.nextSiblingElement('edge')
+        for e in edges:
+            self.importDiagramEdge(diagram, e)
         ## IDENTIFY NEUTRAL NODES
         nodes = [x for x in diagram.items(edges=False) if Identity.Neutral in x.identities()]
         if nodes:
             LOGGER.debug('Running identification algorithm for %s nodes', len(nodes))
-            for node in nodes:
-                diagram.sgnNodeIdentification.emit(node)
+            diagram.identifyNodes(nodes)
         ## CONFIGURE DIAGRAM SIGNALS
         connect(diagram.sgnItemAdded, self.nproject.doAddItem)
         connect(diagram.sgnItemRemoved, self.nproject.doRemoveItem)
@@ -1604,6 +1577,58 @@ class GrapholLoaderMixin_v2(object):
         ## RETURN GENERATED DIAGRAM
         return diagram
 
+    def importDiagramEdge(self, d, e):
+        """
+        Create an edge from the given QDomElement and add it to the given diagram.
+        :type d: Diagram
+        :type e: QDomElement
+        """
+        try:
+            item = self.itemFromXmlNode(e)
+            func = self.importFuncForItem[item]
+            edge = func(d, e)
+        except Exception:
+            LOGGER.exception('Failed to create edge %s', e.attribute('id'))
+        else:
+            d.addItem(edge)
+            d.guid.update(edge.id)
+            self.buffer[d.name][edge.id] = edge
+
+    def importDiagramNode(self, d, e):
+        """
+        Create a node from the given QDomElement and add it to the given diagram.
+        :type d: Diagram
+        :type e: QDomElement
+        """
+        try:
+            item = self.itemFromXmlNode(e)
+            func = self.importFuncForItem[item]
+            node = func(d, e)
+        except Exception:
+            LOGGER.exception('Failed to create node %s', e.attribute('id'))
+        else:
+            if (('AttributeNode' in str(type(node))) or ('ConceptNode' in str(type(node))) or (
+                    'IndividualNode' in str(type(node))) or ('RoleNode' in str(type(node)))):
+
+                iri_to_set = self.get_iri_of_node_from_string_format_in_dict(node)
+
+                if iri_to_set is None:
+                    LOGGER.critical('IRI of node not found in Dictionary - ' + str(node))
+                    if self.nproject.iri is not None:
+                        self.nproject.IRI_prefixes_nodes_dict[self.nproject.iri][1].add(node)
+                        self.nproject.add_node_to_IRI_nodes_index(self.nproject.iri, node)
+                        new_text = GenerateNewLabel(self.nproject, node).return_label()
+                        node.setText(new_text)
+                else:
+                    self.nproject.IRI_prefixes_nodes_dict[iri_to_set][1].add(node)
+                    self.nproject.IRI_prefixes_nodes_dict[iri_to_set][1].remove(str(node))
+                    self.nproject.add_node_to_IRI_nodes_index(iri_to_set, node)
+                    self.IRI_nodes_string_index[str(node)].remove(iri_to_set)
+
+            d.addItem(node)
+            d.guid.update(node.id)
+            self.buffer[d.name][node.id] = node
+
     def importMeta(self, e):
         """
         Create predicate metadata from the given QDomElement.
@@ -1611,7 +1636,6 @@ class GrapholLoaderMixin_v2(object):
         :rtype: tuple
         """
         try:
-            QtWidgets.QApplication.processEvents()
             item = self.itemFromXml[e.attribute('type')]
             func = self.importMetaFuncForItem[item]
             meta = func(e)
@@ -1636,41 +1660,137 @@ class GrapholLoaderMixin_v2(object):
         except KeyError:
             return None
 
+    def progress(self):
+        """
+        Report the loading progress using the byte offset reached in the project file.
+        Progress is reported (and pending UI events are processed) at most once per chunk.
+        """
+        offset = self.file.pos()
+        if offset - self.offset >= self.chunk or offset >= self.file.size():
+            self.offset = offset
+            self.sgnProgress.emit(offset, self.file.size())
+            QtWidgets.QApplication.processEvents()
+
+    def readElement(self):
+        """
+        Build a QDomElement out of the element the stream reader is positioned on.
+        The stream reader is left at the end of the element.
+        :rtype: QDomElement
+        """
+        stack = [self.document.createElement(self.reader.name())]
+        for attribute in self.reader.attributes():
+            stack[-1].setAttribute(attribute.name(), attribute.value())
+        while stack:
+            token = self.reader.readNext()
+            if token == QtCore.QXmlStreamReader.StartElement:
+                element = self.document.createElement(self.reader.name())
+                for attribute in self.reader.attributes():
+                    element.setAttribute(attribute.name(), attribute.value())
+                stack[-1].appendChild(element)
+                stack.append(element)
+            elif token == QtCore.QXmlStreamReader.Characters:
+                if not self.reader.isWhitespace():
+                    stack[-1].appendChild(self.document.createTextNode(self.reader.text()))
+            elif token == QtCore.QXmlStreamReader.EndElement:
+                element = stack.pop()
+            elif token == QtCore.QXmlStreamReader.Invalid:
+                raise ProjectNotValidError('invalid project ontology supplied: %s (%s)' % (
+                    self.path, self.reader.errorString()))
+        return element
+
+    def readSection(self, name):
+        """
+        Returns the QDomElement matching the given top level section of the project file.
+        A null QDomElement is returned if the section is missing.
+        :type name: str
+        :rtype: QDomElement
+        """
+        if name not in self.sections and self.seekSection(name):
+            self.sections[name] = self.readElement()
+            self.section = None
+        return self.sections.pop(name, QtXml.QDomElement())
+
+    def seekSection(self, name):
+        """
+        Move the stream reader to the start of the given top level section of the project file.
+        Sections found on the way are buffered, except for 'diagrams', which is never read
+        in memory: if it is found the stream reader stops there and False is returned.
+        :type name: str
+        :rtype: bool
+        """
+        while True:
+            if self.section is None:
+                if not self.reader.readNextStartElement():
+                    if self.reader.hasError():
+                        raise ProjectNotValidError('invalid project ontology supplied: %s (%s)' % (
+                            self.path, self.reader.errorString()))
+                    return False
+                self.section = self.reader.name()
+            if self.section == name:
+                return True
+            if self.section == 'diagrams':
+                return False
+            self.sections[self.section] = self.readElement()
+            self.section = None
+
     #############################################
     #   MAIN IMPORT
     #################################
 
+    def closeStreamReader(self):
+        """
+        Release the stream reader and the project file it reads from.
+        """
+        if self.file:
+            self.file.close()
+        self.file = None
+        self.reader = None
+        self.section = None
+        self.sections.clear()
+
     def createDiagrams(self):
         """
-        Create ontology diagrams by parsing the 'diagrams' section of the QDomDocument.
+        Create ontology diagrams by streaming the 'diagrams' section of the project file.
         """
         counter = 1
-        section = self.document.documentElement().firstChildElement('diagrams')
-        element = section.firstChildElement('diagram')
-        while not element.isNull():
-            self.nproject.addDiagram(self.importDiagram(element, counter))
-            element = element.nextSiblingElement('diagram')
-            counter += 1
+        while self.seekSection('diagrams'):
+            while self.reader.readNextStartElement():
+                if self.reader.name() == 'diagram':
+                    self.nproject.addDiagram(self.importDiagram(counter))
+                    counter += 1
+                else:
+                    self.reader.skipCurrentElement()
+            self.section = None
 
-    def createDomDocument(self):
+    def createStreamReader(self):
         """
-        Create the QDomDocument from where to parse Project information.
+        Create the stream reader from where to parse Project information.
         """
         if not fexists(self.path):
             raise ProjectNotFoundError('missing project ontology: %s' % self.path)
-        self.document = QtXml.QDomDocument()
-        if File.forPath(self.path) is not File.Graphol or not self.document.setContent(fread(self.path)):
+        if File.forPath(self.path) is not File.Graphol:
             raise ProjectNotValidError('invalid project ontology supplied: %s' % self.path)
-        e = self.document.documentElement()
-        version = int(e.attribute('version', '2'))
-        if version != 2:
-            raise ProjectVersionError('project version mismatch: %s != 2' % version)
+        self.document = QtXml.QDomDocument()
+        self.file = QtCore.QFile(self.path)
+        if not self.file.open(QtCore.QIODevice.ReadOnly):
+            raise ProjectNotValidError('unable to read project ontology: %s' % self.path)
+        self.offset = 0
+        self.reader = QtCore.QXmlStreamReader(self.file)
+        try:
+            if not self.reader.readNextStartElement():
+                raise ProjectNotValidError('invalid project ontology supplied: %s' % self.path)
+            version = int(self.reader.attributes().value('version') or '2')
+            if version != 2:
+                raise ProjectVersionError('project version mismatch: %s != 2' % version)
+        except Exception as e:
+            self.closeStreamReader()
+            raise e
 
     def createPredicatesMeta(self):
         """
-        Create ontology predicate metadata by parsing the 'predicates' section of the QDomDocument.
+        Create ontology predicate metadata by parsing the 'predicates' section of the project file.
         """
-        section = self.document.documentElement().firstChildElement('predicates')
+        section = self.readSection('predicates')
         element = section.firstChildElement('predicate')
 
         all_predicate_nodes_in_project_text = set()
@@ -1679,7 +1799,6 @@ class GrapholLoaderMixin_v2(object):
             all_predicate_nodes_in_project_text.add(n.text().replace('\n', ''))
 
         while not element.isNull():
-            QtWidgets.QApplication.processEvents()
             meta = self.importMeta(element)
             if meta:
                 if meta[1] in all_predicate_nodes_in_project_text:
@@ -1716,24 +1835,38 @@ class GrapholLoaderMixin_v2(object):
 
             self.nproject.IRI_prefixes_nodes_dict[iri][1] = new_nodes
 
-    def get_iri_of_node_from_string_format_in_dict(self, node_inp):
+        self.nproject.invalidate_IRI_nodes_index()
 
+    def build_IRI_nodes_string_index(self):
+        """
+        Build the index mapping each serialized node string found in IRI_prefixes_nodes_dict
+        to the list of IRIs whose node set contains it (in dictionary order).
+        """
+        self.IRI_nodes_string_index = dict()
         for iri in self.nproject.IRI_prefixes_nodes_dict.keys():
-            str_of_nodes = self.nproject.IRI_prefixes_nodes_dict[iri][1]
-            # print('iri',iri)
-            for n in str_of_nodes:
-                # print('     n',n)
-                if (str(node_inp) == n):
-                    return iri
+            for n in self.nproject.IRI_prefixes_nodes_dict[iri][1]:
+                if isinstance(n, str):
+                    self.IRI_nodes_string_index.setdefault(n, []).append(iri)
 
-        return None
+    def get_iri_of_node_from_string_format_in_dict(self, node_inp):
+        """
+        Returns the first IRI whose node set contains the serialized form of the given node.
+        :type node_inp: AbstractNode
+        :rtype: str
+        """
+        if self.IRI_nodes_string_index is None:
+            self.build_IRI_nodes_string_index()
+        iris = self.IRI_nodes_string_index.get(str(node_inp))
+        return iris[0] if iris else None
 
     def convert_string_of_nodes_to_nodes(self):
 
         LOGGER.debug(
             'GrapholLoaderMixin_v2 >>> Convert nodes from string format to eddy nodes format in IRI-Prefixes dictionary')
 
-        nodes_in_project = self.nproject.nodes()
+        nodes_in_project = dict()
+        for node in self.nproject.nodes():
+            nodes_in_project.setdefault(str(node), node)
 
         IRI_prefixes_nodes_dict_old = self.nproject.IRI_prefixes_nodes_dict
 
@@ -1785,12 +1918,9 @@ class GrapholLoaderMixin_v2(object):
 
                 if str(type(node_str_or_just_node)) == '<class \'str\'>':
                     # print('         TE 1')
-                    node_str = node_str_or_just_node
-                    for node in nodes_in_project:
-                        if node_str == str(node):
-                            # print('         T 2')
-                            new_nodes_entry.add(node)
-                            break
+                    node = nodes_in_project.get(node_str_or_just_node)
+                    if node is not None:
+                        new_nodes_entry.add(node)
                 else:
                     node = node_str_or_just_node
                     new_nodes_entry.add(node)
@@ -1806,9 +1936,9 @@ class GrapholLoaderMixin_v2(object):
 
     def createProject(self):
         """
-        Create the Project by reading data from the parsed QDomDocument.
+        Create the Project by reading data from the 'ontology' section of the project file.
         """
-        section = self.document.documentElement().firstChildElement('ontology')
+        section = self.readSection('ontology')
 
         def parse(tag, default='NULL'):
             """
@@ -1873,15 +2003,17 @@ class GrapholLoaderMixin_v2(object):
         # print('self.nproject.iri', self.nproject.iri)
         # self.nproject.print_dictionary(self.nproject.IRI_prefixes_nodes_dict)
 
+        self.build_IRI_nodes_string_index()
+
         LOGGER.info('Loaded ontology: %s...', self.nproject.name)
 
     def projectRender(self):
         """
         Render all the elements in the Project ontology.
+        Items are updated lazily, when their diagram is first displayed or exported (see Diagram.updateItems).
         """
-        for item in self.nproject.items():
-            QtWidgets.QApplication.processEvents()
-            item.updateEdgeOrNode()
+        for diagram in self.nproject.diagrams():
+            diagram.stale = True
 
 
 class GrapholOntologyLoader_v2(AbstractOntologyLoader, GrapholLoaderMixin_v2):
@@ -1921,13 +2053,16 @@ class GrapholOntologyLoader_v2(AbstractOntologyLoader, GrapholLoaderMixin_v2):
         """
         Perform ontology import from Graphol file format and merge the loaded ontology with the current project.
         """
-        self.createDomDocument()
-        self.createProject()
-        self.createDiagrams()
+        self.createStreamReader()
+        try:
+            self.createProject()
+            self.createDiagrams()
 
-        self.remove_invalid_nodes_from_the_dict()
+            self.remove_invalid_nodes_from_the_dict()
 
-        self.createPredicatesMeta()
+            self.createPredicatesMeta()
+        finally:
+            self.closeStreamReader()
 
         self.projectRender()
         self.projectMerge()
@@ -1981,15 +2116,18 @@ class GrapholProjectLoader_v2(AbstractProjectLoader, GrapholLoaderMixin_v2):
         Perform project import.
         """
         try:
-            self.createDomDocument()
+            self.createStreamReader()
         except (ProjectNotFoundError, ProjectVersionError):
             self.createLegacyProject()
         else:
-            self.createProject()
-            self.createDiagrams()
+            try:
+                self.createProject()
+                self.createDiagrams()
 
-            self.remove_invalid_nodes_from_the_dict()
+                self.remove_invalid_nodes_from_the_dict()
 
-            self.createPredicatesMeta()
+                self.createPredicatesMeta()
+            finally:
+                self.closeStreamReader()
             self.projectRender()
             self.projectLoaded()
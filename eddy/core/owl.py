@@ -32,6 +32,8 @@
 #                                                                        #
 ##########################################################################
 
+import threading
+
 from PyQt5 import QtCore
 from PyQt5 import QtXmlPatterns
 
@@ -39,7 +41,9 @@ from rfc3987 import compose
 from rfc3987 import parse
 from rfc3987 import resolve
 
+from eddy.core.datatypes.graphol import Identity, Item
 from eddy.core.datatypes.owl import Namespace
+from eddy.core.functions.graph import bfs
 
 
 class IRI(QtCore.QObject):
@@ -397,6 +401,259 @@ class PrefixManager(QtCore.QObject):
         return str(self)
 
 
+class OWLConversionCache(dict):
+    """
+    Extends built-in dict to cache the OWL 2 conversion of graphol nodes.
+    Conversions are stored by diagram name and node id (i.e. cache[diagram.name][node.id]),
+    optionally together with the conversion trace generated by the ontology fetcher.
+    The cache also stores the axioms generated by each item, so that a translation
+    of the project only needs to process the items which changed since the last one.
+    The cache version is increased whenever a conversion is stored or discarded.
+    Cached data is discarded from the GUI thread while workers may be storing new data: the cache
+    generation is increased whenever cached data is discarded, and workers store data together with
+    the generation read before computing it, so that data computed before a change is never stored after it.
+    """
+    def __init__(self):
+        """
+        Initialize the conversion cache.
+        """
+        super().__init__()
+        self.generation = 0
+        self.hits = 0
+        self.lock = threading.RLock()
+        self.misses = 0
+        self.traces = dict()
+        self.itemAxioms = dict()
+        self.version = 0
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def clear(self):
+        """
+        Removes all the cached conversions and resets the hit/miss counters.
+        """
+        with self.lock:
+            super().clear()
+            self.traces.clear()
+            self.itemAxioms.clear()
+            self.hits = 0
+            self.misses = 0
+            self.version += 1
+            self.generation += 1
+
+    def conversion(self, node, trace=False):
+        """
+        Returns the cached conversion of the given node, raising KeyError on cache miss.
+        If trace is True, conversions stored without a conversion trace are treated as a miss.
+        :type node: AbstractNode
+        :type trace: bool
+        :rtype: OWLObject
+        """
+        try:
+            conversion = self[node.diagram.name][node.id]
+            if trace and (node.diagram.name, node.id) not in self.traces:
+                raise KeyError(node.id)
+        except KeyError:
+            self.misses += 1
+            raise
+        else:
+            self.hits += 1
+            return conversion
+
+    def axioms(self, item, context):
+        """
+        Returns the axioms generated by the given item in the given translation context, raising KeyError if there are none.
+        The returned list contains (axiom, entry) pairs, where entry is any additional data the worker associated to the axiom.
+        :type item: AbstractItem
+        :type context: tuple
+        :rtype: list
+        """
+        return self.itemAxioms[(item.diagram.name, item.id)][context]
+
+    def invalidate(self, diagram, *items):
+        """
+        Discard the cached data which may be affected by a change of the given items in the given diagram.
+        This includes the conversion of the nodes whose identity may have changed (i.e. the neutral
+        components the items belong to), the conversion of the nodes which take them as input (directly
+        or not), and the axioms generated by such nodes, by their neighbours and by the edges attached to them.
+        The whole collection is processed in a single pass so that shared components are visited only once.
+        :type diagram: Diagram
+        :type items: AbstractItem
+        """
+        seeds = set()
+        for item in items:
+            if item.isEdge():
+                seeds.update(node for node in (item.source, item.target) if node)
+            else:
+                seeds.add(item)
+        visit = lambda x: Identity.Neutral in x.identities()
+        stack = []
+        reached = set()
+        for seed in seeds:
+            if seed not in reached:
+                component = bfs(source=seed, filter_on_visit=visit)
+                reached.update(component)
+                stack.extend(component)
+        dirty = set()
+        while stack:
+            node = stack.pop()
+            if node not in dirty:
+                dirty.add(node)
+                stack.extend(node.outgoingNodes(filter_on_edges=lambda x: x.type() is Item.InputEdge))
+        stale = set(items) | dirty
+        for node in dirty:
+            stale |= node.edges
+            stale |= node.adjacentNodes()
+        with self.lock:
+            conversions = self.get(diagram.name, {})
+            self.version += 1
+            for node in dirty:
+                conversions.pop(node.id, None)
+                self.traces.pop((diagram.name, node.id), None)
+            for x in stale:
+                self.itemAxioms.pop((diagram.name, x.id), None)
+            # INCREASE THE GENERATION ONLY ONCE DONE, SO THAT WORKERS WHICH READ DATA WE ARE DISCARDING NEVER STORE IT BACK
+            self.generation += 1
+
+    def invalidateAxioms(self, diagram, items):
+        """
+        Discard the cached axioms generated by the given items of the given diagram.
+        :type diagram: Diagram
+        :type items: T <= list|set|tuple
+        """
+        with self.lock:
+            for item in items:
+                self.itemAxioms.pop((diagram.name, item.id), None)
+            self.generation += 1
+
+    def store(self, node, conversion, trace=None, generation=None):
+        """
+        Store the conversion of the given node, together with its conversion trace (if any).
+        If a generation is given, the conversion is discarded if cached data has been discarded since then.
+        :type node: AbstractNode
+        :type conversion: OWLObject
+        :type trace: list
+        :type generation: int
+        """
+        with self.lock:
+            if generation is None or generation == self.generation:
+                self.setdefault(node.diagram.name, dict())[node.id] = conversion
+                self.version += 1
+                if trace is not None:
+                    self.traces[(node.diagram.name, node.id)] = list(trace)
+                else:
+                    self.traces.pop((node.diagram.name, node.id), None)
+
+    def storeAxioms(self, item, context, axioms, generation=None):
+        """
+        Store the axioms generated by the given item in the given translation context.
+        If a generation is given, the axioms are discarded if cached data has been discarded since then.
+        :type item: AbstractItem
+        :type context: tuple
+        :type axioms: list
+        :type generation: int
+        """
+        with self.lock:
+            if generation is None or generation == self.generation:
+                self.itemAxioms.setdefault((item.diagram.name, item.id), dict())[context] = list(axioms)
+
+    def trace(self, node):
+        """
+        Returns the conversion trace stored for the given node, raising KeyError if there is none.
+        :type node: AbstractNode
+        :rtype: list
+        """
+        return self.traces[(node.diagram.name, node.id)]
+
+    def __str__(self):
+        return '{0}: {1} hits, {2} misses'.format(self.__class__.__name__, self.hits, self.misses)
+
+    def __repr__(self):
+        return str(self)
+
+
+class OWLTermIndex(object):
+    """
+    Bidirectional index between the nodes of a project and the string representation of their OWL 2 conversion.
+    The index is built from a snapshot of the project and of its conversion cache, and it is
+    valid as long as neither of them changes: see OWLTermIndex.isValid.
+    """
+    def __init__(self, project, cache):
+        """
+        Build the index of the given project using the conversions stored in the given cache.
+        Must be called from a thread attached to the JVM, since conversions are Java objects.
+        :type project: Project
+        :type cache: OWLConversionCache
+        """
+        self.cache = cache
+        self.version = (cache.version, project.index.version)
+        self.nodes = dict()
+        self.terms = dict()
+
+        # A node is mapped to the conversion of the first converted node which shares its label
+        # (possibly itself): the iteration order of the cache determines which one is picked.
+        nodes = {node.id_with_diag: node for node in project.nodes()}
+        for diagram, conversions in cache.items():
+            for nid, conversion in conversions.items():
+                node = nodes.get('{0}-{1}'.format(diagram, nid))
+                if conversion is not None and node is not None and node.text() not in self.terms:
+                    self.terms[node.text()] = OWLTermIndex.termFor(node, conversion)
+
+        for node in nodes.values():
+            term = self.terms.get(node.text())
+            if isinstance(term, str):
+                self.nodes.setdefault(term, list()).append(node)
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def isValid(self, project):
+        """
+        Returns True if the index reflects the current state of the given project, False otherwise.
+        :type project: Project
+        :rtype: bool
+        """
+        return self.cache is project.converted_nodes and self.version == (self.cache.version, project.index.version)
+
+    def nodesForTerm(self, term):
+        """
+        Returns the list of nodes whose OWL 2 conversion is represented by the given string.
+        :type term: str
+        :rtype: list
+        """
+        return self.nodes.get(term, [])
+
+    def termForNode(self, node):
+        """
+        Returns the string representation of the OWL 2 conversion of the given node, or None if it was not converted.
+        Conversions generating multiple expressions are returned as lists.
+        :type node: AbstractNode
+        :rtype: T <= str|list
+        """
+        return self.terms.get(node.text())
+
+    @staticmethod
+    def termFor(node, conversion):
+        """
+        Returns the string representation of the given OWL 2 conversion of the given node.
+        :type node: AbstractNode
+        :type conversion: T <= OWLObject|list
+        :rtype: T <= str|list
+        """
+        if isinstance(conversion, list):
+            return [x.toString() for x in conversion]
+        if node.type() is Item.RoleChainNode:
+            chain = []
+            iterator = conversion.iterator()
+            while iterator.hasNext():
+                chain.append(iterator.next())
+            return chain
+        return conversion.toString()
+
+
 class IllegalPrefixError(RuntimeError):
     """
     Used to signal that a prefix contains illegal characters
@@ -34,6 +34,7 @@
 
 
 from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
 
 from PyQt5 import QtCore
 
@@ -47,14 +48,19 @@ class AbstractProfile(QtCore.QObject):
     """
     __metaclass__ = ABCMeta
 
+    CacheSize = 4096
+
     def __init__(self, project=None):
         """
         Initialize the profile.
         :type project: Project
         """
         super().__init__(project)
+        self._cache = OrderedDict()
         self._edgeRules = []
+        self._edgeRulesTable = {}
         self._nodeRules = []
+        self._nodeRulesTable = {}
         self._pvr = None
 
     #############################################
@@ -88,6 +94,8 @@ class AbstractProfile(QtCore.QObject):
         """
         if issubclass(rule, ProfileEdgeRule):
             self._edgeRules.append(rule(*args, **kwargs))
+            self._edgeRulesTable.clear()
+            self._cache.clear()
 
     def addNodeRule(self, rule, *args, **kwargs):
         """
@@ -96,6 +104,26 @@ class AbstractProfile(QtCore.QObject):
         """
         if issubclass(rule, ProfileNodeRule):
             self._nodeRules.append(rule(*args, **kwargs))
+            self._nodeRulesTable.clear()
+            self._cache.clear()
+
+    def cached(self, key, stamp):
+        """
+        Returns the cached validation result for the given key, if it has been computed with the given stamp.
+        :type key: T <= tuple|AbstractNode
+        :type stamp: tuple
+        :rtype: ProfileValidationResult
+        """
+        if stamp is not None:
+            try:
+                cachedStamp, pvr = self._cache[key]
+            except KeyError:
+                pass
+            else:
+                if cachedStamp == stamp:
+                    self._cache.move_to_end(key)
+                    return pvr
+        return None
 
     def checkEdge(self, source, edge, target):
         """
@@ -103,43 +131,56 @@ class AbstractProfile(QtCore.QObject):
         *   1) Perform the validation on the source node.
         *   2) Perform the validation on the target node.
         *   3) Perform the validation on the given edge.
+        Results are cached and reused as long as the revisions of the triple nodes and of their diagram are unchanged.
         :type source: AbstractNode
         :type edge: AbstractEdge
         :type target: AbstractNode
         :rtype: AbstractProfileValidationResult
         """
-        if not self.pvr() or (source, edge, target) not in self.pvr():
+        key = (source, edge, target)
+        stamp = self.revisionOf(edge.diagram, source, target)
+        pvr = self.cached(key, stamp)
+        if pvr is None:
 
             try:
                 for node in (source, target):
-                    for r in self.nodeRules():
+                    for r in self.nodeRulesFor(node):
                         r(node)
-                for r in self.edgeRules():
+                for r in self.edgeRulesFor(source, edge, target):
                     r(source, edge, target)
             except ProfileError as e:
-                self.setPvr(ProfileValidationResult((source, edge, target), False, e.msg))
+                pvr = ProfileValidationResult(key, False, e.msg)
             else:
-                self.setPvr(ProfileValidationResult((source, edge, target), True))
+                pvr = ProfileValidationResult(key, True)
+
+            self.setCached(key, stamp, pvr)
 
-        return self.pvr()
+        self.setPvr(pvr)
+        return pvr
 
     def checkNode(self, node):
         """
         Perform the validation of the given node.
+        Results are cached and reused as long as the revisions of the node and of its diagram are unchanged.
         :type node: AbstractNode
         :rtype: ProfileValidationResult
         """
-        if not self.pvr() or node not in self.pvr():
+        stamp = self.revisionOf(node.diagram, node)
+        pvr = self.cached(node, stamp)
+        if pvr is None:
 
             try:
-                for r in self.nodeRules():
+                for r in self.nodeRulesFor(node):
                     r(node)
             except ProfileError as e:
-                self.setPvr(ProfileValidationResult(node, False, e.msg))
+                pvr = ProfileValidationResult(node, False, e.msg)
             else:
-                self.setPvr(ProfileValidationResult(node, True))
+                pvr = ProfileValidationResult(node, True)
 
-        return self.pvr()
+            self.setCached(node, stamp, pvr)
+
+        self.setPvr(pvr)
+        return pvr
 
     def edgeRules(self):
         """
@@ -148,6 +189,24 @@ class AbstractProfile(QtCore.QObject):
         """
         return self._edgeRules
 
+    def edgeRulesFor(self, source, edge, target):
+        """
+        Returns the list of edge rules in this Profile which apply to the given triple.
+        Rules are looked up in a dispatch table keyed by the types of the triple components,
+        which is filled in the first time a combination of types is validated.
+        :type source: AbstractNode
+        :type edge: AbstractEdge
+        :type target: AbstractNode
+        :rtype: list
+        """
+        key = (source.type(), edge.type(), target.type())
+        try:
+            return self._edgeRulesTable[key]
+        except KeyError:
+            rules = [r for r in self._edgeRules if r.appliesTo(*key)]
+            self._edgeRulesTable[key] = rules
+            return rules
+
     @classmethod
     def name(cls):
         """
@@ -164,6 +223,20 @@ class AbstractProfile(QtCore.QObject):
         """
         return self._nodeRules
 
+    def nodeRulesFor(self, node):
+        """
+        Returns the list of node rules in this Profile which apply to the given node.
+        :type node: AbstractNode
+        :rtype: list
+        """
+        key = node.type()
+        try:
+            return self._nodeRulesTable[key]
+        except KeyError:
+            rules = [r for r in self._nodeRules if r.appliesTo(key)]
+            self._nodeRulesTable[key] = rules
+            return rules
+
     def objectName(self):
         """
         Returns the system name of the profile.
@@ -178,12 +251,37 @@ class AbstractProfile(QtCore.QObject):
         """
         return self._pvr
 
+    @staticmethod
+    def revisionOf(diagram, *nodes):
+        """
+        Returns the stamp identifying the revision of the given nodes (None if they are not in a diagram).
+        :type diagram: Diagram
+        :type nodes: list
+        :rtype: tuple
+        """
+        if diagram is None:
+            return None
+        return (diagram.revision,) + tuple(node.revision() for node in nodes)
+
     def reset(self):
         """
         Reset the profile by removing the latest validation result.
         """
         self._pvr = None
 
+    def setCached(self, key, stamp, pvr):
+        """
+        Cache the given validation result, discarding the least recently used one if the cache is full.
+        :type key: T <= tuple|AbstractNode
+        :type stamp: tuple
+        :type pvr: ProfileValidationResult
+        """
+        if stamp is not None:
+            self._cache[key] = (stamp, pvr)
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.CacheSize:
+                self._cache.popitem(last=False)
+
     def setPvr(self, pvr):
         """
         Set the profile validation result.
@@ -53,9 +53,28 @@ class ProfileRule(object):
 class ProfileEdgeRule(ProfileRule):
     """
     Extends built-in object providing the base class for all the edge validation rules.
+    Rules may declare the types of the edges, source nodes and target nodes they apply to
+    (None meaning any type), so that profiles do not run them against unrelated triples.
     """
     __metaclass__ = ABCMeta
 
+    edges = None
+    sources = None
+    targets = None
+
+    @classmethod
+    def appliesTo(cls, source, edge, target):
+        """
+        Returns True if the rule needs to be run on triples with the given types, False otherwise.
+        :type source: Item
+        :type edge: Item
+        :type target: Item
+        :rtype: bool
+        """
+        return (cls.edges is None or edge in cls.edges) and \
+               (cls.sources is None or source in cls.sources) and \
+               (cls.targets is None or target in cls.targets)
+
     @abstractmethod
     def __call__(self, source, edge, target):
         """
@@ -70,9 +89,22 @@ class ProfileEdgeRule(ProfileRule):
 class ProfileNodeRule(ProfileRule):
     """
     Extends built-in object providing the base class for all the node validation rules.
+    Rules may declare the types of the nodes they apply to (None meaning any type),
+    so that profiles do not run them against unrelated nodes.
     """
     __metaclass__ = ABCMeta
 
+    nodes = None
+
+    @classmethod
+    def appliesTo(cls, node):
+        """
+        Returns True if the rule needs to be run on nodes with the given type, False otherwise.
+        :type node: Item
+        :rtype: bool
+        """
+        return cls.nodes is None or node in cls.nodes
+
     @abstractmethod
     def __call__(self, node):
         """
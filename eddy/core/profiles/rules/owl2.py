@@ -46,6 +46,8 @@ class EquivalenceBetweenExpressionsRule(ProfileEdgeRule):
     """
     Make sure that an equivalence edge is traced only between graphol expressions.
     """
+    edges = {Item.EquivalenceEdge}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.EquivalenceEdge:
             supported = {Identity.Concept, Identity.Role, Identity.Attribute, Identity.ValueDomain}
@@ -64,6 +66,8 @@ class EquivalenceBetweenCompatibleExpressionsRule(ProfileEdgeRule):
     """
     Make sure that an equivalence edge is traced only between compatible Graphol expressions.
     """
+    edges = {Item.EquivalenceEdge}
+
     def __call__(self, source, edge, target):
         
         if edge.type() is Item.EquivalenceEdge:
@@ -81,6 +85,8 @@ class EquivalenceBetweenValueDomainExpressionsRule(ProfileEdgeRule):
     """
     Prevents equivalence edges from being traced between Value-domain expressions.
     """
+    edges = {Item.EquivalenceEdge}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.EquivalenceEdge:
             if Identity.ValueDomain in {source.identity(), target.identity()}:
@@ -92,6 +98,8 @@ class EquivalenceBetweenRoleExpressionAndComplementRule(ProfileEdgeRule):
     """
     Prevents equivalence edges from being traced between a Role expression and a Complement node.
     """
+    edges = {Item.EquivalenceEdge}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.EquivalenceEdge:
             if Identity.Role in {source.identity(), target.identity()}:
@@ -104,6 +112,8 @@ class EquivalenceBetweenAttributeExpressionAndComplementRule(ProfileEdgeRule):
     """
     Prevents equivalence edges from being traced between an Attribute expression and a Complement node.
     """
+    edges = {Item.EquivalenceEdge}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.EquivalenceEdge:
             if Identity.Attribute in {source.identity(), target.identity()}:
@@ -116,6 +126,8 @@ class EquivalenceBetweenRoleExpressionAndRoleChainRule(ProfileEdgeRule):
     """
     Make sure that equivalence edges are never traced in presence of a Role chain node.
     """
+    edges = {Item.EquivalenceEdge}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.EquivalenceEdge:
             if Item.RoleChainNode in {source.type(), target.type()}:
@@ -129,6 +141,8 @@ class InclusionBetweenExpressionsRule(ProfileEdgeRule):
     """
     Make sure that an inclusion edge is traced only between graphol expressions.
     """
+    edges = {Item.InclusionEdge}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.InclusionEdge:
             supported = {Identity.Concept, Identity.Role, Identity.Attribute, Identity.ValueDomain}
@@ -147,6 +161,8 @@ class InclusionBetweenCompatibleExpressionsRule(ProfileEdgeRule):
     """
     Make sure that an inclusion edge is traced only between compatible Graphol expressions.
     """
+    edges = {Item.InclusionEdge}
+
     def __call__(self, source, edge, target):
         
         if edge.type() is Item.InclusionEdge:
@@ -166,6 +182,8 @@ class InclusionBetweenValueDomainExpressionsRule(ProfileEdgeRule):
     """
     Prevents inclusion edged from being traced between Value-domain expressions.
     """
+    edges = {Item.InclusionEdge}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.InclusionEdge:
             if Identity.ValueDomain in {source.identity(), target.identity()}:
@@ -183,6 +201,8 @@ class InclusionBetweenRoleExpressionAndComplementNodeRule(ProfileEdgeRule):
     """
     Prevents inclusion edges sourcing from Complement nodes to target Role expressions.
     """
+    edges = {Item.InclusionEdge}
+
     def __call__(self, source, edge, target):
 
         if edge.type() is Item.InclusionEdge:
@@ -213,6 +233,8 @@ class InclusionBetweenAttributeExpressionAndComplementNodeRule(ProfileEdgeRule):
     """
     Prevents inclusion edges sourcing from Complement nodes to target Attribute expressions.
     """
+    edges = {Item.InclusionEdge}
+
     def __call__(self, source, edge, target):
 
         if edge.type() is Item.InclusionEdge:
@@ -243,6 +265,8 @@ class InclusionBetweenRoleExpressionAndRoleChainNodeRule(ProfileEdgeRule):
     """
     Make sure that inclusion edges sourcing from Role chain nodes target only Role expressions.
     """
+    edges = {Item.InclusionEdge}
+
     def __call__(self, source, edge, target):
         
         if edge.type() is Item.InclusionEdge:
@@ -264,6 +288,8 @@ class InputToConstructorNodeRule(ProfileEdgeRule):
     """
     Make sure that input edges only target constructor nodes.
     """
+    edges = {Item.InputEdge}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.InputEdge:
             if not target.isConstructor():
@@ -278,6 +304,9 @@ class InputToComplementNodeRule(ProfileEdgeRule):
     """
     Perform validation procedures on input edges targeting Complement nodes.
     """
+    edges = {Item.InputEdge}
+    targets = {Item.ComplementNode}
+
     def __call__(self, source, edge, target):
         
         if edge.type() is Item.InputEdge:
@@ -325,6 +354,9 @@ class InputToIntersectionOrUnionNodeRule(ProfileEdgeRule):
     """
     Perform validation procedures on input edges targeting either Intersection or (Disjoint)Union nodes.
     """
+    edges = {Item.InputEdge}
+    targets = {Item.IntersectionNode, Item.UnionNode, Item.DisjointUnionNode}
+
     def __call__(self, source, edge, target):
         
         if edge.type() is Item.InputEdge:
@@ -373,6 +405,9 @@ class InputToEnumerationNodeRule(ProfileEdgeRule):
     """
     Perform validation procedures on input edges targeting Enumeration nodes.
     """
+    edges = {Item.InputEdge}
+    targets = {Item.EnumerationNode}
+
     def __call__(self, source, edge, target):
 
         if edge.type() is Item.InputEdge:
@@ -408,6 +443,9 @@ class InputToRoleInverseNodeRule(ProfileEdgeRule):
     """
     Perform validation procedures on input edges targeting Role Inverse nodes.
     """
+    edges = {Item.InputEdge}
+    targets = {Item.RoleInverseNode}
+
     def __call__(self, source, edge, target):
 
         if edge.type() is Item.InputEdge:
@@ -431,6 +469,9 @@ class InputToRoleChainNodeRule(ProfileEdgeRule):
     """
     Perform validation procedures on input edges targeting Role Chain nodes.
     """
+    edges = {Item.InputEdge}
+    targets = {Item.RoleChainNode}
+
     def __call__(self, source, edge, target):
 
         if edge.type() is Item.InputEdge:
@@ -452,6 +493,9 @@ class InputToDatatypeRestrictionNodeRule(ProfileEdgeRule):
     """
     Perform validation procedures on input edges targeting Role Chain nodes.
     """
+    edges = {Item.InputEdge}
+    targets = {Item.DatatypeRestrictionNode}
+
     def __call__(self, source, edge, target):
 
         if edge.type() is Item.InputEdge:
@@ -503,6 +547,9 @@ class InputToPropertyAssertionNodeRule(ProfileEdgeRule):
     """
     Perform validation procedures on input edges targeting Property Assertion nodes.
     """
+    edges = {Item.InputEdge}
+    targets = {Item.PropertyAssertionNode}
+
     def __call__(self, source, edge, target):
 
         if edge.type() is Item.InputEdge:
@@ -556,6 +603,9 @@ class InputToDomainRestrictionNodeRule(ProfileEdgeRule):
     """
     Perform validation procedures on input edges targeting Domain Restriction nodes.
     """
+    edges = {Item.InputEdge}
+    targets = {Item.DomainRestrictionNode}
+
     def __call__(self, source, edge, target):
 
         if edge.type() is Item.InputEdge:
@@ -683,6 +733,9 @@ class InputToRangeRestrictionNodeRule(ProfileEdgeRule):
     """
     Perform validation procedures on input edges targeting Range Restriction nodes.
     """
+    edges = {Item.InputEdge}
+    targets = {Item.RangeRestrictionNode}
+
     def __call__(self, source, edge, target):
 
         if edge.type() is Item.InputEdge:
@@ -799,6 +852,9 @@ class InputToFacetNodeRule(ProfileEdgeRule):
     """
     Perform validation procedures on input edges targeting Facet nodes.
     """
+    edges = {Item.InputEdge}
+    targets = {Item.FacetNode}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.InputEdge:
             if target.type() is Item.FacetNode:
@@ -809,6 +865,8 @@ class MembershipFromAssertionCompatibleNodeRule(ProfileEdgeRule):
     """
     Make sure that membership assertion edges source from either Individual or Property Assertion nodes.
     """
+    edges = {Item.MembershipEdge}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.MembershipEdge:
             if source.identity() is not Identity.Individual and source.type() is not Item.PropertyAssertionNode:
@@ -820,6 +878,8 @@ class MembershipFromIndividualRule(ProfileEdgeRule):
     """
     Perform validation procedures on membership edges sourcing from Individuals.
     """
+    edges = {Item.MembershipEdge}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.MembershipEdge:
             if source.identity() is Identity.Individual:
@@ -834,6 +894,8 @@ class MembershipFromRoleInstanceRule(ProfileEdgeRule):
     """
     Perform validation procedures on membership edges sourcing from a Role Instance.
     """
+    edges = {Item.MembershipEdge}
+
     def __call__(self, source, edge, target):
         
         if edge.type() is Item.MembershipEdge:
@@ -876,6 +938,8 @@ class MembershipFromAttributeInstanceRule(ProfileEdgeRule):
     """
     Perform validation procedures on membership edges sourcing from an Attribute Instance.
     """
+    edges = {Item.MembershipEdge}
+
     def __call__(self, source, edge, target):
         
         if edge.type() is Item.MembershipEdge:
@@ -908,6 +972,9 @@ class MembershipFromNeutralPropertyAssertionRule(ProfileEdgeRule):
     """
     Perform validation procedures on membership edges sourcing from Neutral Property Assertion nodes.
     """
+    edges = {Item.MembershipEdge}
+    sources = {Item.PropertyAssertionNode}
+
     def __call__(self, source, edge, target):
         
         if edge.type() is Item.MembershipEdge:
@@ -947,6 +1014,8 @@ class SameFromCompatibleNodeRule(ProfileEdgeRule):
     """
     Permit same edges only for nodes of the same type. This also accounts for OWL 2 punning.
     """
+    edges = {Item.SameEdge}
+
     def __call__(self, source, edge, target):
         if edge.type() == Item.SameEdge:
             if source.type() not in {Item.IndividualNode, Item.ConceptNode, Item.RoleNode, Item.AttributeNode}:
@@ -959,6 +1028,8 @@ class DifferentFromCompatibleNodeRule(ProfileEdgeRule):
     """
     Permit different edges only for nodes of the same type. This also accounts for OWL 2 punning.
     """
+    edges = {Item.DifferentEdge}
+
     def __call__(self, source, edge, target):
         if edge.type() == Item.DifferentEdge:
             if source.type() not in {Item.IndividualNode, Item.ConceptNode, Item.RoleNode, Item.AttributeNode}:
@@ -981,6 +1052,8 @@ class CardinalityRestrictionNodeRule(ProfileNodeRule):
     """
     Make sure that the cardinality specified is consistent.
     """
+    nodes = {Item.DomainRestrictionNode, Item.RangeRestrictionNode}
+
     def __call__(self, node):
         if node.type() in {Item.DomainRestrictionNode, Item.RangeRestrictionNode}:
             if node.restriction() is Restriction.Cardinality:
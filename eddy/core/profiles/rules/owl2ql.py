@@ -46,6 +46,8 @@ class FunctionalityUnsupported(ProfileNodeRule):
     """
     Prevents from using functionality in attributes or roles which is outside of the OWL 2 QL profile.
     """
+    nodes = {Item.AttributeNode, Item.RoleNode}
+
     def __call__(self, node):
         if (('AttributeNode' in str(type(node))) or ('RoleNode' in str(type(node)))):
             if node.isFunctional():
@@ -57,6 +59,8 @@ class InverseFunctionalityUnsupported(ProfileNodeRule):
     """
     Prevents from using inverse-functionality in roles which is outside of the OWL 2 QL profile.
     """
+    nodes = {Item.RoleNode}
+
     def __call__(self, node):
         if ('RoleNode' in str(type(node))):
             if node.isInverseFunctional():
@@ -68,6 +72,8 @@ class TransitivityUnsupported(ProfileNodeRule):
     """
     Prevents from using transitivity in  roles which is outside of the OWL 2 QL profile.
     """
+    nodes = {Item.RoleNode}
+
     def __call__(self, node):
         if ('RoleNode' in str(type(node))):
             if node.isTransitive():
@@ -78,6 +84,8 @@ class UnsupportedDatatypeRule(ProfileNodeRule):
     """
     Prevents from using datatypes which are outside of the OWL 2 QL profile.
     """
+    nodes = {Item.ValueDomainNode}
+
     def __call__(self, node):
         if node.type() is Item.ValueDomainNode:
             if node.datatype not in Datatype.forProfile(OWLProfile.OWL2QL):
@@ -88,6 +96,10 @@ class UnsupportedOperatorRule(ProfileNodeRule):
     """
     Prevents from using operator nodes which are not supported by the OWL 2 QL profile.
     """
+    nodes = {Item.UnionNode, Item.DisjointUnionNode,
+             Item.DatatypeRestrictionNode, Item.FacetNode,
+             Item.EnumerationNode, Item.RoleChainNode}
+
     def __call__(self, node):
         if node.type() in {Item.UnionNode, Item.DisjointUnionNode,
             Item.DatatypeRestrictionNode, Item.FacetNode,
@@ -99,6 +111,8 @@ class UnsupportedIndividualEqualityRule(ProfileEdgeRule):
     """
     Prevents from using individual equality assertion edges which are not supported by the OWL 2 QL profile.
     """
+    edges = {Item.SameEdge}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.SameEdge:
             raise ProfileError('Usage of SameIndividual assertion is forbidden in OWL 2 QL')
@@ -108,6 +122,8 @@ class EquivalenceBetweenConceptExpressionRule(ProfileEdgeRule):
     """
     Make sure that equivalence edges are not from/to intersection or complement nodes.
     """
+    edges = {Item.EquivalenceEdge}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.EquivalenceEdge:
             # Similarily as for the Inclusion edge, here we deny the equivalence in presence
@@ -128,6 +144,8 @@ class InclusionBetweenConceptExpressionRule(ProfileEdgeRule):
     """
     Make sure that inclusion edges do not source from intersection or complement nodes.
     """
+    edges = {Item.InclusionEdge}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.InclusionEdge:
             # We need to prevent inclusions sourcing from Complement nodes and Intersection nodes.
@@ -149,6 +167,9 @@ class InputConceptToRestrictionNodeRule(ProfileEdgeRule):
     """
     Make sure to construct qualified Role domain/range restrictions using only atomic Concept nodes.
     """
+    edges = {Item.InputEdge}
+    targets = {Item.DomainRestrictionNode, Item.RangeRestrictionNode}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.InputEdge:
             if target.type() in {Item.DomainRestrictionNode, Item.RangeRestrictionNode}:
@@ -177,6 +198,9 @@ class InputValueDomainToComplementNodeRule(ProfileEdgeRule):
     """
     Prevent the construction of complement of value-domain expressions.
     """
+    edges = {Item.InputEdge}
+    targets = {Item.ComplementNode}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.InputEdge:
             if target.type() is Item.ComplementNode:
@@ -189,6 +213,9 @@ class InputValueDomainToIntersectionNodeRule(ProfileEdgeRule):
     """
     Prevent the construction of intersection of value-domains which are given in input to complement nodes.
     """
+    edges = {Item.InputEdge}
+    targets = {Item.IntersectionNode}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.InputEdge:
             if target.type() is Item.IntersectionNode:
@@ -207,6 +234,8 @@ class MembershipFromAttributeInstanceToComplementNodeRule(ProfileEdgeRule):
     """
     Prevent the construction of NegativeDataPropertyAssertion axioms.
     """
+    edges = {Item.MembershipEdge}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.MembershipEdge:
             if source.identity() is Identity.AttributeInstance:
@@ -218,6 +247,8 @@ class MembershipFromRoleInstanceToComplementNodeRule(ProfileEdgeRule):
     """
     Prevent the construction of NegativeObjectPropertyAssertion axioms.
     """
+    edges = {Item.MembershipEdge}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.MembershipEdge:
             if source.identity() is Identity.RoleInstance:
@@ -229,6 +260,9 @@ class MembershipFromPropertyAssertionToComplementNodeRule(ProfileEdgeRule):
     """
     Prevent the construction of NegativeObjectPropertyAssertion and NegativeDataPropertyAssertion axioms.
     """
+    edges = {Item.MembershipEdge}
+    sources = {Item.PropertyAssertionNode}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.MembershipEdge:
             if source.type() is Item.PropertyAssertionNode:
@@ -45,6 +45,8 @@ class ReflexivityUnsupported(ProfileNodeRule):
     """
     Prevents from using reflexivity in roles which is outside of the OWL 2 QL profile.
     """
+    nodes = {Item.RoleNode}
+
     def __call__(self, node):
         if ('RoleNode' in str(type(node))):
             if node.isReflexive():
@@ -55,6 +57,8 @@ class UnsupportedDatatypeRule(ProfileNodeRule):
     """
     Prevents from using datatypes which are outside of the OWL 2 RL profile.
     """
+    nodes = {Item.ValueDomainNode}
+
     def __call__(self, node):
         if node.type() is Item.ValueDomainNode:
             if node.datatype not in Datatype.forProfile(OWLProfile.OWL2RL):
@@ -65,6 +69,8 @@ class UnsupportedOperatorRule(ProfileNodeRule):
     """
     Prevents from using operator nodes which are not supported by the OWL 2 RL profile.
     """
+    nodes = {Item.DatatypeRestrictionNode, Item.FacetNode}
+
     def __call__(self, node):
         if node.type() in {Item.DatatypeRestrictionNode, Item.FacetNode}:
             raise ProfileError('Usage of {} operator is forbidden in OWL 2 RL'.format(node.shortName))
@@ -74,6 +80,8 @@ class UnsupportedSpecialOnRoleAndAttributeNode(ProfileNodeRule):
     """
     Make sure that TOP and BOTTOM are not used in Role and Attribute nodes.
     """
+    nodes = {Item.AttributeNode, Item.RoleNode}
+
     def __call__(self, node):
         if node.type() in {Item.AttributeNode, Item.RoleNode}:
             if Special.valueOf(node.text()) is not None:
@@ -85,6 +93,8 @@ class EquivalenceBetweenConceptExpressionRule(ProfileEdgeRule):
     Make sure that equivalence edges are traced according to OWL 2 RL subClass and superClass definition.
     More information: https://www.w3.org/TR/owl2-profiles/
     """
+    edges = {Item.InclusionEdge}
+
     def __call__(self, source, edge, target):
 
         if edge.type() is Item.InclusionEdge:
@@ -122,6 +132,8 @@ class InclusionBetweenConceptExpressionRule(ProfileEdgeRule):
     Make sure that inclusion edges are traced according to OWL 2 RL subClass and superClass definition.
     More information: https://www.w3.org/TR/owl2-profiles/
     """
+    edges = {Item.InclusionEdge}
+
     def __call__(self, source, edge, target):
 
         if edge.type() is Item.InclusionEdge:
@@ -187,6 +199,9 @@ class InputValueToEnumerationNodeRule(ProfileEdgeRule):
     """
     Prevent the construction of value-domain expression composed of a oneOf of values.
     """
+    edges = {Item.InputEdge}
+    targets = {Item.EnumerationNode}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.InputEdge:
             if target.type() is Item.EnumerationNode:
@@ -198,6 +213,9 @@ class InputValueDomainToUnionNodeRule(ProfileEdgeRule):
     """
     Prevent the construction of union of value domain expressions.
     """
+    edges = {Item.InputEdge}
+    targets = {Item.DisjointUnionNode, Item.UnionNode}
+
     def __call__(self, source, edge, target):
         if edge.type() is Item.InputEdge:
             if target.type() in {Item.DisjointUnionNode, Item.UnionNode}:
@@ -33,6 +33,8 @@
 ##########################################################################
 
 
+from contextlib import contextmanager
+
 from rfc3987 import parse
 
 from PyQt5 import QtCore
@@ -45,11 +47,14 @@ from eddy.core.commands.nodes_2 import CommandProjetSetIRIPrefixesNodesDict
 from eddy.core.commands.project import CommandProjectDisconnectSpecificSignals, CommandProjectConnectSpecificSignals
 from eddy.core.datatypes.graphol import Item, Identity
 from eddy.core.datatypes.owl import Namespace
+from eddy.core.functions.misc import first
 from eddy.core.functions.path import expandPath
 from eddy.core.functions.signals import connect, disconnect
 from eddy.core.items.common import AbstractItem
 from eddy.core.items.nodes.common.base import AbstractNode
 from eddy.core.output import getLogger
+from eddy.core.owl import OWLConversionCache, OWLTermIndex
+from eddy.core.reasoner import ReasonerSession
 from eddy.ui.dialogs import DiagramSelectionDialog
 from eddy.ui.resolvers import PredicateBooleanConflictResolver
 from eddy.ui.resolvers import PredicateDocumentationConflictResolver
@@ -60,10 +65,13 @@ LOGGER = getLogger()
 # PROJECT INDEX
 K_DIAGRAM = 'diagrams'
 K_EDGE = 'edges'
+K_IDENTITY = 'identities'
 K_ITEMS = 'items'
+K_LABEL = 'labels'
 K_META = 'meta'
 K_NODE = 'nodes'
 K_PREDICATE = 'predicates'
+K_STRING = 'strings'
 K_TYPE = 'types'
 
 # PROJECT MERGE
@@ -99,6 +107,8 @@ class Project(QtCore.QObject):
     * sgnDiagramRemoved: whenever a Diagram is removed from the Project.
     * sgnItemAdded: whenever an item is added to the Project.
     * sgnItemRemoved: whenever an item is removed from the Project.
+    * sgnItemsAdded: whenever a collection of items is added to the Project (see Project.batchUpdate).
+    * sgnItemsRemoved: whenever a collection of items is removed from the Project (see Project.batchUpdate).
     * sgnMetaAdded: whenever predicate metadata are added to the Project.
     * sgnMetaRemoved: whenever predicate metadata are removed from the Project.
     * sgnUpdated: whenever the Project is updated in any of its parts.
@@ -107,6 +117,8 @@ class Project(QtCore.QObject):
     sgnDiagramRemoved = QtCore.pyqtSignal('QGraphicsScene')
     sgnItemAdded = QtCore.pyqtSignal('QGraphicsScene', 'QGraphicsItem')
     sgnItemRemoved = QtCore.pyqtSignal('QGraphicsScene', 'QGraphicsItem')
+    sgnItemsAdded = QtCore.pyqtSignal('QGraphicsScene', list)
+    sgnItemsRemoved = QtCore.pyqtSignal('QGraphicsScene', list)
     sgnMetaAdded = QtCore.pyqtSignal(Item, str)
     sgnMetaRemoved = QtCore.pyqtSignal(Item, str)
     sgnUpdated = QtCore.pyqtSignal()
@@ -140,6 +152,8 @@ class Project(QtCore.QObject):
         self.profile = kwargs.get('profile')
         self.profile.setParent(self)
         self.version = kwargs.get('version', '1.0')
+        self.updateBatch = 0
+        self.updateQueue = []
 
         ###  variables controlled by reasoners  ###
         self.ontology_OWL = None
@@ -160,7 +174,9 @@ class Project(QtCore.QObject):
         self.nodes_or_edges_of_axioms_to_display_in_widget = []
         self.nodes_or_edges_of_explanations_to_display_in_widget = []
 
-        self.converted_nodes = dict()
+        self.converted_nodes = OWLConversionCache()
+        self._OWL_terms_index = None
+        self.reasoner_session = ReasonerSession()
 
         ### $$ END $$ variables controlled by reasoners $$ END $$ ###
 
@@ -169,6 +185,8 @@ class Project(QtCore.QObject):
         self.brush_orange = QtGui.QBrush(QtGui.QColor(255, 165, 0, 160))
         ############  variables for IRI-prefixes management #############
 
+        self._IRI_nodes_index = None
+        self._IRI_nodes_id_index = None
         self.IRI_prefixes_nodes_dict = kwargs.get('IRI_prefixes_nodes_dict')
         self.init_IRI_prefixes_nodes_dict_with_std_data()
 
@@ -178,6 +196,11 @@ class Project(QtCore.QObject):
 
         connect(self.sgnItemAdded, self.add_item_to_IRI_prefixes_nodes_dict)
         connect(self.sgnItemRemoved, self.remove_item_from_IRI_prefixes_nodes_dict)
+        connect(self.sgnItemsAdded, self.doInvalidateConvertedItems)
+        connect(self.sgnItemsRemoved, self.doInvalidateConvertedItems)
+        connect(self.sgnMetaAdded, self.doInvalidateConvertedMeta)
+        connect(self.sgnMetaRemoved, self.doInvalidateConvertedMeta)
+        connect(self.sgnIRIPrefixNodeDictionaryUpdated, self.doClearConvertedNodes)
 
         #connect(self.sgnItemRemoved, self.remove_item_from_prefered_prefix_list)
         connect(self.sgnIRIPrefixNodeDictionaryUpdated, self.regenerate_label_of_nodes_for_iri)
@@ -222,15 +245,108 @@ class Project(QtCore.QObject):
 
         return project_prefixes
 
-    def get_iri_of_node(self,node_inp):
-        iris = set()
+    @property
+    def IRI_prefixes_nodes_dict(self):
+        """
+        Returns the dictionary mapping each IRI to its [prefixes, nodes, properties] entry.
+        :rtype: dict
+        """
+        return self._IRI_prefixes_nodes_dict
 
+    @IRI_prefixes_nodes_dict.setter
+    def IRI_prefixes_nodes_dict(self, dictionary):
+        """
+        Replace the IRI dictionary, discarding the reverse node -> IRI index built on the old one.
+        :type dictionary: dict
+        """
+        self._IRI_prefixes_nodes_dict = dictionary
+        self.invalidate_IRI_nodes_index()
+
+    def invalidate_IRI_nodes_index(self):
+        """
+        Discard the reverse node -> IRI index: it will be rebuilt upon the next lookup.
+        Must be called whenever the node sets of IRI_prefixes_nodes_dict are modified
+        without going through add_node_to_IRI_nodes_index/remove_node_from_IRI_nodes_index.
+        """
+        self._IRI_nodes_index = None
+        self._IRI_nodes_id_index = None
+
+    def rebuild_IRI_nodes_index(self):
+        """
+        Build from scratch the reverse node -> IRI index of IRI_prefixes_nodes_dict.
+        """
+        self._IRI_nodes_index = dict()
+        self._IRI_nodes_id_index = dict()
         for iri in self.IRI_prefixes_nodes_dict.keys():
-            nodes = self.IRI_prefixes_nodes_dict[iri][1]
+            for node in self.IRI_prefixes_nodes_dict[iri][1]:
+                self.add_node_to_IRI_nodes_index(iri, node)
+
+    def add_node_to_IRI_nodes_index(self, iri, node):
+        """
+        Record in the reverse node -> IRI index that the given node is mapped to the given IRI.
+        :type iri: str
+        :type node: AbstractNode
+        """
+        if self._IRI_nodes_index is None or not isinstance(node, AbstractNode):
+            return
+        self._IRI_nodes_index.setdefault(node, set()).add(iri)
+        self._IRI_nodes_id_index.setdefault(node.id, set()).add(node)
 
-            for n in nodes:
-                if (node_inp is n) or ((str(node_inp) == str(n)) and (node_inp.id_with_diag == n.id_with_diag)):
-                   iris.add(iri)
+    def remove_node_from_IRI_nodes_index(self, iri, node):
+        """
+        Record in the reverse node -> IRI index that the given node is no longer mapped to the given IRI.
+        :type iri: str
+        :type node: AbstractNode
+        """
+        if self._IRI_nodes_index is None or node not in self._IRI_nodes_index:
+            return
+        self._IRI_nodes_index[node].discard(iri)
+        if not self._IRI_nodes_index[node]:
+            del self._IRI_nodes_index[node]
+            self._IRI_nodes_id_index[node.id].discard(node)
+            if not self._IRI_nodes_id_index[node.id]:
+                del self._IRI_nodes_id_index[node.id]
+
+    def check_IRI_nodes_index(self):
+        """
+        Compare the reverse node -> IRI index against IRI_prefixes_nodes_dict.
+        Returns the list of (node, expected IRIs, indexed IRIs) triples which do not match.
+        :rtype: list
+        """
+        expected = dict()
+        for iri in self.IRI_prefixes_nodes_dict.keys():
+            for node in self.IRI_prefixes_nodes_dict[iri][1]:
+                if isinstance(node, AbstractNode):
+                    expected.setdefault(node, set()).add(iri)
+        if self._IRI_nodes_index is None:
+            self.rebuild_IRI_nodes_index()
+        mismatches = []
+        for node in set(expected) | set(self._IRI_nodes_index):
+            indexed = self._IRI_nodes_index.get(node, set())
+            if expected.get(node, set()) != indexed:
+                mismatches.append((node, expected.get(node, set()), indexed))
+            elif node not in self._IRI_nodes_id_index.get(node.id, set()):
+                mismatches.append((node, expected.get(node, set()), set()))
+        return mismatches
+
+    def lookup_IRI_nodes_index(self, node_inp, match):
+        """
+        Returns the set of IRIs the given node is mapped to, either directly or through
+        another node sharing the same id and satisfying the given match function.
+        :type node_inp: AbstractNode
+        :type match: callable
+        :rtype: set
+        """
+        if self._IRI_nodes_index is None:
+            self.rebuild_IRI_nodes_index()
+        iris = set(self._IRI_nodes_index.get(node_inp, set()))
+        for n in self._IRI_nodes_id_index.get(node_inp.id, set()):
+            if n is not node_inp and match(n):
+                iris |= self._IRI_nodes_index[n]
+        return iris
+
+    def get_iri_of_node(self,node_inp):
+        iris = self.lookup_IRI_nodes_index(node_inp, lambda n: (str(node_inp) == str(n)) and (node_inp.id_with_diag == n.id_with_diag))
 
         if len(iris) == 1:
             return list(iris)[0]
@@ -437,6 +553,7 @@ class Project(QtCore.QObject):
 
             if corr_iri is not None:
                 self.IRI_prefixes_nodes_dict[corr_iri][1].add(node)
+                self.add_node_to_IRI_nodes_index(corr_iri, node)
                 if node.diagram is not None:
                     self.sgnIRIPrefixNodeDictionaryUpdated.emit(corr_iri,str(node),str(node.diagram.name))
                 else:
@@ -449,15 +566,11 @@ class Project(QtCore.QObject):
                 ('ConceptNode' in str(type(node))) or
                 ('IndividualNode' in str(type(node))) or
                 ('RoleNode' in str(type(node)))):
-            corr_iris = []
-
-            for IRI_in_dict in self.IRI_prefixes_nodes_dict.keys():
-                if (node in self.IRI_prefixes_nodes_dict[IRI_in_dict][1] or
-                        self.check_if_node_is_present_in_set(node, self.IRI_prefixes_nodes_dict[IRI_in_dict][1])):
-                    corr_iris.append(IRI_in_dict)
+            corr_iris = list(self.lookup_IRI_nodes_index(node, lambda n: n.id_with_diag == node.id_with_diag))
 
             if len(corr_iris) == 1:
                 self.IRI_prefixes_nodes_dict[corr_iris[0]][1].remove(node)
+                self.remove_node_from_IRI_nodes_index(corr_iris[0], node)
                 if node.diagram is not None:
                     self.sgnIRIPrefixNodeDictionaryUpdated.emit(corr_iris[0], str(node), str(node.diagram.name))
                 else:
@@ -822,12 +935,14 @@ class Project(QtCore.QObject):
                 return dictionary
 
     def addIRINodeEntry(self, dictionary, iri_inp, node_inp):
-        temp = set()
-
-        for iri in dictionary.keys():
-            nodes = dictionary[iri][1]
-            if node_inp in nodes:
-                temp.add(iri)
+        if dictionary is self.IRI_prefixes_nodes_dict:
+            temp = self.lookup_IRI_nodes_index(node_inp, lambda n: False)
+        else:
+            temp = set()
+            for iri in dictionary.keys():
+                nodes = dictionary[iri][1]
+                if node_inp in nodes:
+                    temp.add(iri)
 
         # check if node is already present
         if len(temp) > 0:
@@ -853,6 +968,8 @@ class Project(QtCore.QObject):
                 msg = str('IRI added-'+iri_inp+'; ')
 
         dictionary[iri_inp][1].add(node_inp)
+        if dictionary is self.IRI_prefixes_nodes_dict:
+            self.add_node_to_IRI_nodes_index(iri_inp, node_inp)
         msg = msg + str('node mapped to IRI-'+iri_inp)
 
         self.sgnIRINodeEntryAdded.emit(iri_inp, str(node_inp), msg)
@@ -941,6 +1058,8 @@ class Project(QtCore.QObject):
             return None
 
         dictionary[iri_inp][1].remove(node_inp)
+        if dictionary is self.IRI_prefixes_nodes_dict:
+            self.remove_node_from_IRI_nodes_index(iri_inp, node_inp)
 
         self.sgnIRINodeEntryRemoved.emit(iri_inp, str(node_inp), str('Node no longer mapped to IRI'+iri_inp))
         return dictionary
@@ -962,6 +1081,9 @@ class Project(QtCore.QObject):
 
         #print(' def node_label_update_core_code     >>> new_label', new_label)
 
+        # THE IRI OF THE NODE MAY HAVE CHANGED EVEN IF ITS LABEL DID NOT
+        self.converted_nodes.invalidate(node.diagram, node)
+
         if old_label==new_label:
             return
 
@@ -1014,16 +1136,13 @@ class Project(QtCore.QObject):
                     QtCore.QCoreApplication.processEvents()
                     self.node_label_update_core_code(node)
         else:
-            for n in self.nodes():
-                QtCore.QCoreApplication.processEvents()
-                if diag_name is not None:
-                    if (str(n) == node_inp) and (str(n.diagram.name) == diag_name):
-                        self.node_label_update_core_code(n)
-                        break
-                else:
-                    if (str(n) == node_inp):
-                        self.node_label_update_core_code(n)
-                        break
+            if diag_name is not None:
+                diagram = self.diagram(diag_name)
+                n = first(self.itemsByString(node_inp, diagram)) if diagram else None
+            else:
+                n = first(self.itemsByString(node_inp))
+            if n is not None:
+                self.node_label_update_core_code(n)
 
         #connect(self.sgnItemAdded, self.add_item_to_IRI_prefixes_nodes_dict)
         #connect(self.sgnItemRemoved, self.remove_item_from_IRI_prefixes_nodes_dict)
@@ -1031,8 +1150,8 @@ class Project(QtCore.QObject):
     def reset_changes_made_after_reasoning_task(self):
         self.session.doResetConsistencyCheck(updateNodes=True, clearReasonerCache=True)
 
-        disconnect(self.sgnItemAdded, self.reset_changes_made_after_reasoning_task)
-        disconnect(self.sgnItemRemoved, self.reset_changes_made_after_reasoning_task)
+        disconnect(self.sgnItemsAdded, self.reset_changes_made_after_reasoning_task)
+        disconnect(self.sgnItemsRemoved, self.reset_changes_made_after_reasoning_task)
 
     def colour_items_in_case_of_unsatisfiability_or_inconsistent_ontology(self):
         for node_or_edge in self.nodes_or_edges_of_explanations_to_display_in_widget:
@@ -1076,43 +1195,36 @@ class Project(QtCore.QObject):
 
         return False
 
+    def rebuild_OWL_terms_index(self):
+        """
+        Build from scratch the OWL term <-> node index using the current OWL 2 conversion cache.
+        Must be called from a thread attached to the JVM.
+        :rtype: OWLTermIndex
+        """
+        self._OWL_terms_index = OWLTermIndex(self, self.converted_nodes)
+        return self._OWL_terms_index
+
+    def get_OWL_terms_index(self):
+        """
+        Returns the OWL term <-> node index, rebuilding it if the project or the conversion cache changed since it was built.
+        :rtype: OWLTermIndex
+        """
+        if self._OWL_terms_index is None or not self._OWL_terms_index.isValid(self):
+            return self.rebuild_OWL_terms_index()
+        return self._OWL_terms_index
+
     def getOWLtermfornode(self, node):
 
         # looks up the dict for the raw term and then..
         # returns the string portion without the IRI and special characters
 
-        abs_nodes = self.nodes()
-
-        for diag, val_in_diag in self.converted_nodes.items():
-            for nd in val_in_diag:
-                abs_nd = None
-                for i in abs_nodes:
-                    #if i.id == nd:
-                    if (i.id_with_diag == str(diag + '-' + nd)):
-                        abs_nd = i
-                        break
-
-                if (val_in_diag[nd] is not None) and \
-                    ((str(diag + '-' + nd) == node.id_with_diag) or ((abs_nd is not None) and (abs_nd.text() == node.text()))):
-                    # ((nd==node.id) or ((abs_nd is not None) and (abs_nd.text()==node.text()))):
-                    if str(type(val_in_diag[nd])) == '<class \'list\'>':
-                        return_list = []
-                        for ele in val_in_diag[nd]:
-                            return_list.append(ele.toString())
-
-                        return return_list
-                    elif abs_nd.type() == Item.RoleChainNode:
-                        chainList = []
-                        listIter = val_in_diag[nd].iterator()
-
-                        while listIter.hasNext():
-                            chainList.append(listIter.next())
-
-                        return chainList
-                    else:
-                        return val_in_diag[nd].toString()
+        return self.get_OWL_terms_index().termForNode(node)
 
-        return None
+    def getnodesforOWLterm(self, term):
+
+        # looks up the nodes whose raw term is the given one
+
+        return self.get_OWL_terms_index().nodesForTerm(term)
 
     #############################################
     #   PROPERTIES
@@ -1137,11 +1249,31 @@ class Project(QtCore.QObject):
         """
         if self.index.addDiagram(diagram):
             self.sgnDiagramAdded.emit(diagram)
-            for item in diagram.items():
-                if item.isNode() or item.isEdge():
-                    diagram.sgnItemAdded.emit(diagram, item)
+            with diagram.batchUpdate():
+                for item in diagram.items():
+                    if item.isNode() or item.isEdge():
+                        diagram.sgnItemAdded.emit(diagram, item)
             self.sgnUpdated.emit()
 
+    @contextmanager
+    def batchUpdate(self):
+        """
+        Suspend the per-item signals of the project for the items added/removed within the context.
+        On exit, the changes are notified in order, coalescing consecutive additions (removals) of items of
+        the same diagram into a single sgnItemsAdded (sgnItemsRemoved) signal, followed by a single sgnUpdated.
+        """
+        self.updateBatch += 1
+        try:
+            yield
+        finally:
+            self.updateBatch -= 1
+            if not self.updateBatch and self.updateQueue:
+                queue = self.updateQueue
+                self.updateQueue = []
+                for added, diagram, items in queue:
+                    self.notifyItems(added, diagram, items)
+                self.sgnUpdated.emit()
+
     def diagram_from_its_name(self, d_name):
         """
         Retrieves a diagram given its id.
@@ -1166,7 +1298,7 @@ class Project(QtCore.QObject):
     def diagrams(self):
         """
         Returns a collection with all the diagrams in this Project.
-        :rtype: set
+        :rtype: frozenset
         """
         return self.index.diagrams()
 
@@ -1184,16 +1316,18 @@ class Project(QtCore.QObject):
         Returns a collection with all the edges in the given diagram.
         If no diagram is supplied a collection with all the edges in the Project will be returned.
         :type diagram: Diagram
-        :rtype: set
+        :rtype: frozenset
         """
         return self.index.edges(diagram)
 
-    def isEmpty(self):
+    def isEmpty(self, diagram=None):
         """
-        Returns True if the Project contains no element, False otherwise.
+        Returns True if the given diagram contains no element, False otherwise.
+        If no diagram is supplied, the check is extended to the whole Project.
+        :type diagram: Diagram
         :rtype: bool
         """
-        return self.index.isEmpty()
+        return self.index.isEmpty(diagram)
 
     def item(self, diagram, iid):
         """
@@ -1219,10 +1353,20 @@ class Project(QtCore.QObject):
         Returns a collection with all the items in the given diagram.
         If no diagram is supplied a collection with all the items in the Project will be returned.
         :type diagram: Diagram
-        :rtype: set
+        :rtype: frozenset
         """
         return self.index.items(diagram)
 
+    def itemsByString(self, string, diagram=None):
+        """
+        Returns a collection with all the items whose string representation (i.e: 'ConceptNode:n0') matches the given one.
+        If no diagram is supplied the lookup is performed across the whole Project.
+        :type string: str
+        :type diagram: Diagram
+        :rtype: frozenset
+        """
+        return self.index.itemsByString(string, diagram)
+
     def meta(self, item, name):
         """
         Returns metadata for the given predicate, expressed as pair (item, name).
@@ -1254,10 +1398,40 @@ class Project(QtCore.QObject):
         Returns a collection with all the nodes in the given diagram.
         If no diagram is supplied a collection with all the nodes in the Project will be returned.
         :type diagram: Diagram
-        :rtype: set
+        :rtype: frozenset
         """
         return self.index.nodes(diagram)
 
+    def notifyItem(self, added, diagram, item):
+        """
+        Notify the addition (or the removal) of the given item, or queue it if a batch update is in progress.
+        :type added: bool
+        :type diagram: Diagram
+        :type item: AbstractItem
+        """
+        if self.updateBatch:
+            if self.updateQueue and self.updateQueue[-1][:2] == (added, diagram):
+                self.updateQueue[-1][2].append(item)
+            else:
+                self.updateQueue.append((added, diagram, [item]))
+        else:
+            self.notifyItems(added, diagram, [item])
+            self.sgnUpdated.emit()
+
+    def notifyItems(self, added, diagram, items):
+        """
+        Emit the signals notifying the addition (or the removal) of the given collection of items.
+        Per-item signals are emitted only if somebody is connected to them.
+        :type added: bool
+        :type diagram: Diagram
+        :type items: list
+        """
+        single, batch = (self.sgnItemAdded, self.sgnItemsAdded) if added else (self.sgnItemRemoved, self.sgnItemsRemoved)
+        if self.receivers(single):
+            for item in items:
+                single.emit(diagram, item)
+        batch.emit(diagram, items)
+
     def predicateNum(self, item, diagram=None):
         """
         Returns the number of predicates of the given type which are defined in the given diagram.
@@ -1275,7 +1449,7 @@ class Project(QtCore.QObject):
         :type item: Item
         :type name: str
         :type diagram: Diagram
-        :rtype: set
+        :rtype: frozenset
         """
         return self.index.predicates(item, name, diagram)
 
@@ -1285,11 +1459,25 @@ class Project(QtCore.QObject):
         :type diagram: Diagram
         """
         if self.index.removeDiagram(diagram):
-            for item in self.items(diagram):
-                diagram.sgnItemRemoved.emit(diagram, item)
+            with diagram.batchUpdate():
+                for item in self.items(diagram):
+                    diagram.sgnItemRemoved.emit(diagram, item)
             self.sgnDiagramRemoved.emit(diagram)
             self.sgnUpdated.emit()
 
+    def select(self, types=None, identities=None, label=None, diagram=None):
+        """
+        Returns a collection with all the items matching the given types, identities and label in the given diagram.
+        Filters which are not supplied are not applied, while supplying identities or label restricts the result to nodes.
+        If no diagram is supplied the lookup is performed across the whole Project.
+        :type types: T <= list|set|tuple
+        :type identities: T <= list|set|tuple
+        :type label: str
+        :type diagram: Diagram
+        :rtype: frozenset
+        """
+        return self.index.select(types, identities, label, diagram)
+
     def setMeta(self, item, name, meta):
         """
         Set metadata for the given predicate type/name combination.
@@ -1323,8 +1511,54 @@ class Project(QtCore.QObject):
         :type item: AbstractItem
         """
         if self.index.addItem(diagram, item):
-            self.sgnItemAdded.emit(diagram, item)
-            self.sgnUpdated.emit()
+            self.notifyItem(True, diagram, item)
+
+    @QtCore.pyqtSlot(str, str, str)
+    def doClearConvertedNodes(self, iri, node, diagram):
+        """
+        Executed whenever the IRI/prefixes/nodes dictionary is updated.
+        Updates involving a single node are already tracked through the label change of the node,
+        while the others may affect the OWL 2 conversion of any node, hence the whole cache is dropped.
+        A new cache is created so that a worker still holding the old one is not affected.
+        :type iri: str
+        :type node: str
+        :type diagram: str
+        """
+        if not node:
+            self.converted_nodes = OWLConversionCache()
+
+    @QtCore.pyqtSlot(Item, str)
+    def doInvalidateConvertedMeta(self, item, name):
+        """
+        Executed whenever the meta of a predicate is added/removed.
+        This slot will discard the cached OWL 2 axioms generated by the nodes of the predicate, and
+        increment their revision, since profile rules may depend on the predicate meta (e.g: functionality).
+        :type item: Item
+        :type name: str
+        """
+        for node in self.predicates(item, name):
+            self.converted_nodes.invalidateAxioms(node.diagram, {node})
+            node.incrementRevision(structural=True)
+
+    @QtCore.pyqtSlot('QGraphicsScene', list)
+    def doInvalidateConvertedItems(self, diagram, items):
+        """
+        Executed whenever a collection of items of a diagram belonging to this Project is added or removed.
+        This slot will discard the cached OWL 2 conversions and axioms which depend on the given items.
+        :type diagram: Diagram
+        :type items: list
+        """
+        self.converted_nodes.invalidate(diagram, *items)
+
+    @QtCore.pyqtSlot('QGraphicsScene', 'QGraphicsItem')
+    def doInvalidateConvertedNodes(self, diagram, item):
+        """
+        Executed whenever an item of a diagram belonging to this Project is added, removed or modified.
+        This slot will discard the cached OWL 2 conversions and axioms which depend on the given item.
+        :type diagram: Diagram
+        :type item: AbstractItem
+        """
+        self.converted_nodes.invalidate(diagram, item)
 
     @QtCore.pyqtSlot('QGraphicsScene', 'QGraphicsItem')
     def doRemoveItem(self, diagram, item):
@@ -1335,13 +1569,17 @@ class Project(QtCore.QObject):
         :type item: AbstractItem
         """
         if self.index.removeItem(diagram, item):
-            self.sgnItemRemoved.emit(diagram, item)
-            self.sgnUpdated.emit()
+            self.notifyItem(False, diagram, item)
 
 
 class ProjectIndex(dict):
     """
     Extends built-in dict and implements the Project index.
+    Collections returned by the index are read-only snapshots (frozenset) which are cached
+    until the index is modified, so that repeated queries do not allocate new collections.
+    The index version is increased upon every modification, so clients can cheaply detect changes.
+    Nodes are additionally indexed by identity and label, and items by their string representation,
+    so that filtered queries (see ProjectIndex.select) cost proportionally to the size of their result.
     """
     def __init__(self):
         """
@@ -1350,10 +1588,17 @@ class ProjectIndex(dict):
         super().__init__(self)
         self[K_DIAGRAM] = dict()
         self[K_EDGE] = dict()
+        self[K_IDENTITY] = dict()
         self[K_ITEMS] = dict()
+        self[K_LABEL] = dict()
         self[K_NODE] = dict()
         self[K_PREDICATE] = dict()
+        self[K_STRING] = dict()
         self[K_TYPE] = dict()
+        self.entries = dict()
+        self.queries = dict()
+        self.snapshots = dict()
+        self.version = 0
 
     def addDiagram(self, diagram):
         """
@@ -1363,6 +1608,7 @@ class ProjectIndex(dict):
         """
         if diagram.name not in self[K_DIAGRAM]:
             self[K_DIAGRAM][diagram.name] = diagram
+            self.invalidate()
             return True
         return False
 
@@ -1383,10 +1629,14 @@ class ProjectIndex(dict):
             if i not in self[K_TYPE][diagram.name]:
                 self[K_TYPE][diagram.name][i] = set()
             self[K_TYPE][diagram.name][i] |= {item}
+            if str(item) not in self[K_STRING]:
+                self[K_STRING][str(item)] = dict()
+            self[K_STRING][str(item)][diagram.name] = item
             if item.isNode():
                 if diagram.name not in self[K_NODE]:
                     self[K_NODE][diagram.name] = dict()
                 self[K_NODE][diagram.name][item.id] = item
+                self.addEntry(diagram.name, item, item.identity(), self.labelFor(item))
                 if item.isPredicate():
                     #k = OWLText(item.text())
                     k = item.text().replace('\n','')
@@ -1401,9 +1651,31 @@ class ProjectIndex(dict):
                 if diagram.name not in self[K_EDGE]:
                     self[K_EDGE][diagram.name] = dict()
                 self[K_EDGE][diagram.name][item.id] = item
+            self.invalidate(diagram.name, item)
             return True
         return False
 
+    def addEntry(self, name, node, identity, label):
+        """
+        Index the given node by identity and label in the given diagram.
+        :type name: str
+        :type node: AbstractNode
+        :type identity: Identity
+        :type label: str
+        """
+        self.entries[node] = (identity, label)
+        if name not in self[K_IDENTITY]:
+            self[K_IDENTITY][name] = dict()
+        if identity not in self[K_IDENTITY][name]:
+            self[K_IDENTITY][name][identity] = set()
+        self[K_IDENTITY][name][identity] |= {node}
+        if label is not None:
+            if name not in self[K_LABEL]:
+                self[K_LABEL][name] = dict()
+            if label not in self[K_LABEL][name]:
+                self[K_LABEL][name][label] = set()
+            self[K_LABEL][name][label] |= {node}
+
     def diagram(self, did):
         """
         Retrieves a diagram given its id.
@@ -1418,9 +1690,9 @@ class ProjectIndex(dict):
     def diagrams(self):
         """
         Returns a collection with all the diagrams in this Project Index.
-        :rtype: set
+        :rtype: frozenset
         """
-        return set(self[K_DIAGRAM].values())
+        return self.snapshot(K_DIAGRAM)
 
     def edge(self, diagram, eid):
         """
@@ -1439,20 +1711,38 @@ class ProjectIndex(dict):
         Returns a collection with all the edges in the given diagram.
         If no diagram is supplied a collection with all the edges in the Project Index will be returned.
         :type diagram: Diagram
-        :rtype: set
+        :rtype: frozenset
         """
-        try:
-            if not diagram:
-                return set.union(*(set(self[K_EDGE][i].values()) for i in self[K_EDGE]))
-            return set(self[K_EDGE][diagram.name].values())
-        except (KeyError, TypeError):
-            return set()
+        return self.snapshot(K_EDGE, diagram.name if diagram else None)
+
+    def invalidate(self, name=None, item=None):
+        """
+        Discard the cached snapshots affected by the addition/removal of the given item to/from the given diagram.
+        If no item is supplied, all the cached snapshots are discarded.
+        :type name: str
+        :type item: AbstractItem
+        """
+        self.version += 1
+        self.queries.clear()
+        if item is None:
+            self.snapshots.clear()
+            return
+        for k in (K_ITEMS, K_NODE if item.isNode() else K_EDGE):
+            self.snapshots.pop((k, name), None)
+            self.snapshots.pop((k, None), None)
+        if item.isNode() and item.isPredicate():
+            for k in [k for k in self.snapshots if k[0] == K_PREDICATE]:
+                del self.snapshots[k]
 
-    def isEmpty(self):
+    def isEmpty(self, diagram=None):
         """
-        Returns True if the Project Index contains no element, False otherwise.
+        Returns True if the given diagram contains no element, False otherwise.
+        If no diagram is supplied, the check is extended to the whole Project Index.
+        :type diagram: Diagram
         :rtype: bool
         """
+        if diagram:
+            return not self[K_ITEMS].get(diagram.name)
         for i in self[K_ITEMS]:
             for _ in self[K_ITEMS][i]:
                 return False
@@ -1491,14 +1781,34 @@ class ProjectIndex(dict):
         Returns a collection with all the items in the given diagram.
         If no diagram is supplied a collection with all the items in the Project Index will be returned.
         :type diagram: Diagram
-        :rtype: set
+        :rtype: frozenset
         """
-        try:
-            if not diagram:
-                return set.union(*(set(self[K_ITEMS][i].values()) for i in self[K_ITEMS]))
-            return set(self[K_ITEMS][diagram.name].values())
-        except (KeyError, TypeError):
-            return set()
+        return self.snapshot(K_ITEMS, diagram.name if diagram else None)
+
+    def itemsByString(self, string, diagram=None):
+        """
+        Returns a collection with all the items whose string representation (i.e: 'ConceptNode:n0') matches the given one.
+        If no diagram is supplied the lookup is performed across the whole Project Index.
+        :type string: str
+        :type diagram: Diagram
+        :rtype: frozenset
+        """
+        subdict = self[K_STRING].get(string, {})
+        if diagram:
+            return frozenset(filter(None, (subdict.get(diagram.name),)))
+        return frozenset(subdict.values())
+
+    @staticmethod
+    def labelFor(node):
+        """
+        Returns the key used to index the label of the given node, or None if the node has no label.
+        :type node: AbstractNode
+        :rtype: str
+        """
+        text = node.text()
+        if isinstance(text, str):
+            return text.replace('\n', '')
+        return None
 
     def meta(self, item, name):
         """
@@ -1542,14 +1852,9 @@ class ProjectIndex(dict):
         Returns a collection with all the nodes in the given diagram.
         If no diagram is supplied a collection with all the nodes in the Project Index will be returned.
         :type diagram: Diagram
-        :rtype: set
+        :rtype: frozenset
         """
-        try:
-            if not diagram:
-                return set.union(*(set(self[K_NODE][i].values()) for i in self[K_NODE]))
-            return set(self[K_NODE][diagram.name].values())
-        except (KeyError, TypeError):
-            return set()
+        return self.snapshot(K_NODE, diagram.name if diagram else None)
 
     def predicateNum(self, item, diagram=None):
         """
@@ -1574,6 +1879,21 @@ class ProjectIndex(dict):
         :type item: Item
         :type name: str
         :type diagram: Diagram
+        :rtype: frozenset
+        """
+        key = (K_PREDICATE, item, name.replace('\n', '') if name else name, diagram.name if diagram else None)
+        try:
+            return self.snapshots[key]
+        except KeyError:
+            snapshot = self.snapshots[key] = frozenset(self.lookupPredicates(item, name, diagram))
+            return snapshot
+
+    def lookupPredicates(self, item=None, name=None, diagram=None):
+        """
+        Collect the predicate nodes matching the given type and name which belong to the given diagram.
+        :type item: Item
+        :type name: str
+        :type diagram: Diagram
         :rtype: set
         """
         try:
@@ -1648,9 +1968,29 @@ class ProjectIndex(dict):
         """
         if diagram.name in self[K_DIAGRAM]:
             del self[K_DIAGRAM][diagram.name]
+            self.invalidate()
             return True
         return False
 
+    def removeEntry(self, name, node):
+        """
+        Remove the given node from the identity and label indexes of the given diagram.
+        The node is removed using the identity and label it was indexed with, which may differ from the current ones.
+        :type name: str
+        :type node: AbstractNode
+        :rtype: tuple
+        """
+        identity, label = self.entries.pop(node, (None, None))
+        for key, value in ((K_IDENTITY, identity), (K_LABEL, label)):
+            if name in self[key]:
+                if value in self[key][name]:
+                    self[key][name][value] -= {node}
+                    if not self[key][name][value]:
+                        del self[key][name][value]
+                        if not self[key][name]:
+                            del self[key][name]
+        return identity, label
+
     def removeItem(self, diagram, item):
         """
         Remove the given item from the Project index.
@@ -1671,12 +2011,18 @@ class ProjectIndex(dict):
                         del self[K_TYPE][diagram.name][i]
                         if not self[K_TYPE][diagram.name]:
                             del self[K_TYPE][diagram.name]
+            if str(item) in self[K_STRING]:
+                if self[K_STRING][str(item)].get(diagram.name) is item:
+                    del self[K_STRING][str(item)][diagram.name]
+                    if not self[K_STRING][str(item)]:
+                        del self[K_STRING][str(item)]
             if item.isNode():
                 if diagram.name in self[K_NODE]:
                     if item.id in self[K_NODE][diagram.name]:
                         del self[K_NODE][diagram.name][item.id]
                         if not self[K_NODE][diagram.name]:
                             del self[K_NODE][diagram.name]
+                self.removeEntry(diagram.name, item)
                 if item.isPredicate():
                     #k = OWLText(item.text())
                     k = item.text().replace('\n','')
@@ -1696,9 +2042,67 @@ class ProjectIndex(dict):
                         del self[K_EDGE][diagram.name][item.id]
                         if not self[K_EDGE][diagram.name]:
                             del self[K_EDGE][diagram.name]
+            self.invalidate(diagram.name, item)
             return True
         return False
                 
+    def select(self, types=None, identities=None, label=None, diagram=None):
+        """
+        Returns a collection with all the items matching the given types, identities and label in the given diagram.
+        Filters which are not supplied are not applied, while supplying identities or label restricts the result to nodes.
+        If no diagram is supplied the lookup is performed across the whole Project Index.
+        :type types: T <= list|set|tuple
+        :type identities: T <= list|set|tuple
+        :type label: str
+        :type diagram: Diagram
+        :rtype: frozenset
+        """
+        types = frozenset(types) if types else None
+        identities = frozenset(identities) if identities else None
+        label = label.replace('\n', '') if label is not None else None
+        key = (types, identities, label, diagram.name if diagram else None)
+        try:
+            return self.queries[key]
+        except KeyError:
+            collection = set()
+            for name in [diagram.name] if diagram else list(self[K_ITEMS]):
+                candidates = []
+                if types:
+                    subdict = self[K_TYPE].get(name, {})
+                    candidates.append(set().union(*(subdict.get(i, ()) for i in types)))
+                if identities:
+                    subdict = self[K_IDENTITY].get(name, {})
+                    candidates.append(set().union(*(subdict.get(i, ()) for i in identities)))
+                if label is not None:
+                    candidates.append(self[K_LABEL].get(name, {}).get(label, set()))
+                if not candidates:
+                    candidates.append(self.snapshot(K_ITEMS, name))
+                candidates.sort(key=len)
+                collection.update(candidates[0].intersection(*candidates[1:]))
+            snapshot = self.queries[key] = frozenset(collection)
+            return snapshot
+
+    def snapshot(self, key, name=None):
+        """
+        Returns a read-only snapshot of the elements stored under the given key for the given diagram.
+        If no diagram name is supplied, the snapshot contains the elements of all the diagrams.
+        Snapshots are cached until an element is added to or removed from the affected diagram.
+        :type key: str
+        :type name: str
+        :rtype: frozenset
+        """
+        try:
+            return self.snapshots[key, name]
+        except KeyError:
+            if key == K_DIAGRAM:
+                snapshot = frozenset(self[K_DIAGRAM].values())
+            elif name is None:
+                snapshot = frozenset().union(*(self.snapshot(key, i) for i in self[key]))
+            else:
+                snapshot = frozenset(self[key].get(name, {}).values())
+            self.snapshots[key, name] = snapshot
+            return snapshot
+
     def setMeta(self, item, name, meta):
         """
         Set metadata for the given predicate type/name combination.
@@ -1732,6 +2136,23 @@ class ProjectIndex(dict):
                     return True
         return False
 
+    def updateIdentity(self, diagram, node):
+        """
+        Reindex the given node after its identity has changed.
+        :type diagram: Diagram
+        :type node: AbstractNode
+        :rtype: bool
+        """
+        if node in self.entries:
+            identity, label = self.entries[node]
+            if identity is not node.identity():
+                self.removeEntry(diagram.name, node)
+                self.addEntry(diagram.name, node, node.identity(), label)
+                self.version += 1
+                self.queries.clear()
+                return True
+        return False
+
 
 class ProjectMergeWorker(QtCore.QObject):
     """
@@ -0,0 +1,440 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+import os
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5 import QtCore
+
+from eddy.core.jvm import getJavaVM
+from eddy.core.output import getLogger
+from eddy.core.worker import AbstractWorker
+
+LOGGER = getLogger()
+
+
+class ReasonerSession(object):
+    """
+    Keeps a HermiT reasoner alive across the consistency checks of a project.
+    Upon every check the freshly generated axioms are compared with the ones loaded in the
+    reasoner, and only the difference is applied to the reasoned ontology: the reasoner buffers
+    such changes and processes them upon flush. The reasoner is rebuilt from scratch only when
+    the ontology identifier changes or when the difference is too large to be worth applying.
+    The session also computes on demand, and caches, the explanations of the unsatisfiable
+    entities found by the last check: see ReasonerSession.explain.
+    """
+    MaxDeltaRatio = 0.25
+    MinDeltaSize = 16
+
+    def __init__(self):
+        """
+        Initialize the reasoner session.
+        No Java object is created until the session is updated for the first time.
+        """
+        self.axioms = dict()
+        self.exhausted = set()
+        self.explanations = dict()
+        self.expressions = dict()
+        self.generatorFactory = None
+        self.locks = dict()
+        self.ontology = None
+        self.ontologyID = None
+        self.reasoner = None
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def addEntity(self, entity, expression):
+        """
+        Register an unsatisfiable entity, together with the class expression to be explained, and returns
+        the list which caches its explanations: the list is filled as explanations are computed.
+        :type entity: str
+        :type expression: OWLClassExpression
+        :rtype: list
+        """
+        self.expressions[entity] = expression
+        self.locks[entity] = threading.Lock()
+        return self.explanations.setdefault(entity, [])
+
+    def clearExplanations(self, generatorFactory=None):
+        """
+        Discard all the registered entities and cached explanations, and set the explanation generator factory to use
+        from now on: the factory is given an ExplanationProgressMonitor and returns a new explanation generator reporting
+        to it, so that every computation of explanations uses its own generator (generators are not thread safe).
+        :type generatorFactory: callable
+        """
+        self.exhausted = set()
+        self.explanations = dict()
+        self.expressions = dict()
+        self.generatorFactory = generatorFactory
+        self.locks = dict()
+
+    def dispose(self):
+        """
+        Dispose the reasoner, if any, and forget the reasoned ontology.
+        Must be called from a thread attached to the JVM.
+        """
+        if self.reasoner is not None:
+            try:
+                self.reasoner.dispose()
+            except Exception as e:
+                LOGGER.warning('Could not dispose the reasoner: %s', e)
+        self.axioms = dict()
+        self.ontology = None
+        self.ontologyID = None
+        self.reasoner = None
+        self.clearExplanations()
+
+    def explain(self, entity, limit, timeout=None, cancelled=lambda: False, found=lambda explanation: None):
+        """
+        Compute the explanations of the given unsatisfiable entity, up to the given limit, and returns them.
+        Cached explanations are reported first, then the missing ones are computed by a single run of a private
+        explanation generator: each new explanation is reported through the given callable as soon as the generator
+        finds it, and the run is interrupted once the given timeout (in seconds) expires or the given cancelled
+        callable returns True. Explanations of the same entity are never computed by two threads at the same time.
+        Must be called from a thread attached to the JVM.
+        :type entity: str
+        :type limit: int
+        :type timeout: float
+        :type cancelled: callable
+        :type found: callable
+        :rtype: list
+        """
+        cache = self.explanations.get(entity, [])
+        exhausted = self.exhausted
+        expression = self.expressions.get(entity)
+        factory = self.generatorFactory
+        lock = self.locks.get(entity)
+        if expression is None or factory is None or lock is None:
+            for explanation in cache[:limit]:
+                found(explanation)
+            return cache[:limit]
+        with lock:
+            for explanation in cache[:limit]:
+                found(explanation)
+            if len(cache) < limit and entity not in exhausted and not cancelled():
+                monitor = ExplanationMonitor(cache, limit, timeout, cancelled, found)
+                generator = factory(getJavaVM().createProxy(ExplanationMonitor.Interface, monitor))
+                for explanation in ReasonerSession.iterate(generator.getExplanations(expression, limit)):
+                    monitor.foundExplanation(explanation)
+                if not monitor.interrupted and len(cache) < limit:
+                    exhausted.add(entity)
+            return cache[:limit]
+
+    def isValid(self):
+        """
+        Returns True if the session holds a reasoner, False otherwise.
+        :rtype: bool
+        """
+        return self.reasoner is not None
+
+    def rebuild(self, ontology, axioms):
+        """
+        Create a new reasoner for the given ontology, containing the given axioms.
+        :type ontology: OWLOntology
+        :type axioms: dict
+        """
+        self.dispose()
+        vm = getJavaVM()
+        Configuration = vm.getJavaClass('org.semanticweb.HermiT.Configuration')
+        Reasoner = vm.getJavaClass('org.semanticweb.HermiT.Reasoner')
+        self.reasoner = Reasoner(Configuration(), ontology)
+        self.axioms = axioms
+        self.ontology = ontology
+        self.ontologyID = ontology.getOntologyID().toString()
+        LOGGER.debug('Created reasoner session (axioms = %s)', len(axioms))
+
+    def update(self, ontology, axioms):
+        """
+        Bring the reasoned ontology in sync with the given ontology, containing the given axioms, and returns the reasoner.
+        Must be called from a thread attached to the JVM.
+        :type ontology: OWLOntology
+        :type axioms: T <= list|set
+        :rtype: Reasoner
+        """
+        axioms = {axiom.toString(): axiom for axiom in axioms}
+        if not self.isValid() or ontology.getOntologyID().toString() != self.ontologyID:
+            self.rebuild(ontology, axioms)
+            return self.reasoner
+
+        added = [axioms[k] for k in axioms.keys() - self.axioms.keys()]
+        removed = [self.axioms[k] for k in self.axioms.keys() - axioms.keys()]
+        if len(added) + len(removed) > max(ReasonerSession.MinDeltaSize, len(axioms) * ReasonerSession.MaxDeltaRatio):
+            LOGGER.debug('Reasoner session delta too large (+%s/-%s): rebuilding', len(added), len(removed))
+            self.rebuild(ontology, axioms)
+            return self.reasoner
+
+        manager = self.ontology.getOWLOntologyManager()
+        for axiom in removed:
+            manager.removeAxiom(self.ontology, axiom)
+        for axiom in added:
+            manager.addAxiom(self.ontology, axiom)
+        self.axioms = axioms
+        self.clearExplanations()
+        self.reasoner.flush()
+        LOGGER.debug('Updated reasoner session (+%s/-%s axioms)', len(added), len(removed))
+        return self.reasoner
+
+    @staticmethod
+    def iterate(collection):
+        """
+        Iterate over the elements of the given Java collection.
+        :type collection: Collection
+        :rtype: generator
+        """
+        iterator = collection.iterator()
+        while iterator.hasNext():
+            yield iterator.next()
+
+
+class ExplanationMonitor(object):
+    """
+    Implements the ExplanationProgressMonitor Java interface, through a Java proxy, for a single run of an explanation
+    generator. New explanations are stored in the given cache, and reported through the given callable, as soon as the
+    generator finds them; the generator is asked to stop once the limit of explanations is reached, the given timeout
+    (in seconds) expires, or the given cancelled callable returns True.
+    """
+    Interface = 'com.clarkparsia.owlapi.explanation.util.ExplanationProgressMonitor'
+
+    def __init__(self, cache, limit, timeout, cancelled, found):
+        """
+        Initialize the explanation monitor.
+        :type cache: list
+        :type limit: int
+        :type timeout: float
+        :type cancelled: callable
+        :type found: callable
+        """
+        self.cache = cache
+        self.cancelled = cancelled
+        self.deadline = time.monotonic() + timeout if timeout else None
+        self.found = found
+        self.interrupted = False
+        self.keys = {self.keyOf(explanation) for explanation in cache}
+        self.limit = limit
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def foundAllExplanations(self):
+        """
+        Executed by the explanation generator when it found all the explanations.
+        """
+        pass
+
+    def foundExplanation(self, explanation):
+        """
+        Executed by the explanation generator whenever it finds an explanation.
+        :type explanation: Set
+        """
+        key = self.keyOf(explanation)
+        if key not in self.keys and len(self.cache) < self.limit:
+            self.keys.add(key)
+            self.cache.append(explanation)
+            self.found(explanation)
+
+    def isCancelled(self):
+        """
+        Returns True if the explanation generator should stop, False otherwise.
+        :rtype: bool
+        """
+        if not self.interrupted:
+            if self.cancelled() or (self.deadline and time.monotonic() > self.deadline):
+                self.interrupted = True
+        return self.interrupted or len(self.cache) >= self.limit
+
+    @staticmethod
+    def keyOf(explanation):
+        """
+        Returns a key identifying the given explanation regardless of the order of its axioms.
+        :type explanation: Set
+        :rtype: frozenset
+        """
+        return frozenset(axiom.toString() for axiom in ReasonerSession.iterate(explanation))
+
+
+class ExplanationWorker(AbstractWorker):
+    """
+    Extends AbstractWorker providing a worker which computes the explanations of an unsatisfiable entity.
+    Explanations are emitted one by one as they are computed: the worker can be cancelled at any time,
+    and it stops once the configured limit of explanations or the configured timeout is reached.
+    Every computation uses its own explanation generator, so that workers of entities selected one after
+    the other never share a generator (and hence reasoners), which is not thread safe.
+    """
+    sgnExplanation = QtCore.pyqtSignal(str, int, object)
+
+    def __init__(self, session, entity, limit, timeout):
+        """
+        Initialize the explanation worker.
+        :type session: ReasonerSession
+        :type entity: str
+        :type limit: int
+        :type timeout: float
+        """
+        super().__init__()
+        self.cancelled = False
+        self.completed = threading.Event()
+        self.count = 0
+        self.entity = entity
+        self.limit = limit
+        self.session = session
+        self.timeout = timeout
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def cancel(self):
+        """
+        Request the worker to stop as soon as possible.
+        """
+        self.cancelled = True
+
+    @QtCore.pyqtSlot()
+    def run(self):
+        """
+        Main worker.
+        """
+        vm = getJavaVM()
+        vm.attachThreadToJVM()
+        try:
+            self.session.explain(self.entity, self.limit, self.timeout, lambda: self.cancelled, self.found)
+        except Exception as e:
+            LOGGER.exception('Could not compute the explanations of %s: %s', self.entity, e)
+        finally:
+            vm.detachThreadFromJVM()
+            self.completed.set()
+            self.finished.emit()
+
+    def found(self, explanation):
+        """
+        Emit the given explanation, unless the worker has been cancelled.
+        :type explanation: Set
+        """
+        if not self.cancelled:
+            self.sgnExplanation.emit(self.entity, self.count, explanation)
+            self.count += 1
+
+    def wait(self, timeout=None):
+        """
+        Block until the worker completes its job, or until the given timeout (in seconds) expires.
+        Returns True if the worker completed its job, False otherwise.
+        :type timeout: float
+        :rtype: bool
+        """
+        return self.completed.wait(timeout)
+
+
+class ExplanationPoolWorker(AbstractWorker):
+    """
+    Extends AbstractWorker providing a worker which computes the explanations of many unsatisfiable entities
+    concurrently, using a bounded pool of threads attached to the JVM. Every task creates its own explanation
+    generator (and hence its own reasoners), so that no Java object which is not thread safe is shared among
+    threads. Explanations are stored in the cache of the reasoner session: the explanations of each entity are
+    kept in the order in which they are computed, and entities are kept in the order in which they were registered.
+    """
+    DefaultWorkers = max(1, min(4, os.cpu_count() or 1))
+
+    sgnProgress = QtCore.pyqtSignal(int, int)
+
+    def __init__(self, session, entities, limit, timeout, workers=DefaultWorkers):
+        """
+        Initialize the explanation pool worker.
+        :type session: ReasonerSession
+        :type entities: list
+        :type limit: int
+        :type timeout: float
+        :type workers: int
+        """
+        super().__init__()
+        self.cancelled = False
+        self.completed = threading.Event()
+        self.entities = list(entities)
+        self.limit = limit
+        self.session = session
+        self.timeout = timeout
+        self.workers = workers
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def cancel(self):
+        """
+        Request the worker to stop as soon as possible.
+        """
+        self.cancelled = True
+
+    def explain(self, entity):
+        """
+        Compute the explanations of the given entity: executed by the threads of the pool.
+        :type entity: str
+        """
+        if not self.cancelled:
+            vm = getJavaVM()
+            vm.attachThreadToJVM()
+            try:
+                self.session.explain(entity, self.limit, self.timeout, lambda: self.cancelled)
+            except Exception as e:
+                LOGGER.exception('Could not compute the explanations of %s: %s', entity, e)
+            finally:
+                vm.detachThreadFromJVM()
+
+    @QtCore.pyqtSlot()
+    def run(self):
+        """
+        Main worker.
+        """
+        try:
+            if self.session.generatorFactory is not None:
+                with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                    for count, _ in enumerate(executor.map(self.explain, self.entities), start=1):
+                        self.sgnProgress.emit(count, len(self.entities))
+        finally:
+            self.completed.set()
+            self.finished.emit()
+
+    def wait(self, timeout=None):
+        """
+        Block until the worker completes its job, or until the given timeout (in seconds) expires.
+        Returns True if the worker completed its job, False otherwise.
+        :type timeout: float
+        :rtype: bool
+        """
+        return self.completed.wait(timeout)
@@ -46,7 +46,9 @@ from eddy.core.items.common import AbstractItem
 from eddy.core.jvm import getJavaVM
 from eddy.core.output import getLogger
 from eddy.core.plugin import AbstractPlugin
+from eddy.core.reasoner import ExplanationWorker
 from eddy.ui.dock import DockWidget
+from eddy.ui.explorer import ExplorerItemModel
 from eddy.ui.fields import StringField
 
 LOGGER = getLogger()
@@ -76,6 +78,7 @@ class ExplanationExplorerPlugin(AbstractPlugin):
         """
         Executed when the consistency check is started.
         """
+        self.stopExplanations()
         self.widget('explanation_explorer').doClear()
 
     @QtCore.pyqtSlot()
@@ -83,6 +86,7 @@ class ExplanationExplorerPlugin(AbstractPlugin):
         """
         Executed when the consistency check is resetted.
         """
+        self.stopExplanations()
         self.widget('explanation_explorer').doClear()
         if self.widget('explanation_explorer_dock').isVisible():
             self.widget('explanation_explorer_dock').toggleViewAction().trigger()
@@ -110,19 +114,31 @@ class ExplanationExplorerPlugin(AbstractPlugin):
         """
         self.widget('explanation_explorer').doClear()
 
+    @QtCore.pyqtSlot(str, int, object)
+    def onExplanationFound(self, entity, count, explanation):
+        """
+        Executed when the explanation worker computes a new explanation for the selected unsatisfiable entity.
+        :type entity: str
+        :type count: int
+        :type explanation: Set
+        """
+        if self.sender() is self.worker:
+            axioms = []
+            explanation_itr = explanation.iterator()
+            while explanation_itr.hasNext():
+                axioms.append(explanation_itr.next())
+            self.addExplanation(count, axioms)
+
     @QtCore.pyqtSlot()
     def doUpdateExplanations(self):
         """
         Executed when the ontology is inconsistent or there are unsatisfiable classes to update the explanations.
         """
-        # CONNECT TO PROJECT SPECIFIC SIGNALS
         widget = self.widget('explanation_explorer')
         widget.doClear()
 
-        # FILL IN EXPLANATION EXPLORER WITH DATA
-        connect(self.sgnFakeExplanationAdded, widget.doAddExplanation)
-        connect(self.sgnFakeAxiomAdded, widget.doAddAxiom)
-        connect(self.sgnFakeItemAdded, widget.doAddNodeOREdge)
+        # STOP COMPUTING THE EXPLANATIONS OF THE PREVIOUSLY SELECTED ENTITY
+        self.cancelExplanations()
 
         self.vm = getJavaVM()
         if not self.vm.isRunning():
@@ -131,80 +147,97 @@ class ExplanationExplorerPlugin(AbstractPlugin):
 
         # Choose the explanation
         if len(self.project.explanations_for_inconsistent_ontology) > 0:
-            explanations_for_widget = self.project.explanations_for_inconsistent_ontology
+            for explanation_count, e in enumerate(self.project.explanations_for_inconsistent_ontology):
+                axioms = []
+                axioms_temp_itr = e.getAxioms().iterator()
+                while axioms_temp_itr.hasNext():
+                    axioms.append(axioms_temp_itr.next())
+                self.addExplanation(explanation_count, axioms)
         else:
-            if 'ConceptNode' in self.project.uc_as_input_for_explanation_explorer:
-                unsatisfiable_entities = self.project.unsatisfiable_classes
-                explanations_unsatisfiable_entity = self.project.explanations_for_unsatisfiable_classes
-            elif 'AttributeNode' in self.project.uc_as_input_for_explanation_explorer:
-                unsatisfiable_entities = self.project.unsatisfiable_attributes
-                explanations_unsatisfiable_entity = self.project.explanations_for_unsatisfiable_attributes
-            elif 'RoleNode' in self.project.uc_as_input_for_explanation_explorer:
-                unsatisfiable_entities = self.project.unsatisfiable_roles
-                explanations_unsatisfiable_entity = self.project.explanations_for_unsatisfiable_roles
-
-            inp_node = None
-
-            for n in self.project.nodes():
-                if str(n) == self.project.uc_as_input_for_explanation_explorer:
-                    inp_node = n
-                    break
-
+            inp_node = first(self.project.itemsByString(self.project.uc_as_input_for_explanation_explorer))
             OWL_term_uc_as_input_for_explanation_explorer = self.project.getOWLtermfornode(inp_node)
-            index_uc = unsatisfiable_entities.index(OWL_term_uc_as_input_for_explanation_explorer)
-            explanations_for_widget = explanations_unsatisfiable_entity[index_uc]
 
-        for explanation_count, e in enumerate(explanations_for_widget):
-            self.sgnFakeExplanationAdded.emit(str(explanation_count + 1))
+            # EXPLANATIONS ARE COMPUTED IN BACKGROUND AND ADDED TO THE WIDGET AS SOON AS THEY ARE FOUND
+            settings = QtCore.QSettings()
+            self.worker = ExplanationWorker(self.project.reasoner_session,
+                                            OWL_term_uc_as_input_for_explanation_explorer,
+                                            settings.value('reasoner/explanations/limit', 10, int),
+                                            settings.value('reasoner/explanations/timeout', 60, int))
+            connect(self.worker.sgnExplanation, self.onExplanationFound)
+            self.workers += 1
+            self.running = {k: v for k, v in self.running.items() if not v.wait(0)}
+            self.running['explanations:{0}'.format(self.workers)] = self.worker
+            self.session.startThread('explanations:{0}'.format(self.workers), self.worker)
+
+        # SHOW THE PLUGIN DOCK WIDGET
+        if not self.widget('explanation_explorer_dock').isVisible():
+            self.widget('explanation_explorer_dock').toggleViewAction().trigger()
+            self.widget('explanation_explorer_dock').raise_()
+
+    #############################################
+    #   INTERFACE
+    #################################
 
-        for explanation_count, e in enumerate(explanations_for_widget):
-            axioms_for_iteration = []
+    def cancelExplanations(self):
+        """
+        Stop the computation of the explanations of the selected unsatisfiable entity, if any.
+        Explanations computed so far are kept in the reasoner session cache.
+        """
+        if self.worker:
+            self.worker.cancel()
+            self.worker = None
 
-            if self.project.inconsistent_ontology:
-                axioms_temp = e.getAxioms()
-                axioms_temp_itr = axioms_temp.iterator()
-                while axioms_temp_itr.hasNext():
-                    axiom_temp = axioms_temp_itr.next()
-                    axioms_for_iteration.append(axiom_temp)
-            else:
-                e_itr = e.iterator()
-                while e_itr.hasNext():
-                    axiom_temp = e_itr.next()
-                    axioms_for_iteration.append(axiom_temp)
-
-            for axiom_count, axiom_e in enumerate(axioms_for_iteration):
-                q_exp_items = widget.model.findItems('Explanation - ' + str(explanation_count + 1),
-                                                     flags=QtCore.Qt.MatchExactly, column=0)
-                if len(q_exp_items) != 1:
-                    LOGGER.error('multiple or 0 QStandardItems found for q_exp_item')
-
-                self.sgnFakeAxiomAdded.emit(q_exp_items[0], axiom_e.toString())
-                q_axiom_item = q_exp_items[0].child(axiom_count, 0)
-                nodes_and_edges = self.project.axioms_to_nodes_edges_mapping[q_axiom_item.text()]
-                nodes_to_add_in_widget = set()
-                edges_to_add_in_widget = set()
-
-                for ne in nodes_and_edges:
-                    if 'eddy.core.items.nodes' in str(type(ne)):
-                        nodes_to_add_in_widget.add(ne)
-                    elif 'eddy.core.items.edges' in str(type(ne)):
-                        edges_to_add_in_widget.add(ne)
-
-                for node in nodes_to_add_in_widget:
-                    self.sgnFakeItemAdded.emit(node.diagram, node, q_axiom_item)
-
-                for edge in edges_to_add_in_widget:
-                    self.sgnFakeItemAdded.emit(edge.diagram, edge, q_axiom_item)
+    def stopExplanations(self):
+        """
+        Stop the computation of the explanations of all the unsatisfiable entities selected so far.
+        Returns immediately: explanation threads reason over a snapshot of the ontology, and terminate on
+        their own as soon as the explanation generators they are running notice the cancellation.
+        """
+        self.cancelExplanations()
+        for worker in self.running.values():
+            worker.cancel()
+        self.running.clear()
+
+    def addExplanation(self, explanation_count, axioms_for_iteration):
+        """
+        Add an explanation, composed of the given axioms, to the explanation explorer.
+        :type explanation_count: int
+        :type axioms_for_iteration: list
+        """
+        widget = self.widget('explanation_explorer')
+        connect(self.sgnFakeExplanationAdded, widget.doAddExplanation)
+        connect(self.sgnFakeAxiomAdded, widget.doAddAxiom)
+        connect(self.sgnFakeItemAdded, widget.doAddNodeOREdge)
+
+        self.sgnFakeExplanationAdded.emit(str(explanation_count + 1))
+
+        for axiom_count, axiom_e in enumerate(axioms_for_iteration):
+            q_exp_item = widget.model.parentFor(str(explanation_count + 1))
+            if not q_exp_item:
+                LOGGER.error('no QStandardItem found for q_exp_item')
+
+            self.sgnFakeAxiomAdded.emit(q_exp_item, axiom_e.toString())
+            q_axiom_item = q_exp_item.child(axiom_count, 0)
+            nodes_and_edges = self.project.axioms_to_nodes_edges_mapping[q_axiom_item.text()]
+            nodes_to_add_in_widget = set()
+            edges_to_add_in_widget = set()
+
+            for ne in nodes_and_edges:
+                if 'eddy.core.items.nodes' in str(type(ne)):
+                    nodes_to_add_in_widget.add(ne)
+                elif 'eddy.core.items.edges' in str(type(ne)):
+                    edges_to_add_in_widget.add(ne)
+
+            for node in nodes_to_add_in_widget:
+                self.sgnFakeItemAdded.emit(node.diagram, node, q_axiom_item)
+
+            for edge in edges_to_add_in_widget:
+                self.sgnFakeItemAdded.emit(edge.diagram, edge, q_axiom_item)
 
         disconnect(self.sgnFakeExplanationAdded, widget.doAddExplanation)
         disconnect(self.sgnFakeAxiomAdded, widget.doAddAxiom)
         disconnect(self.sgnFakeItemAdded, widget.doAddNodeOREdge)
 
-        # SHOW THE PLUGIN DOCK WIDGET
-        if not self.widget('explanation_explorer_dock').isVisible():
-            self.widget('explanation_explorer_dock').toggleViewAction().trigger()
-            self.widget('explanation_explorer_dock').raise_()
-
     #############################################
     #   HOOKS
     #################################
@@ -213,6 +246,8 @@ class ExplanationExplorerPlugin(AbstractPlugin):
         """
         Executed whenever the plugin is going to be destroyed.
         """
+        self.stopExplanations()
+
         # DISCONNECT FROM CURRENT PROJECT
         widget = self.widget('explanation_explorer')
         self.debug('Disconnecting from project: %s', self.project.name)
@@ -241,6 +276,10 @@ class ExplanationExplorerPlugin(AbstractPlugin):
         """
         Perform initialization tasks for the plugin.
         """
+        self.running = {}
+        self.worker = None
+        self.workers = 0
+
         # INITIALIZE THE WIDGET
         self.debug('Creating Explanation explorer widget')
         widget = ExplanationExplorerWidget(self)
@@ -308,7 +347,7 @@ class ExplanationExplorerWidget(QtWidgets.QWidget):
         self.search.setClearButtonEnabled(True)
         self.search.setPlaceholderText('Search...')
         self.search.setFixedHeight(30)
-        self.model = QtGui.QStandardItemModel(self)
+        self.model = ExplorerItemModel(self)
         self.proxy = QtCore.QSortFilterProxyModel(self)
         self.proxy.setDynamicSortFilter(False)
         self.proxy.setFilterCaseSensitivity(QtCore.Qt.CaseInsensitive)
@@ -444,7 +483,7 @@ class ExplanationExplorerWidget(QtWidgets.QWidget):
     def doAddExplanation(self, explanation_number):
         explanation_number_to_add = QtGui.QStandardItem('Explanation - ' + explanation_number)
         explanation_number_to_add.setData(explanation_number)
-        self.model.appendRow(explanation_number_to_add)
+        self.model.addParent(explanation_number, explanation_number_to_add)
         self.proxy.sort(0, QtCore.Qt.AscendingOrder)
 
     @QtCore.pyqtSlot('QStandardItem', str)
@@ -480,15 +519,14 @@ class ExplanationExplorerWidget(QtWidgets.QWidget):
         :type node: AbstractItem
         """
         if node.type() in {Item.ConceptNode, Item.RoleNode, Item.AttributeNode, Item.IndividualNode}:
-            parent = self.parentFor(node)
-            if not parent:
+            key = self.parentKey(node), node.type()
+            if not self.model.parentFor(key):
                 parent = QtGui.QStandardItem(self.parentKey(node))
                 parent.setIcon(self.iconFor(node))
-                self.model.appendRow(parent)
-                self.proxy.sort(0, QtCore.Qt.AscendingOrder)
+                self.model.addParent(key, parent)
             child = QtGui.QStandardItem(self.childKey(diagram, node))
             child.setData(node)
-            parent.appendRow(child)
+            self.model.addChild(key, child)
             self.proxy.sort(0, QtCore.Qt.AscendingOrder)
 
     @QtCore.pyqtSlot()
@@ -517,13 +555,7 @@ class ExplanationExplorerWidget(QtWidgets.QWidget):
         :type node: AbstractItem
         """
         if node.type() in {Item.ConceptNode, Item.RoleNode, Item.AttributeNode, Item.IndividualNode}:
-            parent = self.parentFor(node)
-            if parent:
-                child = self.childFor(parent, diagram, node)
-                if child:
-                    parent.removeRow(child.index().row())
-                if not parent.rowCount():
-                    self.model.removeRow(parent.index().row())
+            self.model.removeChild((self.parentKey(node), node.type()), self.childKey(diagram, node))
 
     @QtCore.pyqtSlot('QModelIndex')
     def onItemDoubleClicked(self, index):
@@ -561,19 +593,14 @@ class ExplanationExplorerWidget(QtWidgets.QWidget):
     #   INTERFACE
     #################################
 
-    def childFor(self, parent, diagram, node):
+    def childFor(self, diagram, node):
         """
-        Search the item representing this node among parent children.
-        :type parent: QtGui.QStandardItem
+        Returns the item representing the given node, if any.
         :type diagram: Diagram
         :type node: AbstractNode
+        :rtype: QtGui.QStandardItem
         """
-        key = self.childKey(diagram, node)
-        for i in range(parent.rowCount()):
-            child = parent.child(i)
-            if child.text() == key:
-                return child
-        return None
+        return self.model.childFor((self.parentKey(node), node.type()), self.childKey(diagram, node))
 
     @staticmethod
     def childKey(diagram, node):
@@ -610,11 +637,7 @@ class ExplanationExplorerWidget(QtWidgets.QWidget):
         :type node: AbstractNode
         :rtype: QtGui.QStandardItem
         """
-        for i in self.model.findItems(self.parentKey(node), QtCore.Qt.MatchExactly):
-            n = i.child(0).data()
-            if node.type() is n.type():
-                return i
-        return None
+        return self.model.parentFor((self.parentKey(node), node.type()))
 
     @staticmethod
     def parentKey(node):
@@ -115,17 +115,17 @@ class InfoPlugin(AbstractPlugin):
         """
         self.widget('info').stack()
 
-    @QtCore.pyqtSlot('QGraphicsScene', 'QGraphicsItem')
-    def onProjectItemAdded(self, diagram, item):
+    @QtCore.pyqtSlot('QGraphicsScene', list)
+    def onProjectItemsAdded(self, diagram, items):
         """
-        Executed whenever a new element is added to the active project.
+        Executed whenever a collection of elements is added to the active project.
         """
         self.widget('info').stack()
 
-    @QtCore.pyqtSlot('QGraphicsScene', 'QGraphicsItem')
-    def onProjectItemRemoved(self, diagram, item):
+    @QtCore.pyqtSlot('QGraphicsScene', list)
+    def onProjectItemsRemoved(self, diagram, items):
         """
-        Executed whenever a new element is removed from the active project.
+        Executed whenever a collection of elements is removed from the active project.
         """
         self.widget('info').stack()
 
@@ -145,8 +145,8 @@ class InfoPlugin(AbstractPlugin):
         connect(self.project.sgnUpdated, self.onProjectUpdated)
         connect(self.project.sgnDiagramAdded, self.onDiagramAdded)
         connect(self.project.sgnDiagramRemoved, self.onDiagramRemoved)
-        connect(self.project.sgnItemAdded, self.onProjectItemAdded)
-        connect(self.project.sgnItemRemoved, self.onProjectItemRemoved)
+        connect(self.project.sgnItemsAdded, self.onProjectItemsAdded)
+        connect(self.project.sgnItemsRemoved, self.onProjectItemsRemoved)
         connect(self.project.sgnUpdated, self.onProjectUpdated)
         self.widget('info').stack()
 
@@ -199,8 +199,8 @@ class InfoPlugin(AbstractPlugin):
         disconnect(self.project.sgnUpdated, self.onProjectUpdated)
         disconnect(self.project.sgnDiagramAdded, self.onDiagramAdded)
         disconnect(self.project.sgnDiagramRemoved, self.onDiagramRemoved)
-        disconnect(self.project.sgnItemAdded, self.onProjectItemAdded)
-        disconnect(self.project.sgnItemRemoved, self.onProjectItemRemoved)
+        disconnect(self.project.sgnItemsAdded, self.onProjectItemsAdded)
+        disconnect(self.project.sgnItemsRemoved, self.onProjectItemsRemoved)
 
         # DISCONNECT FROM ACTIVE SESSION
         self.debug('Disconnecting from active session')
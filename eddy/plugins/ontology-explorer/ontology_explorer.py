@@ -47,6 +47,7 @@ from eddy.core.project import K_DESCRIPTION_STATUS
 from eddy.core.plugin import AbstractPlugin
 
 from eddy.ui.dock import DockWidget
+from eddy.ui.explorer import ExplorerItemModel
 from eddy.ui.fields import StringField
 
 
@@ -68,13 +69,13 @@ class OntologyExplorerPlugin(AbstractPlugin):
         # CONNECT TO PROJECT SPECIFIC SIGNALS
         widget = self.widget('ontology_explorer')
         self.debug('Connecting to project: %s', self.project.name)
-        connect(self.project.sgnItemAdded, widget.doAddNode)
-        connect(self.project.sgnItemRemoved, widget.doRemoveNode)
+        connect(self.project.sgnItemsAdded, widget.doAddNodes)
+        connect(self.project.sgnItemsRemoved, widget.doRemoveNodes)
         connect(self.project.sgnMetaAdded, widget.onMetaUpdated)
         connect(self.project.sgnMetaRemoved, widget.onMetaUpdated)
         # FILL IN ONTOLOGY EXPLORER WITH DATA
         connect(self.sgnFakeItemAdded, widget.doAddNode)
-        for node in self.project.nodes():
+        for node in self.project.select(types=widget.items):
             self.sgnFakeItemAdded.emit(node.diagram, node)
         widget.doFilterItem('')
         disconnect(self.sgnFakeItemAdded, widget.doAddNode)
@@ -90,8 +91,8 @@ class OntologyExplorerPlugin(AbstractPlugin):
         # DISCONNECT FROM CURRENT PROJECT
         widget = self.widget('ontology_explorer')
         self.debug('Disconnecting from project: %s', self.project.name)
-        disconnect(self.project.sgnItemAdded, widget.doAddNode)
-        disconnect(self.project.sgnItemRemoved, widget.doRemoveNode)
+        disconnect(self.project.sgnItemsAdded, widget.doAddNodes)
+        disconnect(self.project.sgnItemsRemoved, widget.doRemoveNodes)
         disconnect(self.project.sgnMetaAdded, widget.onMetaUpdated)
         disconnect(self.project.sgnMetaRemoved, widget.onMetaUpdated)
 
@@ -199,6 +200,8 @@ class OntologyExplorerWidget(QtWidgets.QWidget):
     sgnItemDoubleClicked = QtCore.pyqtSignal('QGraphicsItem')
     sgnItemRightClicked = QtCore.pyqtSignal('QGraphicsItem')
 
+    FilterInterval = 100
+
     def __init__(self, plugin):
         """
         Initialize the ontology explorer widget.
@@ -232,7 +235,7 @@ class OntologyExplorerWidget(QtWidgets.QWidget):
         self.search.setPlaceholderText('Search...')
         self.search.setToolTip('Search ({})'.format(self.searchShortcut.key().toString(QtGui.QKeySequence.NativeText)))
         self.search.setFixedHeight(30)
-        self.model = QtGui.QStandardItemModel(self)
+        self.model = ExplorerItemModel(self)
         self.proxy = OntologyExplorerFilterProxyModel(self)
         self.proxy.setDynamicSortFilter(False)
         self.proxy.setFilterCaseSensitivity(QtCore.Qt.CaseInsensitive)
@@ -248,6 +251,10 @@ class OntologyExplorerWidget(QtWidgets.QWidget):
         self.setContentsMargins(0, 0, 0, 0)
         self.setMinimumWidth(216)
 
+        self.filterTimer = QtCore.QTimer(self)
+        self.filterTimer.setSingleShot(True)
+        self.filterTimer.setInterval(self.FilterInterval)
+
         self.setStyleSheet("""
             QLineEdit,
             QLineEdit:editable,
@@ -272,6 +279,7 @@ class OntologyExplorerWidget(QtWidgets.QWidget):
         connect(self.search.textChanged, self.doFilterItem)
         connect(self.search.returnPressed, self.onReturnPressed)
         connect(self.searchShortcut.activated, self.doFocusSearch)
+        connect(self.filterTimer.timeout, self.doInvalidateFilter)
         connect(self.sgnItemActivated, self.session.doFocusItem)
         connect(self.sgnItemDoubleClicked, self.session.doFocusItem)
         connect(self.sgnItemRightClicked, self.session.doFocusItem)
@@ -322,22 +330,20 @@ class OntologyExplorerWidget(QtWidgets.QWidget):
         :type diagram: QGraphicsScene
         :type node: AbstractItem
         """
-        if node.type() in self.items:
-            parent = self.parentFor(node)
-            if not parent:
-                parent = QtGui.QStandardItem(self.parentKey(node))
-                parent.setIcon(self.iconFor(node))
-                self.model.appendRow(parent)
-            child = QtGui.QStandardItem(self.childKey(diagram, node))
-            child.setData(node)
-            # CHECK FOR DUPLICATE NODES
-            children = [parent.child(i) for i in range(parent.rowCount())]
-            if not any([child.text() == c.text() for c in children]):
-                parent.appendRow(child)
-            # APPLY FILTERS AND SORT
-            if self.sender() != self.plugin:
-                self.proxy.invalidateFilter()
-                self.proxy.sort(0, QtCore.Qt.AscendingOrder)
+        self.addNode(diagram, node)
+        if self.sender() != self.plugin:
+            self.scheduleFilter()
+
+    @QtCore.pyqtSlot('QGraphicsScene', list)
+    def doAddNodes(self, diagram, nodes):
+        """
+        Add a collection of nodes in the tree view, filtering the view only once.
+        :type diagram: QGraphicsScene
+        :type nodes: list
+        """
+        for node in nodes:
+            self.addNode(diagram, node)
+        self.scheduleFilter()
 
     @QtCore.pyqtSlot(str)
     def doFilterItem(self, key):
@@ -346,7 +352,6 @@ class OntologyExplorerWidget(QtWidgets.QWidget):
         :type key: str
         """
         self.proxy.setFilterFixedString(key)
-        self.proxy.sort(QtCore.Qt.AscendingOrder)
 
     @QtCore.pyqtSlot()
     def doFocusSearch(self):
@@ -363,6 +368,14 @@ class OntologyExplorerWidget(QtWidgets.QWidget):
         self.search.setFocus()
         self.search.selectAll()
 
+    @QtCore.pyqtSlot()
+    def doInvalidateFilter(self):
+        """
+        Executed when the filter of the tree view needs to be applied again.
+        """
+        self.filterTimer.stop()
+        self.proxy.invalidateFilter()
+
     @QtCore.pyqtSlot('QGraphicsScene', 'QGraphicsItem')
     def doRemoveNode(self, diagram, node):
         """
@@ -370,14 +383,17 @@ class OntologyExplorerWidget(QtWidgets.QWidget):
         :type diagram: QGraphicsScene
         :type node: AbstractItem
         """
-        if node.type() in self.items:
-            parent = self.parentFor(node)
-            if parent:
-                child = self.childFor(parent, diagram, node)
-                if child:
-                    parent.removeRow(child.index().row())
-                if not parent.rowCount():
-                    self.model.removeRow(parent.index().row())
+        self.removeNode(diagram, node)
+
+    @QtCore.pyqtSlot('QGraphicsScene', list)
+    def doRemoveNodes(self, diagram, nodes):
+        """
+        Remove a collection of nodes from the tree view.
+        :type diagram: QGraphicsScene
+        :type nodes: list
+        """
+        for node in nodes:
+            self.removeNode(diagram, node)
 
     @QtCore.pyqtSlot('QModelIndex')
     def onItemActivated(self, index):
@@ -437,8 +453,7 @@ class OntologyExplorerWidget(QtWidgets.QWidget):
             elems.add(data)
         else:
             elems.discard(data)
-        self.proxy.invalidateFilter()
-        self.proxy.sort(0, QtCore.Qt.AscendingOrder)
+        self.doInvalidateFilter()
 
     @QtCore.pyqtSlot(Item, str)
     def onMetaUpdated(self, item, name):
@@ -447,8 +462,7 @@ class OntologyExplorerWidget(QtWidgets.QWidget):
         :type item: Item
         :type name: str
         """
-        self.proxy.invalidateFilter()
-        self.proxy.sort(0, QtCore.Qt.AscendingOrder)
+        self.scheduleFilter()
 
     @QtCore.pyqtSlot()
     def onReturnPressed(self):
@@ -461,19 +475,30 @@ class OntologyExplorerWidget(QtWidgets.QWidget):
     #   INTERFACE
     #################################
 
-    def childFor(self, parent, diagram, node):
+    def addNode(self, diagram, node):
+        """
+        Add a node in the tree view, in sorted position, without filtering the view.
+        :type diagram: QGraphicsScene
+        :type node: AbstractItem
+        """
+        if node.type() in self.items:
+            key = self.parentKey(node), node.type()
+            if not self.model.parentFor(key):
+                parent = QtGui.QStandardItem(self.parentKey(node))
+                parent.setIcon(self.iconFor(node))
+                self.model.addParent(key, parent)
+            child = QtGui.QStandardItem(self.childKey(diagram, node))
+            child.setData(node)
+            self.model.addChild(key, child)
+
+    def childFor(self, diagram, node):
         """
-        Search the item representing this node among parent children.
-        :type parent: QtGui.QStandardItem
+        Returns the item representing the given node, if any.
         :type diagram: Diagram
         :type node: AbstractNode
+        :rtype: QtGui.QStandardItem
         """
-        key = self.childKey(diagram, node)
-        for i in range(parent.rowCount()):
-            child = parent.child(i)
-            if child.text() == key:
-                return child
-        return None
+        return self.model.childFor((self.parentKey(node), node.type()), self.childKey(diagram, node))
 
     @staticmethod
     def childKey(diagram, node):
@@ -510,11 +535,7 @@ class OntologyExplorerWidget(QtWidgets.QWidget):
         :type node: AbstractNode
         :rtype: QtGui.QStandardItem
         """
-        for i in self.model.findItems(self.parentKey(node), QtCore.Qt.MatchExactly):
-            n = i.child(0).data()
-            if node.type() is n.type():
-                return i
-        return None
+        return self.model.parentFor((self.parentKey(node), node.type()))
 
     @staticmethod
     def parentKey(node):
@@ -525,6 +546,21 @@ class OntologyExplorerWidget(QtWidgets.QWidget):
         """
         return node.text().replace('\n', '')
 
+    def removeNode(self, diagram, node):
+        """
+        Remove a node from the tree view.
+        :type diagram: QGraphicsScene
+        :type node: AbstractItem
+        """
+        if node.type() in self.items:
+            self.model.removeChild((self.parentKey(node), node.type()), self.childKey(diagram, node))
+
+    def scheduleFilter(self):
+        """
+        Schedule the filter of the tree view to be applied again, coalescing consecutive requests.
+        """
+        self.filterTimer.start()
+
     def sizeHint(self):
         """
         Returns the recommended size for this widget.
@@ -551,7 +587,7 @@ class OntologyExplorerView(QtWidgets.QTreeView):
         self.setHorizontalScrollMode(QtWidgets.QTreeView.ScrollPerPixel)
         self.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAsNeeded)
         self.setSelectionMode(QtWidgets.QTreeView.SingleSelection)
-        self.setSortingEnabled(True)
+        self.setSortingEnabled(False)
         self.setWordWrap(True)
 
     #############################################
@@ -38,6 +38,7 @@ from PyQt5 import QtGui
 from PyQt5 import QtWidgets
 
 from eddy.core.functions.signals import connect, disconnect
+from eddy.core.items.common import Polygon
 from eddy.core.plugin import AbstractPlugin
 
 from eddy.ui.dock import DockWidget
@@ -72,14 +73,14 @@ class OverviewPlugin(AbstractPlugin):
         """
         Executed whenever the selection of the active diagram changes.
         """
-        self.widget('overview').redraw()
+        self.widget('overview').invalidateSelection()
 
     @QtCore.pyqtSlot()
     def onDiagramUpdated(self):
         """
         Executed whenever the active diagram is updated.
         """
-        self.widget('overview').redraw()
+        self.widget('overview').invalidateItems()
 
     @QtCore.pyqtSlot(QtWidgets.QMdiSubWindow)
     def onSubWindowActivated(self, subwindow):
@@ -189,7 +190,15 @@ class OverviewPlugin(AbstractPlugin):
 class OverviewWidget(QtWidgets.QGraphicsView):
     """
     This class is used to display the active diagram overview.
+    The diagram is rendered into an off-screen pixmap which is regenerated, at most once every
+    OverviewWidget.RefreshInterval msec, only for the regions invalidated since the last refresh:
+    selection changes invalidate the selected/deselected items, diagram updates invalidate the items
+    which were added, removed, moved, reshaped, repainted or relabelled. The whole pixmap is regenerated
+    only when the widget is resized or the diagram outline changes.
     """
+    Margin = 10
+    RefreshInterval = 250
+
     def __init__(self, plugin):
         """
         Initialize the Overview.
@@ -203,8 +212,18 @@ class OverviewWidget(QtWidgets.QGraphicsView):
         self.setOptimizationFlags(QtWidgets.QGraphicsView.DontSavePainterState)
         self.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
         self.setViewportUpdateMode(QtWidgets.QGraphicsView.NoViewportUpdate)
+        self._cache = None
+        self._dirty = QtGui.QRegion()
+        self._items = {}
+        self._itemsChanged = False
         self._mousePressed = False
+        self._rect = QtCore.QRectF()
+        self._selection = set()
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(OverviewWidget.RefreshInterval)
+        self._timer.setSingleShot(True)
         self._view = None
+        connect(self._timer.timeout, self.doRefresh)
 
     #############################################
     #   PROPERTIES
@@ -220,6 +239,20 @@ class OverviewWidget(QtWidgets.QGraphicsView):
             return self._view.scene()
         return None
 
+    #############################################
+    #   SLOTS
+    #################################
+
+    @QtCore.pyqtSlot()
+    def doRefresh(self):
+        """
+        Regenerate the dirty regions of the overview cache and repaint the widget.
+        """
+        self._timer.stop()
+        self.updateCache()
+        viewport = self.viewport()
+        viewport.update()
+
     #############################################
     #   EVENTS
     #################################
@@ -259,6 +292,18 @@ class OverviewWidget(QtWidgets.QGraphicsView):
             if self._view:
                 self._mousePressed = False
 
+    def paintEvent(self, paintEvent):
+        """
+        Paint the cached diagram overview, rather than the diagram scene itself.
+        :type paintEvent: QPaintEvent
+        """
+        if self._view and self._cache is None:
+            self.updateCache()
+        if self._cache is not None:
+            painter = QtGui.QPainter(self.viewport())
+            painter.drawPixmap(0, 0, self._cache)
+            painter.end()
+
     def wheelEvent(self, wheelEvent):
         """
         Turn off wheel event since we don't need to scroll anything.
@@ -270,23 +315,93 @@ class OverviewWidget(QtWidgets.QGraphicsView):
     #   INTERFACE
     #################################
 
+    def invalidate(self, rect=None):
+        """
+        Mark the given scene rect (or the whole diagram if no rect is given) to be regenerated upon the next refresh.
+        :type rect: QRectF
+        """
+        if self._cache is not None:
+            if rect is None:
+                self._dirty = QtGui.QRegion(self.viewport().rect())
+            else:
+                self._dirty = self._dirty.united(self.regionOf(rect))
+            self.refresh()
+
+    def invalidateItems(self):
+        """
+        Mark the items which changed since the last refresh to be regenerated upon the next refresh.
+        Changed items are detected upon refresh, by comparing the state of the items of the diagram
+        with the one they had the last time the overview cache has been regenerated.
+        """
+        if self._cache is not None:
+            self._itemsChanged = True
+            self.refresh()
+
+    def invalidateSelection(self):
+        """
+        Mark the items whose selection changed since the last call to be regenerated upon the next refresh.
+        """
+        selection = set(self.diagram.selectedItems()) if self._view else set()
+        for item in selection.symmetric_difference(self._selection):
+            self.invalidate(item.sceneBoundingRect())
+        self._selection = selection
+
     def redraw(self):
         """
-        Redraw the diagram within the overview.
+        Discard the overview cache and redraw the whole diagram within the overview.
         """
-        if self._view:
-            polygon = self.diagram.visibleRect(margin=10)
-            if polygon:
-                self.fitInView(polygon, QtCore.Qt.KeepAspectRatio)
+        self._cache = None
+        self._dirty = QtGui.QRegion()
+        self._items = {}
+        self._itemsChanged = False
+        self._timer.stop()
         viewport = self.viewport()
         viewport.update()
 
+    def refresh(self):
+        """
+        Schedule the regeneration of the overview cache, unless one is already pending.
+        """
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def regionOf(self, rect):
+        """
+        Returns the region of the overview cache covered by the given scene rect.
+        :type rect: QRectF
+        :rtype: QRect
+        """
+        return self.mapFromScene(rect).boundingRect().adjusted(-2, -2, 2, 2)
+
     def setView(self, view):
         """
         Sets the widget to inspect the given Diagram view.
         :type: view: DiagramView
         """
         self._view = view
+        self._selection = set(self.diagram.selectedItems()) if self._view else set()
+        self.redraw()
+
+    def snapshot(self):
+        """
+        Returns the state of the items of the inspected diagram, as relevant to the overview.
+        :rtype: dict
+        """
+        return {item: self.stateOf(item) for item in self.diagram.items(labels=True)}
+
+    @staticmethod
+    def stateOf(item):
+        """
+        Returns the state of the given item as relevant to the overview: its bounding rect, its visibility,
+        and either its text (for labels) or the geometry, brush and pen of the shapes it is painted with.
+        :type item: AbstractItem
+        :rtype: tuple
+        """
+        if item.isLabel():
+            return item.sceneBoundingRect(), item.isVisible(), item.text()
+        return (item.sceneBoundingRect(), item.isVisible()) + tuple(
+            (type(x.geometry())(x.geometry()), QtGui.QBrush(x.brush()), QtGui.QPen(x.pen()))
+            for x in vars(item).values() if isinstance(x, Polygon))
 
     def sizeHint(self):
         """
@@ -294,10 +409,55 @@ class OverviewWidget(QtWidgets.QGraphicsView):
         :rtype: QtCore.QSize
         """
         return QtCore.QSize(216, 216)
-    
+
+    def updateCache(self):
+        """
+        Regenerate the dirty regions of the overview cache.
+        The whole cache is regenerated if the widget is resized or the diagram outline changes.
+        """
+        if not self._view:
+            self._cache = None
+            self._dirty = QtGui.QRegion()
+            self._items = {}
+            self._itemsChanged = False
+            return
+
+        viewport = self.viewport()
+        bounds = self.diagram.itemsBoundingRect()
+        rect = bounds.adjusted(-OverviewWidget.Margin, -OverviewWidget.Margin, OverviewWidget.Margin, OverviewWidget.Margin)
+        ratio = self.devicePixelRatioF()
+        if self._cache is None or self._cache.size() != viewport.size() * ratio or self._rect != rect:
+            if not bounds.isNull():
+                self.fitInView(rect, QtCore.Qt.KeepAspectRatio)
+            self._cache = QtGui.QPixmap(viewport.size() * ratio)
+            self._cache.setDevicePixelRatio(ratio)
+            self._cache.fill(QtCore.Qt.white)
+            self._dirty = QtGui.QRegion(viewport.rect())
+            self._items = self.snapshot()
+            self._itemsChanged = False
+            self._rect = rect
+        elif self._itemsChanged:
+            items = self.snapshot()
+            for item in items.keys() | self._items.keys():
+                state1, state2 = self._items.get(item), items.get(item)
+                if state1 != state2:
+                    for state in (state1, state2):
+                        if state is not None:
+                            self._dirty = self._dirty.united(self.regionOf(state[0]))
+            self._items = items
+            self._itemsChanged = False
+
+        if not self._dirty.isEmpty():
+            painter = QtGui.QPainter(self._cache)
+            for region in self._dirty.rects():
+                painter.setClipRect(region)
+                self.render(painter, QtCore.QRectF(region), region, QtCore.Qt.IgnoreAspectRatio)
+            painter.end()
+            self._dirty = QtGui.QRegion()
+
     def view(self):
         """
         Returns the reference to the view currently inspected by this widget.
         :rtype: DiagramView 
         """
-        return self._view
\ No newline at end of file
+        return self._view
@@ -46,6 +46,7 @@ from eddy.core.functions.signals import connect, disconnect
 from eddy.core.output import getLogger
 from eddy.core.plugin import AbstractPlugin
 from eddy.ui.dock import DockWidget
+from eddy.ui.explorer import ExplorerItemModel
 from eddy.ui.fields import StringField
 
 LOGGER = getLogger()
@@ -56,7 +57,7 @@ class UnsatisfiableEntityExplorerPlugin(AbstractPlugin):
     This plugin provides the UnsatisfiableEntitiesExplorer widget.
     """
     sgnFakeItemAdded = QtCore.pyqtSignal('QGraphicsScene', 'QGraphicsItem')
-    sgnFakeExplanationAdded = QtCore.pyqtSignal('QGraphicsItem', list)
+    sgnFakeExplanationAdded = QtCore.pyqtSignal('QGraphicsItem', str)
 
     def checkmatchforOWLtermandnodename(self, OWL_term_1, OWL_term_2):
         # it should not be a complement of a class; i.e. the raw term should start with <
@@ -95,7 +96,7 @@ class UnsatisfiableEntityExplorerPlugin(AbstractPlugin):
             # OWL_term_for_uc = uc
             temp = []
 
-            for p in self.project.nodes():
+            for p in self.project.getnodesforOWLterm(ue):
                 OWL_term_for_p = self.project.getOWLtermfornode(p)
                 match = self.checkmatchforOWLtermandnodename(ue, OWL_term_for_p)
 
@@ -116,17 +117,18 @@ class UnsatisfiableEntityExplorerPlugin(AbstractPlugin):
             for node in entity:
                 self.sgnFakeItemAdded.emit(node.diagram, node)
 
+            # EXPLANATIONS ARE COMPUTED ON DEMAND: THE LINK CARRIES THE UNSATISFIABLE ENTITY
             if inp_type == 'unsatisfiable_classes':
-                explanation_for_node = self.project.explanations_for_unsatisfiable_classes[count]
+                unsatisfiable_entity = self.project.unsatisfiable_classes[count]
             elif inp_type == 'unsatisfiable_attributes':
-                explanation_for_node = self.project.explanations_for_unsatisfiable_attributes[count]
+                unsatisfiable_entity = self.project.unsatisfiable_attributes[count]
             elif inp_type == 'unsatisfiable_roles':
-                explanation_for_node = self.project.explanations_for_unsatisfiable_roles[count]
+                unsatisfiable_entity = self.project.unsatisfiable_roles[count]
             else:
                 LOGGER.error('invalid inp_type in module add_unsatisfiable_nodes_in_widget')
 
             if len(entity) > 0:
-                self.sgnFakeExplanationAdded.emit(entity[0], explanation_for_node)
+                self.sgnFakeExplanationAdded.emit(entity[0], unsatisfiable_entity)
 
             count = count + 1
 
@@ -179,8 +181,8 @@ class UnsatisfiableEntityExplorerPlugin(AbstractPlugin):
         """
         # CONNECT TO PROJECT SPECIFIC SIGNALS
         widget = self.widget('unsatisfiable_entity_explorer')
-        connect(self.project.sgnItemAdded, widget.doAddNode)
-        connect(self.project.sgnItemRemoved, widget.doRemoveNode)
+        connect(self.project.sgnItemsAdded, widget.doAddNodes)
+        connect(self.project.sgnItemsRemoved, widget.doRemoveNodes)
 
         # FILL IN UNSATISFIABLE ENTITIES EXPLORER WITH DATA
         connect(self.sgnFakeItemAdded, widget.doAddNode)
@@ -233,8 +235,8 @@ class UnsatisfiableEntityExplorerPlugin(AbstractPlugin):
         # DISCONNECT FROM CURRENT PROJECT
         widget = self.widget('unsatisfiable_entity_explorer')
         self.debug('Disconnecting from project: %s', self.project.name)
-        disconnect(self.project.sgnItemAdded, widget.doAddNode)
-        disconnect(self.project.sgnItemRemoved, widget.doRemoveNode)
+        disconnect(self.project.sgnItemsAdded, widget.doAddNodes)
+        disconnect(self.project.sgnItemsRemoved, widget.doRemoveNodes)
 
         # DISCONNECT FROM ACTIVE SESSION
         self.debug('Disconnecting from active session')
@@ -332,7 +334,7 @@ class UnsatisfiableEntityExplorerWidget(QtWidgets.QWidget):
         self.search.setClearButtonEnabled(True)
         self.search.setPlaceholderText('Search...')
         self.search.setFixedHeight(30)
-        self.model = QtGui.QStandardItemModel(self)
+        self.model = ExplorerItemModel(self)
         self.proxy = QtCore.QSortFilterProxyModel(self)
         self.proxy.setDynamicSortFilter(False)
         self.proxy.setFilterCaseSensitivity(QtCore.Qt.CaseInsensitive)
@@ -417,9 +419,9 @@ class UnsatisfiableEntityExplorerWidget(QtWidgets.QWidget):
     #   SLOTS
     #################################
 
-    @QtCore.pyqtSlot('QGraphicsItem', list)
+    @QtCore.pyqtSlot('QGraphicsItem', str)
     def doAddExplanation(self, node, explanation):
-        if explanation is not None and len(explanation) > 0:
+        if explanation:
             exp_to_add = QtGui.QStandardItem()
             exp_to_add.setText('<Explanation(s)> \n**(click to open Explanation Explorer)')
             font = QtGui.QFont()
@@ -446,17 +448,14 @@ class UnsatisfiableEntityExplorerWidget(QtWidgets.QWidget):
 
         if (node in self.project.nodes_of_unsatisfiable_entities) or ((owl_term_for_node is not None) and (
                 owl_term_for_node in self.project.nodes_of_unsatisfiable_entities)):
-            parent = self.parentFor(node)
-            if not parent:
+            if not self.parentFor(node):
                 parent = QtGui.QStandardItem(self.parentKey(node))
                 parent.setIcon(self.iconFor(node))
                 parent.setData(node)
-                self.model.appendRow(parent)
-                self.proxy.sort(0, QtCore.Qt.AscendingOrder)
+                self.model.addParent(self.parentKey(node), parent)
             child = QtGui.QStandardItem(self.childKey(diagram, node))
             child.setData(node)
-            parent.appendRow(child)
-            self.proxy.sort(0, QtCore.Qt.AscendingOrder)
+            self.model.addChild(self.parentKey(node), child)
 
             node.selection.setBrush(self.brush_orange)
             # node.updateNode(valid=False)
@@ -468,6 +467,16 @@ class UnsatisfiableEntityExplorerWidget(QtWidgets.QWidget):
             node.update(node.boundingRect())
             node.diagram.sgnUpdated.emit()
 
+    @QtCore.pyqtSlot('QGraphicsScene', list)
+    def doAddNodes(self, diagram, nodes):
+        """
+        Add a collection of nodes in the tree view.
+        :type diagram: QGraphicsScene
+        :type nodes: list
+        """
+        for node in nodes:
+            self.doAddNode(diagram, node)
+
     @QtCore.pyqtSlot('QStandardItem')
     def doStartExplanationExplorer(self, item):
         parent = item.parent()
@@ -491,7 +500,6 @@ class UnsatisfiableEntityExplorerWidget(QtWidgets.QWidget):
         :type key: str
         """
         self.proxy.setFilterFixedString(key)
-        self.proxy.sort(QtCore.Qt.AscendingOrder)
 
     @QtCore.pyqtSlot('QGraphicsScene', 'QGraphicsItem')
     def doRemoveNode(self, diagram, node):
@@ -503,13 +511,17 @@ class UnsatisfiableEntityExplorerWidget(QtWidgets.QWidget):
         if node.type() in {Item.ConceptNode, Item.RoleNode, Item.AttributeNode, Item.IndividualNode}:
             if node in self.project.nodes_of_unsatisfiable_entities:
                 self.project.nodes_of_unsatisfiable_entities.remove(node)
-            parent = self.parentFor(node)
-            if parent:
-                child = self.childFor(parent, diagram, node)
-                if child:
-                    parent.removeRow(child.index().row())
-                if not parent.rowCount():
-                    self.model.removeRow(parent.index().row())
+            self.model.removeChild(self.parentKey(node), self.childKey(diagram, node))
+
+    @QtCore.pyqtSlot('QGraphicsScene', list)
+    def doRemoveNodes(self, diagram, nodes):
+        """
+        Remove a collection of nodes from the tree view.
+        :type diagram: QGraphicsScene
+        :type nodes: list
+        """
+        for node in nodes:
+            self.doRemoveNode(diagram, node)
 
     @QtCore.pyqtSlot('QModelIndex')
     def onItemDoubleClicked(self, index):
@@ -550,19 +562,14 @@ class UnsatisfiableEntityExplorerWidget(QtWidgets.QWidget):
     #   INTERFACE
     #################################
 
-    def childFor(self, parent, diagram, node):
+    def childFor(self, diagram, node):
         """
-        Search the item representing this node among parent children.
-        :type parent: QtGui.QStandardItem
+        Returns the item representing the given node, if any.
         :type diagram: Diagram
         :type node: AbstractNode
+        :rtype: QtGui.QStandardItem
         """
-        key = self.childKey(diagram, node)
-        for i in range(parent.rowCount()):
-            child = parent.child(i)
-            if child.text() == key:
-                return child
-        return None
+        return self.model.childFor(self.parentKey(node), self.childKey(diagram, node))
 
     @staticmethod
     def childKey(diagram, node):
@@ -599,10 +606,7 @@ class UnsatisfiableEntityExplorerWidget(QtWidgets.QWidget):
         :type node: AbstractNode
         :rtype: QtGui.QStandardItem
         """
-        for i in self.model.findItems(self.parentKey(node), QtCore.Qt.MatchExactly):
-            if (i.text() == node.text()) or (i.text() == node.text().replace('\n', '')):
-                return i
-        return None
+        return self.model.parentFor(self.parentKey(node))
 
     @staticmethod
     def parentKey(node):
@@ -639,7 +643,7 @@ class UnsatisfiableEntityExplorerView(QtWidgets.QTreeView):
         self.setHorizontalScrollMode(QtWidgets.QTreeView.ScrollPerPixel)
         self.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAsNeeded)
         self.setSelectionMode(QtWidgets.QTreeView.SingleSelection)
-        self.setSortingEnabled(True)
+        self.setSortingEnabled(False)
         self.setWordWrap(True)
 
     #############################################
@@ -118,8 +118,8 @@ class OntologyConsistencyCheckDialog(QtWidgets.QDialog, HasThreadingSystem):
         self.sgnWork.emit()
         self.session.doResetConsistencyCheck(updateNodes=True, clearReasonerCache=True)
 
-        connect(self.project.sgnItemAdded, self.project.reset_changes_made_after_reasoning_task)
-        connect(self.project.sgnItemRemoved, self.project.reset_changes_made_after_reasoning_task)
+        connect(self.project.sgnItemsAdded, self.project.reset_changes_made_after_reasoning_task)
+        connect(self.project.sgnItemsRemoved, self.project.reset_changes_made_after_reasoning_task)
 
     #############################################
     #   INTERFACE
@@ -325,14 +325,14 @@ class OntologyConsistencyCheckWorker(AbstractWorker):
         self.accept()
 
     def fetch_axioms_and_set_variables(self, bottom_entity_node, java_class):
-        self.status_bar.showMessage('Ontology is inconsistent; Fetching explanations for the same')
-
+        # EXPLANATIONS ARE NOT COMPUTED HERE: EACH UNSATISFIABLE ENTITY IS REGISTERED IN THE REASONER
+        # SESSION, WHICH COMPUTES ITS EXPLANATIONS ON DEMAND WHEN THE ENTITY IS OPENED BY THE USER
         if java_class == self.OWLClass:
-            self.status_bar.showMessage('Fetching explanations for unsatisfiable class(es)')
+            self.status_bar.showMessage('Fetching unsatisfiable class(es)')
         elif java_class == self.OWLDataProperty:
-            self.status_bar.showMessage('Fetching explanations for unsatisfiable attribute(s)')
+            self.status_bar.showMessage('Fetching unsatisfiable attribute(s)')
         elif java_class == self.OWLObjectPropertyExpression:
-            self.status_bar.showMessage('Fetching explanations for unsatisfiable role(s)')
+            self.status_bar.showMessage('Fetching unsatisfiable role(s)')
         else:
             self.status_bar.showMessage('')
 
@@ -348,8 +348,6 @@ class OntologyConsistencyCheckWorker(AbstractWorker):
                 continue
 
             unsatisfiable_entities_string.append(unsatisfiable_entity.toString())
-            explanations_for_unsatisfiable_entity = []
-            axioms_of_explanations = []
 
             if java_class == self.OWLClass:
                 axiom_err = self.manager.getOWLDataFactory().getOWLSubClassOfAxiom(
@@ -368,20 +366,8 @@ class OntologyConsistencyCheckWorker(AbstractWorker):
                 raise RuntimeError('Invalid unsatisfiable entity {0}'.format(java_class))
 
             axiom_err_sc = axiom_err.getSubClass()
-            explanations_raw = self.generator_unsatisfiable_entities.getExplanations(axiom_err_sc)
-            explanations_raw_itr = explanations_raw.iterator()
-
-            while explanations_raw_itr.hasNext():
-                expl_raw = explanations_raw_itr.next()
-                explanations_for_unsatisfiable_entity.append(expl_raw)
-                axioms_of_expl = []
-                axioms_itr = expl_raw.iterator()
-
-                # get axioms for the explanation
-                while axioms_itr.hasNext():
-                    axiom_raw = axioms_itr.next()
-                    axioms_of_expl.append(axiom_raw.toString())
-                axioms_of_explanations.append(axioms_of_expl)
+            explanations_for_unsatisfiable_entity = self.project.reasoner_session.addEntity(
+                unsatisfiable_entity.toString(), axiom_err_sc)
             explanations_for_all_unsatisfiable_entities.append(explanations_for_unsatisfiable_entity)
 
         if java_class == self.OWLClass:
@@ -422,11 +408,13 @@ class OntologyConsistencyCheckWorker(AbstractWorker):
         self.project.ontology_OWL = ontology
 
         self.manager = self.OWLManager.createOWLOntologyManager()
-        configuration = self.Configuration()
 
         try:
-            hermit = self.Reasoner(configuration, ontology)
+            # REUSE THE REASONER OF THE PREVIOUS CHECK, APPLYING ONLY THE AXIOMS WHICH CHANGED SINCE THEN
+            hermit = self.project.reasoner_session.update(ontology, worker.axioms())
+            ontology = self.project.reasoner_session.ontology
         except Exception as e0:
+            self.project.reasoner_session.dispose()
             self.project.inconsistent_ontology = None
             LOGGER.error(str(e0))
             return
@@ -446,6 +434,16 @@ class OntologyConsistencyCheckWorker(AbstractWorker):
 
             self.generator_unsatisfiable_entities = self.DefaultExplanationGenerator(
                 self.manager, factory, ontology, hermit, progressMonitor)
+            # EXPLANATION GENERATORS ARE NOT THREAD SAFE: GIVE EACH COMPUTATION OF EXPLANATIONS ITS OWN ONE
+            # EXPLANATIONS ARE COMPUTED OVER A SNAPSHOT OF THE ONTOLOGY, WHICH THE NEXT CHECK NEVER MODIFIES:
+            # THIS WAY THREADS STILL COMPUTING EXPLANATIONS NEVER NEED TO BE WAITED FOR BEFORE RUNNING IT
+            DefaultExplanationGenerator = self.DefaultExplanationGenerator
+            OWLManager = self.OWLManager
+            ReasonerFactory = self.ReasonerFactory
+            snapshot = OWLManager.createOWLOntologyManager().createOntology(ontology.getAxioms())
+            self.project.reasoner_session.clearExplanations(
+                lambda monitor: DefaultExplanationGenerator(OWLManager.createOWLOntologyManager(), ReasonerFactory(),
+                                                            snapshot, monitor))
 
             # BottomClass
             bottom_class_node = hermit.getBottomClassNode()
@@ -475,11 +473,9 @@ class OntologyConsistencyCheckWorker(AbstractWorker):
                 except Exception as ex:
                     ex.printStackTrace()
             else:
+                self.project.reasoner_session.dispose()
                 self.project.inconsistent_ontology = None
                 LOGGER.error(str(e))
-        finally:
-            hermit.flush()
-            hermit.dispose()
 
     @QtCore.pyqtSlot()
     def run(self):
@@ -984,7 +984,7 @@ class WikiTagDialog(AbstractDialog):
         self.nodeKeys = set()
 
         # extract the list of nodes in the diagram
-        for node in [node for node in self.project.nodes() if node.type() in self.nodeTypes]:
+        for node in self.project.select(types=self.nodeTypes):
             if self.nodeKey(node) not in self.nodeKeys:
                 self.nodeKeys.add(self.nodeKey(node))
                 self.doAddNode(node)
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+from PyQt5 import QtGui
+
+
+class ExplorerItemModel(QtGui.QStandardItemModel):
+    """
+    Extends QStandardItemModel to hold the two-level trees displayed by the explorer widgets.
+    Top level items (parents) are indexed by a key chosen by the explorer, while their children are
+    indexed by their text: items are kept sorted by text, and can be looked up, inserted and removed
+    without scanning the model.
+    """
+    def __init__(self, parent=None):
+        """
+        Initialize the model.
+        :type parent: QObject
+        """
+        super().__init__(parent)
+        self.parents = {}
+        self.children = {}
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def addChild(self, key, child):
+        """
+        Add the given child to the parent identified by the given key, unless the parent already
+        has a child with the same text, in which case the existing child is returned.
+        :type key: object
+        :type child: QStandardItem
+        :rtype: QStandardItem
+        """
+        children = self.children[key]
+        if child.text() not in children:
+            parent = self.parents[key]
+            parent.insertRow(self.insertionRow(parent, child.text()), child)
+            children[child.text()] = child
+        return children[child.text()]
+
+    def addParent(self, key, parent):
+        """
+        Add the given top level item to the model, indexing it using the given key.
+        :type key: object
+        :type parent: QStandardItem
+        :rtype: QStandardItem
+        """
+        root = self.invisibleRootItem()
+        root.insertRow(self.insertionRow(root, parent.text()), parent)
+        self.parents[key] = parent
+        self.children[key] = {}
+        return parent
+
+    def childFor(self, key, text):
+        """
+        Returns the child with the given text of the parent identified by the given key.
+        :type key: object
+        :type text: str
+        :rtype: QStandardItem
+        """
+        return self.children.get(key, {}).get(text)
+
+    def clear(self):
+        """
+        Remove all the items from the model.
+        """
+        super().clear()
+        self.parents.clear()
+        self.children.clear()
+
+    @staticmethod
+    def insertionRow(parent, text):
+        """
+        Returns the row where a child with the given text should be inserted to keep the parent sorted.
+        :type parent: QStandardItem
+        :type text: str
+        :rtype: int
+        """
+        lo, hi = 0, parent.rowCount()
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if text < parent.child(mid).text():
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+    def parentFor(self, key):
+        """
+        Returns the top level item identified by the given key.
+        :type key: object
+        :rtype: QStandardItem
+        """
+        return self.parents.get(key)
+
+    def removeChild(self, key, text):
+        """
+        Remove the child with the given text from the parent identified by the given key.
+        The parent is removed too if it is left with no children.
+        :type key: object
+        :type text: str
+        """
+        parent = self.parents.get(key)
+        if parent:
+            child = self.children[key].pop(text, None)
+            if child:
+                parent.removeRow(child.row())
+            if not parent.rowCount():
+                self.removeParent(key)
+
+    def removeParent(self, key):
+        """
+        Remove the top level item identified by the given key, together with its children.
+        :type key: object
+        """
+        parent = self.parents.pop(key, None)
+        if parent:
+            del self.children[key]
+            self.removeRow(parent.row())